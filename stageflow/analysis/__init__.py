@@ -1,7 +1,8 @@
 """StageFlow process analysis module.
 
 Provides unified analysis capabilities for process definitions.
-Only the ProcessAnalyzer is exposed as the public API.
+ProcessAnalyzer is the public API; AnalysisCache memoizes per-stage results
+for incremental re-analysis.
 
 Usage:
     from stageflow.analysis import ProcessAnalyzer
@@ -11,5 +12,6 @@ Usage:
 """
 
 from .analyzer import ProcessAnalyzer
+from .cache import AnalysisCache
 
-__all__ = ["ProcessAnalyzer"]
+__all__ = ["AnalysisCache", "ProcessAnalyzer"]
@@ -55,12 +55,23 @@ class ProcessAnalyzer:
         # Phase 1: Graph analysis (process-wide)
         issues.extend(GraphAnalyzer(self._graph).get_issues())
 
-        # Phase 2: Stage analysis (per-stage)
+        # Phases 2 and 3: Stage and gate analysis
         for mutations in self._stage_mutations:
-            issues.extend(StageAnalyzer(mutations).get_issues())
+            issues.extend(self.analyze_stage(mutations))
 
-            # Phase 3: Gate analysis (per-gate within stage)
-            for gate_def in mutations.gates:
-                issues.extend(GateAnalyzer(gate_def, mutations.stage_id).get_issues())
+        return issues
+
+    @staticmethod
+    def analyze_stage(mutations: StageSchemaMutations) -> list[ConsistencyIssue]:
+        """Run the stage checks and the checks of each of its gates.
+
+        Args:
+            mutations: Schema mutations of a single stage
 
+        Returns:
+            Stage issues followed by gate issues, in gate order
+        """
+        issues = StageAnalyzer(mutations).get_issues()
+        for gate_def in mutations.gates:
+            issues.extend(GateAnalyzer(gate_def, mutations.stage_id).get_issues())
         return issues
@@ -0,0 +1,123 @@
+"""Cache of per-stage and per-gate analyzer results.
+
+Stage and gate checks only depend on the stage itself, so their results are
+cached by a fingerprint of the stage definition. Re-analyzing a process after
+an edit then only computes schema mutations and runs the checks for stages
+whose definition changed; graph checks always run but are linear in the size
+of the graph.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from stageflow.cache import CacheStats, LRUCache
+from stageflow.models import ConsistencyIssue, GateDefinition, StageSchemaMutations
+
+from .gate import GateAnalyzer
+from .stage import StageAnalyzer
+
+# (stage_id, is_transition_target, definition fingerprint)
+StageAnalysisKey = tuple[str, bool, str]
+
+
+def fingerprint(definition: Mapping[str, Any]) -> str:
+    """Stable content hash of a stage (or gate) definition."""
+    encoded = json.dumps(
+        definition, sort_keys=True, default=str, separators=(",", ":")
+    )
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+class AnalysisCache:
+    """
+    LRU cache of stage and gate issues, keyed by definition fingerprints.
+
+    A cache may be shared by several versions of the same process (e.g. by
+    ProcessEditor across rebuilds); entries never go stale because any change
+    to a stage definition changes its key.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of cached stages (and, separately, gates)
+        """
+        self._stages: LRUCache[StageAnalysisKey, tuple[ConsistencyIssue, ...]] = (
+            LRUCache(max_size=max_size)
+        )
+        self._gates: LRUCache[tuple, tuple[ConsistencyIssue, ...]] = LRUCache(
+            max_size=max_size
+        )
+
+    def stage_issues(
+        self,
+        key: StageAnalysisKey,
+        mutations: Callable[[], StageSchemaMutations],
+    ) -> list[ConsistencyIssue]:
+        """
+        Issues of one stage and its gates, computed only on a cache miss.
+
+        Args:
+            key: Stage id, transition-target flag and definition fingerprint
+            mutations: Builds the stage's schema mutations (called on a miss)
+
+        Returns:
+            Stage issues followed by gate issues, in gate order
+        """
+        cached = self._stages.get(key)
+        if cached is None:
+            stage_mutations = mutations()
+            issues = StageAnalyzer(stage_mutations).get_issues()
+            fingerprints = stage_mutations.lock_fingerprints
+            for index, gate_def in enumerate(stage_mutations.gates):
+                issues.extend(
+                    self.gate_issues(
+                        gate_def,
+                        stage_mutations.stage_id,
+                        fingerprints[index] if index < len(fingerprints) else None,
+                    )
+                )
+            cached = tuple(issues)
+            self._stages.put(key, cached)
+        return list(cached)
+
+    def gate_issues(
+        self,
+        gate: GateDefinition,
+        stage_id: str,
+        lock_fingerprints: tuple[tuple, ...] | None = None,
+    ) -> list[ConsistencyIssue]:
+        """Issues of a single gate, cached by the gate definition.
+
+        When the gate's lock fingerprints are given they form the key
+        directly; otherwise the raw definition is hashed.
+        """
+        key: tuple
+        if lock_fingerprints is not None:
+            key = (
+                stage_id,
+                gate.get("name"),
+                gate.get("target_stage"),
+                lock_fingerprints,
+            )
+        else:
+            key = (stage_id, fingerprint(gate))
+        cached = self._gates.get(key)
+        if cached is None:
+            cached = tuple(GateAnalyzer(gate, stage_id).get_issues())
+            self._gates.put(key, cached)
+        return list(cached)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss counters of the stage-level cache."""
+        return self._stages.stats
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._stages.clear()
+        self._gates.clear()
@@ -0,0 +1,352 @@
+"""Constraint solving over the locks of a gate.
+
+A gate passes only if all of its locks pass, so the locks reading the same
+property form a conjunction of constraints on that property's value. The
+solver folds them, in one pass over the gate's locks, into:
+
+- a finite set of allowed values (EQUALS, IN_LIST), filtered by every other
+  value check on the property, or otherwise
+- a numeric interval (GREATER_THAN, LESS_THAN, RANGE with metadata bounds)
+  plus excluded values (NOT_IN_LIST)
+
+From these it reports gates that can never pass, locks that are implied by
+the other locks of the gate (redundant, safe to skip once those passed) and
+facts implied by the gate (e.g. a property pinned to a single value).
+
+Only checks that depend on the value through ``==`` or ``float()`` are
+folded; TYPE_CHECK, REGEX, CONTAINS and LENGTH depend on the value's type or
+representation and are treated as opaque (they never cause a conflict nor
+become redundant, except as exact duplicates). OR_LOGIC groups are solved
+together with the gate's other locks; a CONDITIONAL lock is only reported
+when neither of its branches can pass.
+"""
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, TypeGuard
+
+from stageflow.lock import BaseLock, ConditionalLock, OrLogicLock, SimpleLock
+from stageflow.models import LockDefinitionDict, LockType
+
+# Lock types whose outcome only depends on the value through == or float()
+_VALUE_CHECKS = frozenset({
+    LockType.EXISTS,
+    LockType.NOT_EMPTY,
+    LockType.EQUALS,
+    LockType.IN_LIST,
+    LockType.NOT_IN_LIST,
+    LockType.GREATER_THAN,
+    LockType.LESS_THAN,
+    LockType.RANGE,
+})
+
+
+@dataclass(frozen=True)
+class GateConstraints:
+    """Outcome of solving the locks of one gate.
+
+    Attributes:
+        conflicts: Why the gate can never pass (empty if it can)
+        redundant: Indexes of locks implied by the gate's other locks on the
+            same property; such a lock passes whenever those locks pass
+        implied: Lock definitions the gate implies without stating them
+    """
+
+    conflicts: tuple[str, ...] = ()
+    redundant: frozenset[int] = frozenset()
+    implied: tuple[LockDefinitionDict, ...] = ()
+
+    @property
+    def satisfiable(self) -> bool:
+        """Whether some element can pass the gate."""
+        return not self.conflicts
+
+
+def _is_number(value: Any) -> TypeGuard[int | float]:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+def _folds(lock: SimpleLock) -> bool:
+    """Whether a lock takes part in constraint folding."""
+    if lock.lock_type not in _VALUE_CHECKS:
+        return False
+    if lock.lock_type == LockType.RANGE:
+        # Without metadata bounds RANGE doesn't check what it describes
+        return _is_number(lock.metadata.get("min_value")) and _is_number(
+            lock.metadata.get("max_value")
+        )
+    if lock.lock_type in (LockType.GREATER_THAN, LockType.LESS_THAN):
+        return _is_number(lock.expected_value)
+    if lock.lock_type in (LockType.IN_LIST, LockType.NOT_IN_LIST):
+        return isinstance(lock.expected_value, list | tuple | set)
+    return True
+
+
+def _bound_text(value: float, inclusive: bool, lower: bool) -> str:
+    op = (">=" if inclusive else ">") if lower else ("<=" if inclusive else "<")
+    return f"{op} {value:g}"
+
+
+class _PropertySolver:
+    """Conjunction of the value checks on a single property."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: list[tuple[int, SimpleLock]] = []
+
+    def add(self, index: int, lock: SimpleLock) -> None:
+        self.entries.append((index, lock))
+
+    def solve(self) -> tuple[str | None, set[int], list[LockDefinitionDict]]:
+        """Return (conflict, redundant lock indexes, implied definitions)."""
+        anchor = None
+        for index, lock in self.entries:
+            if lock.lock_type in (LockType.EQUALS, LockType.IN_LIST):
+                size = 1 if lock.lock_type == LockType.EQUALS else len(lock.expected_value)
+                if anchor is None or size < anchor[0]:
+                    anchor = (size, index, lock)
+        if anchor is not None:
+            return self._solve_values(anchor[1], anchor[2])
+        return self._solve_interval()
+
+    def _solve_values(
+        self, anchor_index: int, anchor: SimpleLock
+    ) -> tuple[str | None, set[int], list[LockDefinitionDict]]:
+        """Filter the anchor's allowed values through every other lock."""
+        if anchor.lock_type == LockType.EQUALS:
+            candidates = [anchor.expected_value]
+        else:
+            candidates = []
+            for value in anchor.expected_value:
+                if value not in candidates:
+                    candidates.append(value)
+
+        # For each candidate, the locks (other than the anchor) rejecting it
+        rejected_by: dict[int, list[int]] = {}
+        rejections = [0] * len(candidates)
+        for index, lock in self.entries:
+            if index == anchor_index:
+                continue
+            failing = [
+                position
+                for position, value in enumerate(candidates)
+                if not lock.accepts(value)
+            ]
+            rejected_by[index] = failing
+            for position in failing:
+                rejections[position] += 1
+
+        allowed = [
+            value for position, value in enumerate(candidates) if not rejections[position]
+        ]
+        if not allowed:
+            equals = [
+                lock.expected_value
+                for _, lock in self.entries
+                if lock.lock_type == LockType.EQUALS
+            ]
+            if len(equals) > 1:
+                unique = list(dict.fromkeys(str(value) for value in equals))
+                if len(unique) > 1:
+                    return (
+                        f"Property '{self.path}' must equal multiple different "
+                        f"values: {', '.join(unique)}",
+                        set(),
+                        [],
+                    )
+            return (
+                f"Property '{self.path}' has no value allowed by all of its locks",
+                set(),
+                [],
+            )
+
+        # A lock is redundant if every candidate it rejects is also rejected
+        # by a lock that is kept; dropping locks in order keeps this true
+        redundant: set[int] = set()
+        for index, _ in self.entries:
+            if index == anchor_index:
+                continue
+            failing = rejected_by[index]
+            if all(rejections[position] > 1 for position in failing):
+                redundant.add(index)
+                for position in failing:
+                    rejections[position] -= 1
+
+        implied: list[LockDefinitionDict] = []
+        stated_types = {lock.lock_type for _, lock in self.entries}
+        if len(allowed) == 1 and LockType.EQUALS not in stated_types:
+            implied.append({
+                "type": LockType.EQUALS,
+                "property_path": self.path,
+                "expected_value": allowed[0],
+            })
+        if LockType.EXISTS not in stated_types and all(
+            LockType.EXISTS.validate(value, {}) for value in allowed
+        ):
+            implied.append({
+                "type": LockType.EXISTS,
+                "property_path": self.path,
+                "expected_value": True,
+            })
+        return None, redundant, implied
+
+    def _solve_interval(self) -> tuple[str | None, set[int], list[LockDefinitionDict]]:
+        """Intersect numeric bounds; keep only the tightest bound locks."""
+        low, low_inclusive, low_index = -math.inf, False, None
+        high, high_inclusive, high_index = math.inf, False, None
+        excluded: list[Any] = []
+        seen: dict[tuple, int] = {}
+        redundant: set[int] = set()
+        bound_locks: list[int] = []
+
+        for index, lock in self.entries:
+            if lock.fingerprint in seen:
+                redundant.add(index)
+                continue
+            seen[lock.fingerprint] = index
+            lock_type = lock.lock_type
+            lower: tuple[float, bool] | None = None
+            upper: tuple[float, bool] | None = None
+            if lock_type == LockType.GREATER_THAN:
+                lower = (float(lock.expected_value), False)
+            elif lock_type == LockType.LESS_THAN:
+                upper = (float(lock.expected_value), False)
+            elif lock_type == LockType.RANGE:
+                min_value = lock.metadata.get("min_value")
+                max_value = lock.metadata.get("max_value")
+                if not (_is_number(min_value) and _is_number(max_value)):
+                    # Without numeric bounds RANGE takes no part in the interval
+                    continue
+                lower = (float(min_value), True)
+                upper = (float(max_value), True)
+            elif lock_type == LockType.NOT_IN_LIST:
+                excluded.extend(lock.expected_value)
+                continue
+            else:
+                continue
+
+            bound_locks.append(index)
+            # At equal values an exclusive bound is the tighter one
+            if lower is not None and (
+                lower[0] > low or (lower[0] == low and low_inclusive and not lower[1])
+            ):
+                low, low_inclusive, low_index = lower[0], lower[1], index
+            if upper is not None and (
+                upper[0] < high or (upper[0] == high and high_inclusive and not upper[1])
+            ):
+                high, high_inclusive, high_index = upper[0], upper[1], index
+
+        if low > high or (low == high and not (low_inclusive and high_inclusive)):
+            return (
+                f"Property '{self.path}' must be "
+                f"{_bound_text(low, low_inclusive, True)} AND "
+                f"{_bound_text(high, high_inclusive, False)} (impossible)",
+                set(),
+                [],
+            )
+        if low == high and any(value == low for value in excluded):
+            return (
+                f"Property '{self.path}' must be {low:g} but that value is excluded",
+                set(),
+                [],
+            )
+
+        redundant.update(
+            index for index in bound_locks if index not in (low_index, high_index)
+        )
+        return None, redundant, []
+
+
+def _satisfiable(locks: Sequence[BaseLock]) -> bool:
+    return not solve_locks(locks, find_redundant=False).conflicts
+
+
+def solve_locks(
+    locks: Sequence[BaseLock], find_redundant: bool = True
+) -> GateConstraints:
+    """
+    Solve the conjunction of a gate's locks.
+
+    Runs in time linear in the number of locks (times the size of the
+    smallest allowed-value list per property).
+
+    Args:
+        locks: The gate's locks, in order
+        find_redundant: Also compute redundant and implied locks
+
+    Returns:
+        GateConstraints for the gate
+    """
+    properties: dict[str, _PropertySolver] = {}
+    simple: list[BaseLock] = []
+    composite: list[tuple[int, BaseLock]] = []
+    duplicates: set[int] = set()
+    seen: set[tuple] = set()
+
+    for index, lock in enumerate(locks):
+        if isinstance(lock, SimpleLock):
+            simple.append(lock)
+            if _folds(lock):
+                solver = properties.get(lock.property_path)
+                if solver is None:
+                    solver = properties[lock.property_path] = _PropertySolver(
+                        lock.property_path
+                    )
+                solver.add(index, lock)
+                continue
+        elif isinstance(lock, OrLogicLock | ConditionalLock):
+            composite.append((index, lock))
+        # Opaque locks: only exact repeats can be dropped
+        if lock.fingerprint in seen:
+            duplicates.add(index)
+        seen.add(lock.fingerprint)
+
+    conflicts: list[str] = []
+    redundant: set[int] = set(duplicates)
+    implied: list[LockDefinitionDict] = []
+    for solver in properties.values():
+        conflict, property_redundant, property_implied = solver.solve()
+        if conflict:
+            conflicts.append(conflict)
+        elif find_redundant:
+            redundant.update(property_redundant)
+            implied.extend(property_implied)
+
+    if not conflicts:
+        for index, lock in composite:
+            if index in duplicates:
+                continue
+            conflict = _composite_conflict(lock, simple)
+            if conflict:
+                conflicts.append(conflict)
+
+    if conflicts or not find_redundant:
+        return GateConstraints(conflicts=tuple(conflicts))
+    return GateConstraints(
+        redundant=frozenset(redundant), implied=tuple(implied)
+    )
+
+
+def _composite_conflict(lock: BaseLock, simple: list[BaseLock]) -> str | None:
+    """Check a composite lock against the gate's simple locks."""
+    if isinstance(lock, OrLogicLock):
+        dead = [
+            number
+            for number, group in enumerate(lock.condition_groups, start=1)
+            if not _satisfiable(simple + group)
+        ]
+        if len(dead) == len(lock.condition_groups):
+            return "no OR_LOGIC path can pass together with the gate's other locks"
+        return None
+
+    if isinstance(lock, ConditionalLock):
+        # The IF condition is assumed to be able to fail, so the lock can only
+        # never pass if both its THEN and its ELSE branch can never pass
+        if not lock.else_locks:
+            return None
+        then_passes = _satisfiable(simple + lock.if_locks + lock.then_locks)
+        else_passes = _satisfiable(simple + lock.else_locks)
+        if not then_passes and not else_passes:
+            return "neither branch of a CONDITIONAL lock can pass"
+    return None
@@ -5,14 +5,16 @@ Handles single gate validation including:
 - Lock conflict detection
 """
 
+from stageflow.lock import BaseLock, LockFactory
 from stageflow.models import (
     ConsistencyIssue,
     GateDefinition,
     IssueSeverity,
-    LockType,
     ProcessIssueTypes,
 )
 
+from .constraints import solve_locks
+
 
 class GateAnalyzer:
     """Analyzes a single gate for issues.
@@ -70,68 +72,13 @@ class GateAnalyzer:
 
     def _detect_lock_conflicts(self, locks: list) -> list[str]:
         """Detect logical conflicts between locks."""
-        conflicts: list[str] = []
-
-        # Group locks by property
-        by_property: dict[str, list] = {}
+        gate_locks: list[BaseLock] = []
         for lock in locks:
             if not isinstance(lock, dict):
                 continue
-            prop = lock.get("property_path")
-            if prop:
-                if prop not in by_property:
-                    by_property[prop] = []
-                by_property[prop].append(lock)
-
-        # Check each property group
-        for prop, prop_locks in by_property.items():
-            conflict = self._detect_property_conflicts(prop, prop_locks)
-            if conflict:
-                conflicts.append(conflict)
-
-        return conflicts
-
-    def _detect_property_conflicts(self, prop: str, locks: list) -> str | None:
-        """Detect conflicts between locks on the same property."""
-        if len(locks) < 2:
-            return None
-
-        # Extract lock info
-        equals_values: list = []
-        gt_values: list[float] = []
-        lt_values: list[float] = []
-
-        for lock in locks:
-            lock_type = lock.get("type")
-            expected = lock.get("expected_value")
-
-            if lock_type == LockType.EQUALS.value or lock_type == "equals":
-                equals_values.append(expected)
-            elif lock_type in (LockType.GREATER_THAN.value, "greater_than") and isinstance(expected, (int, float)):
-                gt_values.append(expected)
-            elif lock_type in (LockType.LESS_THAN.value, "less_than") and isinstance(expected, (int, float)):
-                lt_values.append(expected)
-
-        # Check for multiple different EQUALS values
-        if len(equals_values) > 1:
-            unique = {str(v) for v in equals_values}
-            if len(unique) > 1:
-                return f"Property '{prop}' must equal multiple different values: {', '.join(unique)}"
-
-        # Check GREATER_THAN vs LESS_THAN conflicts
-        for gt in gt_values:
-            for lt in lt_values:
-                if gt >= lt:
-                    return f"Property '{prop}' must be > {gt} AND < {lt} (impossible)"
-
-        # Check EQUALS vs bounds conflicts
-        for eq in equals_values:
-            if isinstance(eq, (int, float)):
-                for gt in gt_values:
-                    if eq <= gt:
-                        return f"Property '{prop}' must equal {eq} AND be > {gt} (impossible)"
-                for lt in lt_values:
-                    if eq >= lt:
-                        return f"Property '{prop}' must equal {eq} AND be < {lt} (impossible)"
-
-        return None
+            try:
+                gate_locks.append(LockFactory.create(lock))
+            except ValueError:
+                # Malformed locks are reported by config validation
+                continue
+        return list(solve_locks(gate_locks, find_redundant=False).conflicts)
@@ -49,10 +49,11 @@ class GraphAnalyzer:
         """Identify non-final stages that cannot reach the final stage."""
         issues: list[ConsistencyIssue] = []
 
+        reaching_final = self.graph.reaching_final
         for stage_id in self.graph.stage_ids:
             if stage_id == self.graph.final_id:
                 continue
-            if not self.graph.has_path(stage_id, self.graph.final_id):
+            if stage_id not in reaching_final:
                 issues.append(ConsistencyIssue(
                     issue_type=ProcessIssueTypes.DEAD_END_STAGE,
                     description=f"Stage '{stage_id}' cannot reach final stage '{self.graph.final_id}'",
@@ -65,12 +66,14 @@ class GraphAnalyzer:
         """Identify stages that cannot be reached from the initial stage."""
         issues: list[ConsistencyIssue] = []
 
+        reachable = self.graph.reachable_from_initial
+        reaching_final = self.graph.reaching_final
         for stage_id in self.graph.stage_ids:
             if stage_id == self.graph.initial_id:
                 continue
-            if not self.graph.has_path(self.graph.initial_id, stage_id):
+            if stage_id not in reachable:
                 # Only report if it also can't reach final (orphaned)
-                if not self.graph.has_path(stage_id, self.graph.final_id):
+                if stage_id not in reaching_final:
                     issues.append(ConsistencyIssue(
                         issue_type=ProcessIssueTypes.UNREACHABLE_STAGE,
                         description=f"Stage '{stage_id}' is unreachable from initial stage '{self.graph.initial_id}'",
@@ -5,8 +5,7 @@ Handles single stage validation including:
 - Gate grouping analysis (duplicate targets, duplicate schemas)
 """
 
-import json
-
+from stageflow.lock import _canonical_value
 from stageflow.models import (
     ConsistencyIssue,
     IssueSeverity,
@@ -110,12 +109,16 @@ class StageAnalyzer:
         # Compare gate lock conditions (normalized to be order-independent)
         seen_conditions: dict[frozenset, str] = {}  # normalized locks → first gate_name
 
-        for gate in self.mutations.gates:
+        fingerprints = self.mutations.lock_fingerprints
+        for index, gate in enumerate(self.mutations.gates):
             gate_name = gate["name"]
-            locks = gate.get("locks", [])
 
-            # Normalize locks: extract key conditions and sort
-            normalized = self._normalize_locks(locks)
+            # Order-independent lock conditions: reuse the fingerprints the
+            # locks computed at construction, else normalize raw definitions
+            if index < len(fingerprints):
+                normalized = frozenset(fingerprints[index])
+            else:
+                normalized = self._normalize_locks(gate.get("locks", []))
 
             if normalized in seen_conditions:
                 other_name = seen_conditions[normalized]
@@ -150,5 +153,5 @@ class StageAnalyzer:
                     lock_type = str(lock.get("type", "")).upper()
                     prop = lock.get("property_path", "")
                     value = lock.get("expected_value")
-                    normalized.append((lock_type, prop, json.dumps(value, sort_keys=True) if value is not None else None))
+                    normalized.append((lock_type, prop, _canonical_value(value)))
         return frozenset(normalized)
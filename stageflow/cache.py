@@ -0,0 +1,160 @@
+"""Thread-safe LRU cache with optional TTL and hit/miss statistics."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters.
+
+    Fields:
+        hits: Lookups answered from the cache
+        misses: Lookups that found no (live) entry
+        evictions: Entries dropped to respect ``max_size``
+        expirations: Entries dropped because their TTL elapsed
+        size: Current number of entries
+        max_size: Configured capacity
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Least-recently-used cache with an optional time-to-live.
+
+    All operations are guarded by a lock so a cache can be shared between
+    threads. Expired entries are dropped lazily when they are looked up or
+    when space is needed.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept (must be positive)
+            ttl: Optional entry lifetime in seconds
+            clock: Monotonic time source (injectable for tests)
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive when provided")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Return the cached value for ``key`` and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return default
+
+            value, expires_at = entry
+            if self.ttl is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: K) -> V | None:
+        """Return the cached value for ``key`` without touching recency or counters."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self.ttl is not None and self._clock() >= entry[1]:
+                return None
+            return entry[0]
+
+    def put(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            expires_at = self._clock() + self.ttl if self.ttl is not None else 0.0
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self._entries[key] = (value, expires_at)
+
+            while len(self._entries) > self.max_size:
+                _, (_, oldest_expiry) = self._entries.popitem(last=False)
+                if self.ttl is not None and self._clock() >= oldest_expiry:
+                    self._expirations += 1
+                else:
+                    self._evictions += 1
+
+    def invalidate(self, key: K) -> bool:
+        """Drop a single entry. Returns True if it was present."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/eviction counters."""
+        with self._lock:
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current counters and size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_size=self.max_size,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)  # type: ignore[arg-type]
+            if entry is None:
+                return False
+            return self.ttl is None or self._clock() < entry[1]
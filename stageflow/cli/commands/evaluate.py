@@ -1,11 +1,14 @@
 """Evaluate command for assessing elements against processes."""
 
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, NoReturn
 
 import typer
 
-from stageflow.elements import Element
+from stageflow.cli.utils.context import CLIContext
+from stageflow.elements import Element, ElementStoreError, JsonlElementStore
+from stageflow.models import ProcessElementEvaluationResult
 from stageflow.process import Process
 
 
@@ -94,6 +97,27 @@ def evaluate_command(
             help="Show cumulative schema (all properties from previous stages)",
         ),
     ] = False,
+    jsonl: Annotated[
+        Path | None,
+        typer.Option(
+            "--jsonl",
+            help="Batch mode: evaluate every element of a JSON Lines file",
+        ),
+    ] = None,
+    id_path: Annotated[
+        str | None,
+        typer.Option(
+            "--id-path",
+            help="Property path used as element id in batch mode (e.g. 'order.id')",
+        ),
+    ] = None,
+    element_ids: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--id",
+            help="Only evaluate elements with this id in batch mode (repeatable, requires --id-path)",
+        ),
+    ] = None,
 ):
     """
     Evaluate an element against a process.
@@ -111,6 +135,10 @@ def evaluate_command(
     - Automatically shown when element has INCOMPLETE or BLOCKED status
     - Use --show-schema to always display schema hints
     - Use --cumulative-schema to show properties from all previous stages
+
+    Batch mode:
+    - Use --jsonl to evaluate every record of a JSON Lines file
+    - Combine --id-path with --id to evaluate only selected records
     """
     # Access CLI context
     cli_ctx = ctx.obj
@@ -122,6 +150,10 @@ def evaluate_command(
     # Load process using context (handles all error reporting and exits on failure)
     process = cli_ctx.load_process_or_exit(source)
 
+    if jsonl is not None:
+        _evaluate_jsonl_batch(cli_ctx, process, jsonl, stage, id_path, element_ids)
+        return
+
     # Load element using context (handles all error reporting and exits on failure)
     element_path = str(element) if element else None
     elem = cli_ctx.load_element_or_exit(element_path)
@@ -172,3 +204,71 @@ def evaluate_command(
 
             if schema_hint:
                 cli_ctx.printer.print(schema_hint)
+
+
+def _evaluate_records(
+    process: Process,
+    records: Iterable[tuple[str, Element]],
+    stage_override: str | None,
+) -> list[tuple[str, ProcessElementEvaluationResult | str]]:
+    """Evaluate (key, element) records one at a time, streamed from ``records``.
+
+    A record whose stage can't be resolved or whose evaluation fails is
+    reported as an error message for that record only.
+    """
+    results: list[tuple[str, ProcessElementEvaluationResult | str]] = []
+    for key, elem in records:
+        try:
+            stage_id, _ = get_element_stage(stage_override, process, elem)
+            results.append((key, process.evaluate(elem, stage_id)))
+        except ValueError as e:
+            results.append((key, str(e)))
+    return results
+
+
+def _evaluate_jsonl_batch(
+    cli_ctx: CLIContext,
+    process: Process,
+    jsonl: Path,
+    stage_override: str | None,
+    id_path: str | None,
+    element_ids: list[str] | None,
+) -> None:
+    """Evaluate the records of a JSONL file, reading only the selected ones.
+
+    Per-element stage or evaluation errors are reported alongside the other
+    results instead of aborting the whole batch.
+    """
+    json_output = cli_ctx.json_mode
+
+    def exit_with_error(message: str, cause: Exception | None = None) -> NoReturn:
+        if json_output:
+            cli_ctx.print_json(data={"error": message})
+        else:
+            cli_ctx.print_error(message)
+        raise typer.Exit(1) from cause
+
+    if element_ids and not id_path:
+        exit_with_error("--id requires --id-path")
+
+    try:
+        store = JsonlElementStore(jsonl, id_path=id_path)
+    except ElementStoreError as e:
+        exit_with_error(str(e), e)
+
+    with store:
+        if element_ids:
+            missing = [i for i in element_ids if i not in store]
+            if missing:
+                exit_with_error(f"Element id(s) not found: {', '.join(missing)}")
+            elements = zip(element_ids, store.select(element_ids), strict=True)
+        else:
+            elements = store.items()
+
+        cli_ctx.print_progress("Evaluating elements against process...")
+        try:
+            results = _evaluate_records(process, elements, stage_override)
+        except ElementStoreError as e:
+            exit_with_error(str(e), e)
+
+    cli_ctx.printer.print_batch_evaluation_results(process=process, results=results)
@@ -24,6 +24,22 @@ def list_processes(
     json_output: Annotated[
         bool, typer.Option("--json", help="Output in JSON format")
     ] = False,
+    workers: Annotated[
+        int | None,
+        typer.Option(
+            "--workers",
+            "-w",
+            min=1,
+            help="Number of parallel loaders (defaults to CPU count)",
+        ),
+    ] = None,
+    process_pool: Annotated[
+        bool,
+        typer.Option(
+            "--process-pool",
+            help="Load processes in worker processes instead of threads",
+        ),
+    ] = False,
 ):
     """List all processes in the registry."""
     # Access CLI context
@@ -39,43 +55,30 @@ def list_processes(
 
         processes = registry.list_processes()
 
-        # Build process details for all processes
-        loader = ProcessLoader()
-        process_details = []
-        for process_name in processes:
-            try:
-                process_file_path = registry.get_process_file_path(process_name)
-                if process_file_path:
-                    # Use ProcessLoader for consistent error handling
-                    result = loader.load(process_file_path)
-                    if result.success and result.process is not None:
-                        process = result.process
-                    else:
-                        # Process load failed - add error detail
-                        process_details.append(
-                            {
-                                "registry_name": process_name,
-                                "error": f"Failed to load: {result.get_error_summary()}",
-                                "valid": False,
-                            }
-                        )
-                        continue
-                else:
-                    process = registry.load_process(process_name)
-
-                description = ProcessFormatter.build_description(process)
+        # Load, validate and describe all processes concurrently
+        details_by_name: dict[str, dict] = {}
+        for outcome in registry.scan(
+            processes,
+            summarize=ProcessFormatter.build_description,
+            max_workers=workers,
+            use_processes=process_pool,
+        ):
+            if outcome.success:
                 # Create mutable dict with additional field
-                detail = dict(description)
-                detail["registry_name"] = process_name
-                process_details.append(detail)
-            except Exception as e:
-                process_details.append(
-                    {
-                        "registry_name": process_name,
-                        "error": f"Failed to load: {str(e)}",
-                        "valid": False,
-                    }
-                )
+                detail = dict(outcome.summary)
+                detail["registry_name"] = outcome.name
+            else:
+                detail = {
+                    "registry_name": outcome.name,
+                    "error": outcome.error,
+                    "valid": False,
+                }
+            details_by_name[outcome.name] = detail
+            cli_ctx.print_progress(
+                f"Loaded @{outcome.name} ({len(details_by_name)}/{len(processes)})"
+            )
+
+        process_details = [details_by_name[name] for name in processes]
 
         # Print registry list (handles JSON vs normal mode and formatting)
         cli_ctx.printer.print_registry_list(
@@ -157,6 +157,53 @@ class CliPrinter:
             formatted = EvaluationFormatter.format_evaluation_result(result, process)
             self.console.print(formatted)
 
+    def print_batch_evaluation_results(
+        self,
+        process: Process,
+        results: list[tuple[str, ProcessElementEvaluationResult | str]],
+        json_mode: bool | None = None,
+    ) -> None:
+        """Print batch evaluation results with mode detection.
+
+        Args:
+            process: Process instance
+            results: (element key, evaluation result or error message) pairs
+            json_mode: If True, output as JSON. If None, uses self.json_mode
+        """
+        json_mode = json_mode if json_mode is not None else self.json_mode
+
+        if json_mode:
+            entries: list[dict] = []
+            for key, result in results:
+                if isinstance(result, str):
+                    entries.append({"element": key, "error": result})
+                else:
+                    json_result = EvaluationFormatter.format_json_result(
+                        process, result
+                    )
+                    entries.append(
+                        {"element": key, "evaluation": json_result["evaluation"]}
+                    )
+            self.console.print_json(
+                data={
+                    "process": ProcessFormatter.build_description(process),
+                    "results": entries,
+                    "total_count": len(entries),
+                }
+            )
+            return
+
+        for key, result in results:
+            self.console.print(f"\n[bold]Element {key}[/bold]")
+            if isinstance(result, str):
+                self.console.print(f"[red]❌ {result}[/red]")
+            else:
+                formatted = EvaluationFormatter.format_evaluation_result(
+                    result, process
+                )
+                self.console.print(formatted)
+        self.console.print(f"\n[dim]Evaluated {len(results)} element(s)[/dim]")
+
     def show_progress(self, message: str) -> None:
         """Show progress message if verbose mode is enabled.
 
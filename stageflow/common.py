@@ -4,10 +4,13 @@ Common types and utilities for StageFlow.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
 from rich.repr import auto
 
+if TYPE_CHECKING:
+    from stageflow.models import Action, ActionType
+
 
 class ErrorType(Enum):
     PROCESS_VALIDATION = auto()
@@ -75,7 +78,7 @@ def sanitize_action_name(name: str) -> str:
 
 
 def generate_action_name(
-    action_type: "ActionType",  # type: ignore
+    action_type: "ActionType",
     gate_name: str | None = None,
     target_stage: str | None = None,
     property_path: str | None = None,
@@ -86,14 +89,15 @@ def generate_action_name(
     Naming conventions:
     - Configured actions: Use configured name directly
     - Transition actions: "transition_to_{target_stage}"
-    - Resolve validation: "resolve_{gate_name}"
+    - Resolve validation: "resolve_{gate_name}", or "fix_{property_path}"
+      for invalid stage fields
     - Provide data: "provide_{property_path}" (dots replaced with underscores)
 
     Args:
         action_type: Type of action
         gate_name: Gate name (for resolve_validation, transition)
         target_stage: Target stage (for transition)
-        property_path: Property path (for provide_data)
+        property_path: Property path (for provide_data, invalid fields)
         configured_name: Configured name from YAML (for execute_action)
 
     Returns:
@@ -121,6 +125,10 @@ def generate_action_name(
     if action_type == ActionType.RESOLVE_VALIDATION and gate_name:
         return f"resolve_{gate_name}"
 
+    if action_type == ActionType.RESOLVE_VALIDATION and property_path:
+        safe_path = property_path.replace(".", "_")
+        return f"fix_{safe_path}"
+
     if action_type == ActionType.PROVIDE_DATA and property_path:
         # Replace dots with underscores for nested paths
         safe_path = property_path.replace(".", "_")
@@ -157,13 +165,13 @@ def generate_action_id(
     return f"{index}:{stage_id}:{sanitized_name}"
 
 
-def ensure_unique_action_names(actions: list[dict]) -> list[dict]:
+def ensure_unique_action_names(actions: list["Action"]) -> list["Action"]:
     """Ensure all action names in a list are unique.
 
     If duplicates found, append numeric suffix to subsequent occurrences.
 
     Args:
-        actions: List of action dictionaries (mutable)
+        actions: List of actions (mutable)
 
     Returns:
         Same list with unique names (modified in place)
@@ -0,0 +1,189 @@
+"""Property path dependency index for incremental re-evaluation.
+
+Maps every element path read by a process to the stage fields, locks, gates
+and stages that depend on it, so a change to a handful of paths can be
+translated into the minimal set of checks that must be re-run.
+"""
+
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from stageflow.elements.element import FunctionCall
+
+if TYPE_CHECKING:
+    from stageflow.stage import Stage
+
+_PATH_SEPARATORS = re.compile(r"\.|\[")
+
+
+def path_tokens(path: str) -> tuple[str, ...]:
+    """
+    Normalize a property path into comparable segments.
+
+    Function syntax (``length(items)``) and trailing ``.length`` resolve to the
+    underlying collection, and segments stop at the first filter or wildcard
+    so that such paths conservatively cover the whole collection.
+
+    Examples:
+        user.profile.email → ("user", "profile", "email")
+        items[0].price → ("items", "0", "price")
+        length(items) → ("items",)
+        items[?id=='a'].done → ("items",)
+    """
+    function_call = FunctionCall.parse(path)
+    if function_call:
+        path = function_call.argument_path
+
+    tokens: list[str] = []
+    for part in _PATH_SEPARATORS.split(path):
+        part = part.rstrip("]").strip().strip("'\"")
+        if not part:
+            continue
+        if part.startswith("?") or part == "*":
+            break
+        tokens.append(part)
+
+    if len(tokens) > 1 and tokens[-1] == "length":
+        tokens.pop()
+    return tuple(tokens)
+
+
+def paths_overlap(first: str, second: str) -> bool:
+    """Check whether a change to one path can affect a read of the other.
+
+    Two paths overlap when one is a prefix of the other (a parent object and
+    any of its descendants).
+    """
+    a, b = path_tokens(first), path_tokens(second)
+    shorter, longer = (a, b) if len(a) <= len(b) else (b, a)
+    return longer[: len(shorter)] == shorter
+
+
+@dataclass(frozen=True)
+class PathDependencies:
+    """Dependents of one or more property paths.
+
+    Fields:
+        field_stages: Stage ids whose field checks read the path(s)
+        locks: (stage_id, gate_name, lock_index) of locks reading the path(s)
+        gates: (stage_id, gate_name) of gates containing such locks
+        stages: Stage ids whose evaluation reads the path(s)
+    """
+
+    field_stages: frozenset[str] = field(default_factory=frozenset)
+    locks: frozenset[tuple[str, str, int]] = field(default_factory=frozenset)
+    gates: frozenset[tuple[str, str]] = field(default_factory=frozenset)
+    stages: frozenset[str] = field(default_factory=frozenset)
+
+    def __bool__(self) -> bool:
+        return bool(self.stages)
+
+    def stale_locks(self, stage_id: str, gate_name: str) -> set[int]:
+        """Get indexes of affected locks within one gate."""
+        return {
+            index
+            for sid, gname, index in self.locks
+            if sid == stage_id and gname == gate_name
+        }
+
+
+class DependencyIndex:
+    """
+    Index from property path to the fields, locks, gates and stages reading it.
+
+    Built once from a process's stages; lookups with changed paths use
+    prefix matching so that replacing a parent object (``user``) affects all
+    reads beneath it (``user.email``) and vice versa.
+    """
+
+    def __init__(self, stages: Iterable["Stage"]):
+        """
+        Build the index.
+
+        Args:
+            stages: Stages of the process to index
+        """
+        field_stages: dict[str, set[str]] = {}
+        locks: dict[str, set[tuple[str, str, int]]] = {}
+
+        for stage in stages:
+            for path in stage.field_paths:
+                field_stages.setdefault(path, set()).add(stage._id)
+            for gate in stage.gates:
+                for index, paths in enumerate(gate.lock_paths):
+                    for path in paths:
+                        locks.setdefault(path, set()).add((stage._id, gate.name, index))
+
+        self._entries: dict[str, PathDependencies] = {}
+        for path in field_stages.keys() | locks.keys():
+            path_fields = field_stages.get(path, set())
+            path_locks = locks.get(path, set())
+            self._entries[path] = PathDependencies(
+                field_stages=frozenset(path_fields),
+                locks=frozenset(path_locks),
+                gates=frozenset((sid, gname) for sid, gname, _ in path_locks),
+                stages=frozenset(path_fields | {sid for sid, _, _ in path_locks}),
+            )
+
+        # Group indexed paths by their first segment for cheap overlap lookups;
+        # paths without segments overlap everything
+        self._by_root: dict[str, list[tuple[tuple[str, ...], str]]] = {}
+        self._unrooted: list[str] = []
+        for path in self._entries:
+            tokens = path_tokens(path)
+            if tokens:
+                self._by_root.setdefault(tokens[0], []).append((tokens, path))
+            else:
+                self._unrooted.append(path)
+
+    @property
+    def paths(self) -> list[str]:
+        """All indexed property paths."""
+        return sorted(self._entries)
+
+    def dependents(self, path: str) -> PathDependencies:
+        """Get the direct dependents of an exact indexed path."""
+        return self._entries.get(path, PathDependencies())
+
+    def affected(self, changed_paths: Iterable[str]) -> PathDependencies:
+        """
+        Get everything that reads any of the changed paths or their relatives.
+
+        Args:
+            changed_paths: Paths modified in the element
+
+        Returns:
+            Union of dependents of every overlapping indexed path
+        """
+        matched: set[str] = set()
+        for changed in changed_paths:
+            tokens = path_tokens(changed)
+            if not tokens:
+                # Whole-element change
+                matched.update(self._entries)
+                break
+            matched.update(self._unrooted)
+            for indexed_tokens, path in self._by_root.get(tokens[0], []):
+                n = min(len(tokens), len(indexed_tokens))
+                if tokens[:n] == indexed_tokens[:n]:
+                    matched.add(path)
+
+        field_stages: set[str] = set()
+        locks: set[tuple[str, str, int]] = set()
+        gates: set[tuple[str, str]] = set()
+        stages: set[str] = set()
+        for path in matched:
+            entry = self._entries[path]
+            field_stages |= entry.field_stages
+            locks |= entry.locks
+            gates |= entry.gates
+            stages |= entry.stages
+
+        return PathDependencies(
+            field_stages=frozenset(field_stages),
+            locks=frozenset(locks),
+            gates=frozenset(gates),
+            stages=frozenset(stages),
+        )
@@ -4,6 +4,7 @@ Elements module for StageFlow - Element and Element Schema functionality.
 This module provides:
 - Element class and factory functions for data access
 - Element schema generation (JSON Schema) from Process definitions
+- Memory-mapped JSONL element stores for batch evaluation
 
 Separation of concerns:
 - stageflow.schema: Process schema loading
@@ -11,6 +12,7 @@ Separation of concerns:
 """
 
 from stageflow.elements.element import (
+    CachedElement,
     DictElement,
     Element,
     ElementConfig,
@@ -22,11 +24,13 @@ from stageflow.elements.schema import (
     RequiredFieldAnalyzer,
     SchemaGenerator,
 )
+from stageflow.elements.store import ElementStoreError, JsonlElementStore
 
 __all__ = [
     # Element classes and types
     "Element",
     "DictElement",
+    "CachedElement",
     "ElementConfig",
     "ElementDataConfig",
     # Element factory functions
@@ -35,4 +39,7 @@ __all__ = [
     # Element schema generation
     "SchemaGenerator",
     "RequiredFieldAnalyzer",
+    # Element stores
+    "JsonlElementStore",
+    "ElementStoreError",
 ]
@@ -1,9 +1,12 @@
 """Element interface and implementations for StageFlow."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Literal, Optional, TypedDict
+from typing import Any, Literal, Optional, TypedDict, TypeVar
+
+T = TypeVar("T")
 
 
 class ElementConfig(TypedDict):
@@ -250,6 +253,64 @@ class Element(ABC):
         pass
 
 
+class CachedElement(Element):
+    """
+    Element wrapper that memoizes property reads for one evaluation pass.
+
+    Used when many stages read the same element (e.g. Process.locate), so
+    each path is resolved once no matter how many fields and locks read it.
+    ``memoize`` lets callers share other per-element results, such as the
+    outcome of a lock instance used by several gates. The wrapped element
+    must not change while the wrapper is in use.
+    """
+
+    def __init__(self, element: Element):
+        """
+        Initialize the wrapper.
+
+        Args:
+            element: Element to read through
+        """
+        self.element = element
+        self._values: dict[str, Any] = {}
+        self._present: dict[str, bool] = {}
+        self._memo: dict[Hashable, Any] = {}
+
+    def get_property(self, path: str) -> Any:
+        try:
+            return self._values[path]
+        except KeyError:
+            value = self._values[path] = self.element.get_property(path)
+            return value
+
+    def has_property(self, path: str) -> bool:
+        try:
+            return self._present[path]
+        except KeyError:
+            present = self._present[path] = self.element.has_property(path)
+            return present
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.element.to_dict()
+
+    def memoize(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Return the value stored under key, computing it on first use.
+
+        Args:
+            key: Cache key, unique to the kind of value being cached
+            compute: Produces the value on a miss
+
+        Returns:
+            The cached or newly computed value
+        """
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._memo[key] = compute()
+            return value
+
+
 class DictElement(Element):
     """
     Dictionary-based element implementation.
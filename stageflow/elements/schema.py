@@ -1,5 +1,6 @@
 """JSON Schema generator from StageFlow process definitions."""
 
+import copy
 import json
 from collections import deque
 from typing import Any
@@ -108,6 +109,8 @@ class SchemaGenerator:
         """
         self.process = process
         self.analyzer = RequiredFieldAnalyzer()
+        # (process version, {stage_id: cumulative JSON Schema})
+        self._cumulative_cache: tuple[int, dict[str, dict[str, Any]]] | None = None
 
     def generate_cumulative_schema(self, target_stage: str) -> dict[str, Any]:
         """Generate cumulative schema from initial stage to target stage.
@@ -144,6 +147,64 @@ class SchemaGenerator:
             stage_name=target_stage,
         )
 
+    def generate_all_cumulative_schemas(self) -> dict[str, dict[str, Any]]:
+        """Generate the cumulative schema of every reachable stage at once.
+
+        Equivalent to calling generate_cumulative_schema() with each stage ID,
+        but runs a single BFS from the initial stage: every stage's merged
+        properties and required fields extend those of its parent in the
+        shortest-path tree, so shared path prefixes are merged once. Results
+        are cached until the process is mutated.
+
+        Returns:
+            Dict mapping stage ID to its cumulative JSON Schema. Stages not
+            reachable from the initial stage are omitted.
+        """
+        version = self.process.version
+        if self._cumulative_cache is None or self._cumulative_cache[0] != version:
+            self._cumulative_cache = (version, self._build_cumulative_schemas())
+        return copy.deepcopy(self._cumulative_cache[1])
+
+    def _build_cumulative_schemas(self) -> dict[str, dict[str, Any]]:
+        """Build all cumulative schemas in one traversal of the stage graph."""
+        stages = {stage._id: stage for stage in self.process.stages}
+        initial_id = self.process.initial_stage._id
+
+        # Per-stage merged properties and required fields along the BFS tree;
+        # a child copies its parent's entry and applies its own stage on top
+        merged: dict[str, dict[str, StageObjectPropertyDefinition]] = {}
+        required: dict[str, set[str]] = {}
+
+        def extend(stage_id: str, parent_id: str | None) -> None:
+            stage = stages[stage_id]
+            properties = dict(merged[parent_id]) if parent_id is not None else {}
+            properties.update(stage.get_schema() or {})
+            fields = set(required[parent_id]) if parent_id is not None else set()
+            fields.update(self.analyzer.analyze_stage(stage))
+            merged[stage_id] = properties
+            required[stage_id] = fields
+
+        # Same visiting order as _get_stage_path, so paths are identical
+        extend(initial_id, None)
+        queue = deque([initial_id])
+        while queue:
+            current_id = queue.popleft()
+            for gate in stages[current_id].gates:
+                next_id = gate.target_stage
+                if next_id not in merged and next_id in stages:
+                    extend(next_id, current_id)
+                    queue.append(next_id)
+
+        return {
+            stage_id: self._to_json_schema(
+                merged[stage_id],
+                required[stage_id],
+                title=f"{self.process.name} - {stage_id} (Cumulative)",
+                stage_name=stage_id,
+            )
+            for stage_id in merged
+        }
+
     def generate_stage_schema(self, target_stage: str) -> dict[str, Any]:
         """Generate schema for specific stage only.
 
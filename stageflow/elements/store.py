@@ -0,0 +1,281 @@
+"""Memory-mapped JSON Lines element store for StageFlow."""
+
+import json
+import mmap
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from stageflow.elements.element import DictElement, Element
+
+INDEX_FORMAT_VERSION = 1
+INDEX_SUFFIX = ".idx"
+
+
+class ElementStoreError(Exception):
+    """Raised when a JSONL element store cannot be opened or read."""
+
+    pass
+
+
+class JsonlElementStore:
+    """
+    Read-only element store backed by a memory-mapped JSON Lines file.
+
+    The store keeps a byte-offset index of every non-empty line so individual
+    records can be decoded on demand without reading the whole corpus. When an
+    ``id_path`` is given, the index also maps each record's id (resolved with
+    the same path syntax as ``Element.get_property``) to its line position,
+    enabling direct lookups and filtered iteration.
+
+    The index is persisted next to the data file (``<file>.idx``) and reused
+    as long as the data file's size and modification time are unchanged.
+
+    Example:
+        >>> with JsonlElementStore("orders.jsonl", id_path="order.id") as store:
+        ...     results = process.evaluate_batch(store.select(["A-1", "A-7"]))
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        id_path: str | None = None,
+        index_path: str | Path | None = None,
+        persist_index: bool = True,
+    ):
+        """
+        Open a JSONL file and load or build its offset index.
+
+        Args:
+            path: Path to the JSON Lines file
+            id_path: Optional property path used to key records by id
+            index_path: Optional sidecar index location (default: ``<path>.idx``)
+            persist_index: Whether to write a rebuilt index back to disk
+
+        Raises:
+            ElementStoreError: If the file cannot be opened or indexed
+        """
+        self.path = Path(path)
+        self.id_path = id_path
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.path.with_name(self.path.name + INDEX_SUFFIX)
+        )
+        self._persist_index = persist_index
+        self._offsets: list[int] = []
+        self._ids: dict[str, int] = {}
+        self._mm: mmap.mmap | None = None
+
+        try:
+            self._file = self.path.open("rb")
+        except OSError as e:
+            raise ElementStoreError(f"Cannot open element file '{path}': {e}") from e
+
+        try:
+            stat = os.fstat(self._file.fileno())
+            self._size = stat.st_size
+            self._mtime_ns = stat.st_mtime_ns
+            if self._size > 0:
+                self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if not self._load_index():
+                self._build_index()
+                if self._persist_index:
+                    self._write_index()
+        except Exception:
+            self.close()
+            raise
+
+    # Index management
+    def _load_index(self) -> bool:
+        """Load the sidecar index if it matches the current data file."""
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if not isinstance(data, dict):
+            return False
+        if (
+            data.get("version") != INDEX_FORMAT_VERSION
+            or data.get("size") != self._size
+            or data.get("mtime_ns") != self._mtime_ns
+            or data.get("id_path") != self.id_path
+        ):
+            return False
+
+        offsets = data.get("offsets")
+        ids = data.get("ids")
+        if not isinstance(offsets, list) or not isinstance(ids, dict):
+            return False
+
+        self._offsets = offsets
+        self._ids = ids
+        return True
+
+    def _build_index(self) -> None:
+        """Scan the mapped file once, recording the start offset of each record."""
+        self._offsets = []
+        self._ids = {}
+        if self._mm is None:
+            return
+
+        mm = self._mm
+        position = 0
+        while position < self._size:
+            end = mm.find(b"\n", position)
+            if end == -1:
+                end = self._size
+            if mm[position:end].strip():
+                line = len(self._offsets)
+                self._offsets.append(position)
+                if self.id_path is not None:
+                    element_id = self._resolve_id(self._read_element(line))
+                    if element_id is not None:
+                        self._ids.setdefault(element_id, line)
+            position = end + 1
+
+    def _write_index(self) -> None:
+        """Persist the index; failures are ignored since the index is a cache."""
+        data = {
+            "version": INDEX_FORMAT_VERSION,
+            "size": self._size,
+            "mtime_ns": self._mtime_ns,
+            "id_path": self.id_path,
+            "offsets": self._offsets,
+            "ids": self._ids,
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with tmp_path.open("w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def _resolve_id(self, element: Element) -> str | None:
+        """Resolve the configured id path on an element as a string key."""
+        if self.id_path is None:
+            return None
+        value = element.get_property(self.id_path)
+        if value is None:
+            return None
+        return str(value)
+
+    # Record access
+    def _read_data(self, line: int) -> dict[str, Any]:
+        """Decode the record stored at the given index position."""
+        if self._mm is None:
+            raise ElementStoreError(f"Element store '{self.path}' is closed")
+
+        start = self._offsets[line]
+        end = self._mm.find(b"\n", start)
+        if end == -1:
+            end = self._size
+
+        try:
+            data = json.loads(self._mm[start:end])
+        except ValueError as e:
+            raise ElementStoreError(
+                f"Invalid JSON on record {line} of '{self.path}': {e}"
+            ) from e
+
+        if not isinstance(data, dict):
+            raise ElementStoreError(
+                f"Record {line} of '{self.path}' must be a JSON object, "
+                f"got {type(data).__name__}"
+            )
+        return data
+
+    def _read_element(self, line: int) -> Element:
+        return DictElement(self._read_data(line))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, line: int) -> Element:
+        """Return the element at a record position (0-based, blank lines skipped)."""
+        if line < 0:
+            line += len(self._offsets)
+        if not 0 <= line < len(self._offsets):
+            raise IndexError(f"Record {line} out of range")
+        return self._read_element(line)
+
+    def __iter__(self) -> Iterator[Element]:
+        """Lazily yield every element in file order."""
+        for line in range(len(self._offsets)):
+            yield self._read_element(line)
+
+    def __contains__(self, element_id: object) -> bool:
+        return str(element_id) in self._ids
+
+    @property
+    def ids(self) -> list[str]:
+        """Ids of the indexed records, in file order (requires ``id_path``)."""
+        return sorted(self._ids, key=self._ids.__getitem__)
+
+    def get(self, element_id: Any) -> Element | None:
+        """
+        Look up a single element by id.
+
+        Args:
+            element_id: Id value; compared by its string form
+
+        Returns:
+            The matching element, or None if no record has this id
+
+        Raises:
+            ElementStoreError: If the store was opened without an ``id_path``
+        """
+        self._require_id_index()
+        line = self._ids.get(str(element_id))
+        if line is None:
+            return None
+        return self._read_element(line)
+
+    def select(self, element_ids: Iterable[Any]) -> Iterator[Element]:
+        """
+        Lazily yield the elements for the given ids, skipping unknown ids.
+
+        Only the selected records are decoded.
+        """
+        self._require_id_index()
+        for element_id in element_ids:
+            line = self._ids.get(str(element_id))
+            if line is not None:
+                yield self._read_element(line)
+
+    def items(self) -> Iterator[tuple[str, Element]]:
+        """Lazily yield ``(key, element)`` pairs in file order.
+
+        The key is the record id when ``id_path`` is configured (falling back
+        to the record position for records without an id), otherwise the
+        record position.
+        """
+        positions = {line: element_id for element_id, line in self._ids.items()}
+        for line in range(len(self._offsets)):
+            yield positions.get(line, str(line)), self._read_element(line)
+
+    def _require_id_index(self) -> None:
+        if self.id_path is None:
+            raise ElementStoreError(
+                "Id lookups require the store to be opened with an id_path"
+            )
+
+    # Lifecycle
+    def close(self) -> None:
+        """Release the memory map and the underlying file handle."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        file = getattr(self, "_file", None)
+        if file is not None and not file.closed:
+            file.close()
+
+    def __enter__(self) -> "JsonlElementStore":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
@@ -3,12 +3,24 @@
 This module provides a declarative way to compose validation rules using AND logic.
 """
 
+from collections.abc import Collection
 from dataclasses import dataclass, field
-from typing import cast
+from functools import cached_property
+from typing import TYPE_CHECKING, cast
 
-from stageflow.elements import Element
-from stageflow.lock import BaseLock, LockDefinition, LockFactory, LockResult
-from stageflow.models import ExtractedProperty, GateDefinition
+from stageflow.elements import CachedElement, Element
+from stageflow.lock import (
+    BaseLock,
+    LockDefinition,
+    LockFactory,
+    LockFingerprint,
+    LockResult,
+    SimpleLock,
+)
+from stageflow.models import ExtractedProperty, GateDefinition, item_string_cache
+
+if TYPE_CHECKING:
+    from stageflow.analysis.constraints import GateConstraints
 
 
 @dataclass(frozen=True)
@@ -23,6 +35,10 @@ class GateResult:
     success_rate: float = 0.0
     failed: list[LockResult] = field(default_factory=list)
     passed: list[LockResult] = field(default_factory=list)
+    # Per-lock results in gate order, used to reuse unaffected locks on re-evaluation
+    lock_results: tuple[LockResult, ...] = field(
+        default=(), compare=False, repr=False
+    )
 
     @property
     def messages(self) -> list[str]:
@@ -68,10 +84,17 @@ class Gate:
     name: str
     target_stage: str
     _locks: list[BaseLock]
-
-    def __init__(self, gate_config: GateDefinition, parent_stage: str | None = None):
+    # Canonical fingerprint of each lock, in lock order
+    lock_fingerprints: tuple[LockFingerprint, ...]
+
+    def __init__(
+        self,
+        gate_config: GateDefinition,
+        parent_stage: str | None = None,
+        trusted: bool = False,
+    ):
         name = gate_config.get("name")
-        if not name:
+        if not name and not trusted:
             raise ValueError("Gate must have a name")
         self.name = name
         self.description = gate_config.get("description", "")
@@ -81,27 +104,64 @@ class Gate:
             LockFactory.create(lock_def) for lock_def in gate_config.get("locks", [])
         ]
 
-        self.target_stage = gate_config.get("target_stage")
-        if not locks or not self.target_stage:
+        if not trusted and (not locks or not self.target_stage):
             raise ValueError("Gate must have at least one lock and a target stage")
 
         self._locks = locks
+        self.lock_fingerprints = tuple(lock.fingerprint for lock in locks)
 
     @classmethod
     def create(cls, config: GateDefinition) -> "Gate":
         return cls(config)
 
-    def evaluate(self, element: Element) -> GateResult:
-        """Evaluate element against all locks using AND logic."""
-        passed = []
-        failed = []
+    def evaluate(
+        self,
+        element: Element,
+        previous: GateResult | None = None,
+        stale_locks: Collection[int] | None = None,
+    ) -> GateResult:
+        """Evaluate element against all locks using AND logic.
 
-        for lock in self._locks:
-            result: LockResult = lock.validate(element)
-            if result.success:
-                passed.append(result)
-            else:
-                failed.append(result)
+        Args:
+            element: Element to evaluate
+            previous: Optional earlier result of this gate for the same element
+            stale_locks: Indexes of locks whose inputs changed since ``previous``;
+                all other lock results are reused from ``previous``
+
+        Returns:
+            GateResult with per-lock outcomes
+        """
+        reusable: tuple[LockResult, ...] = ()
+        if (
+            previous is not None
+            and stale_locks is not None
+            and len(previous.lock_results) == len(self._locks)
+        ):
+            reusable = previous.lock_results
+        stale = set(stale_locks or ())
+        pruned = self._pruned_locks
+        lock_results: list[LockResult | None] = []
+
+        with item_string_cache():
+            for index, lock in enumerate(self._locks):
+                result: LockResult | None
+                if reusable and index not in stale:
+                    result = reusable[index]
+                elif index in pruned:
+                    result = None  # Decided once the locks implying it are done
+                else:
+                    result = _validate_lock(lock, element)
+                lock_results.append(result)
+
+            for index, support in pruned.items():
+                if lock_results[index] is None:
+                    lock_results[index] = self._pruned_result(
+                        index, support, lock_results, element
+                    )
+
+        results = cast(list[LockResult], lock_results)
+        passed = [result for result in results if result.success]
+        failed = [result for result in results if not result.success]
 
         gate_passed = len(failed) == 0
         success_rate = len(passed) / len(self._locks) if self._locks else 0.0
@@ -111,8 +171,57 @@ class Gate:
             failed=failed,
             passed=passed,
             success_rate=success_rate,
+            lock_results=tuple(results),
+        )
+
+    def _pruned_result(
+        self,
+        index: int,
+        support: tuple[int, ...],
+        lock_results: list[LockResult | None],
+        element: Element,
+    ) -> LockResult:
+        """Result of a redundant lock, skipping validation when implied."""
+        lock = cast(SimpleLock, self._locks[index])
+        supporting = [cast(LockResult, lock_results[i]) for i in support]
+        if not all(result.success for result in supporting):
+            return lock.validate(element)
+        return LockResult(
+            success=True,
+            property_path=lock.property_path,
+            lock_type=lock.lock_type,
+            actual_value=supporting[0].actual_value,
+            expected_value=lock.expected_value,
         )
 
+    @cached_property
+    def constraints(self) -> "GateConstraints":
+        """Solved constraints of the gate's locks (conflicts, redundant locks)."""
+        from stageflow.analysis.constraints import solve_locks
+
+        return solve_locks(self._locks)
+
+    @cached_property
+    def _pruned_locks(self) -> dict[int, tuple[int, ...]]:
+        """Redundant simple locks, with the kept locks on the same property.
+
+        A redundant lock passes whenever the kept locks on its property pass,
+        so its validation is skipped in that case.
+        """
+        redundant = self.constraints.redundant
+        if not redundant:
+            return {}
+        kept: dict[str, list[int]] = {}
+        for index, lock in enumerate(self._locks):
+            if index not in redundant and isinstance(lock, SimpleLock):
+                kept.setdefault(lock.property_path, []).append(index)
+        pruned: dict[int, tuple[int, ...]] = {}
+        for index in sorted(redundant):
+            lock = self._locks[index]
+            if isinstance(lock, SimpleLock) and kept.get(lock.property_path):
+                pruned[index] = tuple(kept[lock.property_path])
+        return pruned
+
     @property
     def locks(self) -> list[BaseLock]:
         """Get all locks in this gate."""
@@ -133,6 +242,16 @@ class Gate:
             self._collect_property_paths(lock, paths)
         return paths
 
+    @property
+    def lock_paths(self) -> list[set[str]]:
+        """Get the property paths read by each lock, in lock order."""
+        result = []
+        for lock in self._locks:
+            paths: set[str] = set()
+            self._collect_property_paths(lock, paths)
+            result.append(paths)
+        return result
+
     def _collect_property_paths(self, lock: BaseLock, paths: set[str]) -> None:
         """Recursively collect property paths from locks."""
         from stageflow.lock import ConditionalLock, OrLogicLock
@@ -162,3 +281,17 @@ class Gate:
             "parent_stage": self.parent_stage,
             "locks": self.lock_to_dict(),
         }
+
+
+def _validate_lock(lock: BaseLock, element: Element) -> LockResult:
+    """Validate a lock, sharing the result across gates of one evaluation pass.
+
+    Identical lock definitions are interned by LockFactory, so with a
+    CachedElement a lock used by several gates or stages runs once.
+    """
+    if isinstance(element, CachedElement):
+        # The lock is stored alongside its result to keep its id() reserved
+        return element.memoize(
+            ("lock", id(lock)), lambda: (lock, lock.validate(element))
+        )[1]
+    return lock.validate(element)
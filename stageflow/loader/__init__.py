@@ -11,15 +11,22 @@ All type definitions are imported from stageflow.models for consistency.
 import json
 from pathlib import Path
 
-from ruamel.yaml import YAML
-
 from stageflow.elements import Element, create_element
 
 # Core definitions from main modules
 from stageflow.gate import GateDefinition
 
 # Process loader and validators (now directly in loader/)
+from stageflow.loader.artifact import (
+    ArtifactError,
+    ArtifactVerificationError,
+    ProcessArtifact,
+    read_artifact,
+    write_artifact,
+)
+from stageflow.loader.cache import CompiledProcess, CompiledProcessCache
 from stageflow.loader.loader import ProcessLoader
+from stageflow.loader.parsing import load_document, parse_document, yaml_backend
 from stageflow.loader.validators import (
     GateConfigValidator,
     LockConfigValidator,
@@ -79,7 +86,7 @@ def load_process(file_path: str | Path) -> Process:
 
 def _parse_yaml(content: str) -> dict | None:
     """
-    Parse YAML content using ruamel.yaml.
+    Parse YAML (or JSON) content with the fast safe loader.
 
     Args:
         content: YAML string content
@@ -87,9 +94,8 @@ def _parse_yaml(content: str) -> dict | None:
     Returns:
         Parsed data as dict, or None if parsing fails or result is not a dict
     """
-    yaml_parser = YAML(typ="safe")
     try:
-        data = yaml_parser.load(content)
+        data = parse_document(content)
         if isinstance(data, dict):
             return data
         return None
@@ -213,6 +219,18 @@ __all__ = [
     "ErrorSeverity",
     # Loader
     "ProcessLoader",
+    "CompiledProcessCache",
+    "CompiledProcess",
+    # Trusted artifacts
+    "ProcessArtifact",
+    "ArtifactError",
+    "ArtifactVerificationError",
+    "read_artifact",
+    "write_artifact",
+    # Parsing
+    "parse_document",
+    "load_document",
+    "yaml_backend",
     # Validators
     "ProcessConfigValidator",
     "StageConfigValidator",
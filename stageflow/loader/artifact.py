@@ -0,0 +1,200 @@
+"""
+Verified process artifacts for trusted fast loads.
+
+An artifact is a compact JSON file holding a process configuration that has
+already been through the full pipeline (include resolution, configuration
+validation and consistency analysis), together with the issues that analysis
+found. Typically CI writes it with ``write_artifact`` after a normal load.
+
+Loading an artifact rebuilds the Process directly: no YAML parsing, no
+``ProcessConfigValidator``, no construction-time re-validation of gates and
+actions and no analysis. Because all of those checks are skipped, an artifact
+is only accepted after its integrity is verified, either with an HMAC-SHA256
+signature (shared key) or against an expected SHA-256 digest pinned by the
+caller.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from stageflow.models import ConsistencyIssue
+from stageflow.process import Process
+
+from .cache import _issue_from_dict, _issue_to_dict
+
+# Bump whenever the artifact layout or the meaning of its data changes
+ARTIFACT_FORMAT_VERSION = 1
+
+
+class ArtifactError(Exception):
+    """Raised when an artifact cannot be read or written."""
+
+    pass
+
+
+class ArtifactVerificationError(ArtifactError):
+    """Raised when an artifact fails its signature or hash check."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class ProcessArtifact:
+    """A verified artifact ready to be turned into a Process."""
+
+    config: dict[str, Any]
+    issues: list[ConsistencyIssue]
+    digest: str
+
+    def to_process(self, lazy: bool = False) -> Process:
+        """Build the runtime Process without validation or analysis.
+
+        Args:
+            lazy: Build stages on first access (see ``Process``)
+        """
+        return Process(
+            self.config,  # type: ignore[arg-type]
+            issues=self.issues,
+            trusted=True,
+            lazy=lazy,
+        )
+
+
+def _as_key(key: str | bytes) -> bytes:
+    return key.encode("utf-8") if isinstance(key, str) else key
+
+
+def _canonical_payload(config: Any, issues: list[dict[str, Any]]) -> bytes:
+    """Deterministic encoding of the signed part of an artifact."""
+    return json.dumps(
+        {"format": ARTIFACT_FORMAT_VERSION, "config": config, "issues": issues},
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def sign_payload(payload: bytes, key: str | bytes) -> str:
+    """HMAC-SHA256 signature of an artifact payload."""
+    return hmac.new(_as_key(key), payload, hashlib.sha256).hexdigest()
+
+
+def write_artifact(
+    process: Process, path: str | Path, key: str | bytes | None = None
+) -> str:
+    """
+    Write a trusted-load artifact for a validated process.
+
+    Args:
+        process: Process loaded through the full pipeline
+        path: Destination file
+        key: Optional signing key; when given the artifact is signed
+
+    Returns:
+        SHA-256 digest of the artifact payload (pin it for hash-verified loads)
+
+    Raises:
+        ArtifactError: If the process has blocking issues or cannot be written
+    """
+    if not process.is_valid:
+        raise ArtifactError(
+            f"Process '{process.name}' has blocking consistency issues"
+        )
+
+    issues = [_issue_to_dict(issue) for issue in process.issues]
+    try:
+        payload = _canonical_payload(process.config, issues)
+    except (TypeError, ValueError) as e:
+        raise ArtifactError(f"Process configuration is not serializable: {e}") from e
+    digest = hashlib.sha256(payload).hexdigest()
+
+    entry: dict[str, Any] = {
+        "format": ARTIFACT_FORMAT_VERSION,
+        "digest": digest,
+        "config": process.config,
+        "issues": issues,
+    }
+    if key is not None:
+        entry["signature"] = sign_payload(payload, key)
+
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(
+            json.dumps(entry, separators=(",", ":")), encoding="utf-8"
+        )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        raise ArtifactError(f"Cannot write artifact {path}: {e}") from e
+    return digest
+
+
+def read_artifact(
+    path: str | Path,
+    key: str | bytes | None = None,
+    expected_hash: str | None = None,
+) -> ProcessArtifact:
+    """
+    Read and verify a trusted-load artifact.
+
+    At least one of ``key`` or ``expected_hash`` is required. The payload
+    digest is always recomputed; a signature is required when a key is given.
+
+    Args:
+        path: Artifact file
+        key: Signing key the artifact must be signed with
+        expected_hash: SHA-256 digest the payload must match
+
+    Returns:
+        Verified ProcessArtifact
+
+    Raises:
+        ArtifactError: If the file cannot be read or is malformed
+        ArtifactVerificationError: If verification fails
+    """
+    if key is None and expected_hash is None:
+        raise ArtifactVerificationError(
+            "Trusted load requires a signing key or an expected hash"
+        )
+
+    try:
+        entry = json.loads(Path(path).read_bytes())
+        if entry.get("format") != ARTIFACT_FORMAT_VERSION:
+            raise ArtifactError(
+                f"Unsupported artifact format: {entry.get('format')!r}"
+            )
+        config = entry["config"]
+        raw_issues = entry["issues"]
+        payload = _canonical_payload(config, raw_issues)
+    except ArtifactError:
+        raise
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ArtifactError(f"Cannot read artifact {path}: {e}") from e
+
+    digest = hashlib.sha256(payload).hexdigest()
+    if not hmac.compare_digest(digest, str(entry.get("digest", ""))):
+        raise ArtifactVerificationError(f"Artifact {path} is corrupted")
+    if expected_hash is not None and not hmac.compare_digest(
+        digest, expected_hash.lower()
+    ):
+        raise ArtifactVerificationError(
+            f"Artifact {path} does not match the expected hash"
+        )
+    if key is not None:
+        signature = entry.get("signature")
+        if not isinstance(signature, str) or not hmac.compare_digest(
+            signature, sign_payload(payload, key)
+        ):
+            raise ArtifactVerificationError(f"Artifact {path} has an invalid signature")
+
+    try:
+        issues = [_issue_from_dict(item) for item in raw_issues]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ArtifactError(f"Cannot read artifact {path}: {e}") from e
+    return ProcessArtifact(config=config, issues=issues, digest=digest)
@@ -0,0 +1,225 @@
+"""
+On-disk cache of compiled process definitions.
+
+A compiled entry stores the validated process configuration (with `$include`s
+already resolved), its consistency issues and any validation warnings as
+compact JSON. Entries are keyed by the source path and a content hash of the
+file; the hashes of every included file are recorded in the entry and checked
+on lookup, so editing the file or any include invalidates it.
+
+A cache hit rebuilds the Process without YAML parsing, include resolution,
+configuration validation or consistency analysis.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from stageflow.models import (
+    ConsistencyIssue,
+    ErrorSeverity,
+    IssueSeverity,
+    LoadError,
+    LoadErrorType,
+    ProcessIssueTypes,
+)
+
+# Bump whenever the entry layout or the meaning of cached data changes
+CACHE_FORMAT_VERSION = 1
+
+
+def hash_bytes(content: bytes) -> str:
+    """Content hash used for cache keys and include verification."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file(path: Path) -> str | None:
+    """Hash a file's content, or None if it cannot be read."""
+    try:
+        return hash_bytes(path.read_bytes())
+    except OSError:
+        return None
+
+
+@dataclass(frozen=True)
+class CompiledProcess:
+    """A cache entry ready to be turned back into a Process."""
+
+    config: dict[str, Any]
+    issues: list[ConsistencyIssue]
+    warnings: list[LoadError]
+    includes: list[Path] = field(default_factory=list)
+
+
+class CompiledProcessCache:
+    """
+    Persistent cache of compiled processes in a directory.
+
+    All failures to read or write entries are treated as cache misses; the
+    cache never causes a load to fail.
+    """
+
+    def __init__(self, cache_dir: str | Path):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> "CompiledProcessCache | None":
+        """Create a cache from STAGEFLOW_CACHE_* environment variables.
+
+        Returns:
+            A cache when STAGEFLOW_CACHE_ENABLED is truthy, otherwise None
+        """
+        from stageflow.manager.constants import get_cache_dir, get_cache_enabled
+
+        if not get_cache_enabled():
+            return None
+        return cls(get_cache_dir())
+
+    def _entry_path(self, source: Path, content_hash: str) -> Path:
+        key = f"{CACHE_FORMAT_VERSION}\0{source.resolve()}\0{content_hash}"
+        return self.cache_dir / f"{hash_bytes(key.encode())}.json"
+
+    def get(self, source: Path, content_hash: str) -> CompiledProcess | None:
+        """
+        Look up a compiled process.
+
+        Args:
+            source: Process file path
+            content_hash: Hash of the file's current content
+
+        Returns:
+            CompiledProcess on hit, None on miss or stale includes
+        """
+        entry_path = self._entry_path(source, content_hash)
+        try:
+            with entry_path.open("r", encoding="utf-8") as f:
+                entry = json.load(f)
+            if entry.get("format") != CACHE_FORMAT_VERSION:
+                raise ValueError("format mismatch")
+            for include, expected in entry["includes"].items():
+                if hash_file(Path(include)) != expected:
+                    raise ValueError("stale include")
+            compiled = CompiledProcess(
+                config=entry["config"],
+                issues=[_issue_from_dict(item) for item in entry["issues"]],
+                warnings=[_load_error_from_dict(item) for item in entry["warnings"]],
+                includes=[Path(include) for include in entry["includes"]],
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return compiled
+
+    def put(
+        self,
+        source: Path,
+        content_hash: str,
+        includes: Iterable[Path],
+        config: dict[str, Any],
+        issues: list[ConsistencyIssue],
+        warnings: list[LoadError],
+    ) -> bool:
+        """
+        Store a compiled process.
+
+        Args:
+            source: Process file path
+            content_hash: Hash of the file content the entry was built from
+            includes: Files pulled in via `$include`
+            config: Validated process configuration with includes resolved
+            issues: Consistency issues found by analysis
+            warnings: Validation warnings reported while loading
+
+        Returns:
+            True if the entry was written
+        """
+        include_hashes: dict[str, str] = {}
+        for include in includes:
+            include_hash = hash_file(include)
+            if include_hash is None:
+                return False
+            include_hashes[str(include.resolve())] = include_hash
+
+        try:
+            payload = json.dumps(
+                {
+                    "format": CACHE_FORMAT_VERSION,
+                    "source": str(source.resolve()),
+                    "content_hash": content_hash,
+                    "includes": include_hashes,
+                    "config": config,
+                    "issues": [_issue_to_dict(issue) for issue in issues],
+                    "warnings": [warning.to_dict() for warning in warnings],
+                },
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            # Configuration contains values JSON cannot represent
+            return False
+
+        entry_path = self._entry_path(source, content_hash)
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def clear(self) -> int:
+        """Remove all cache entries. Returns the number of entries removed."""
+        removed = 0
+        if not self.cache_dir.is_dir():
+            return removed
+        for entry in self.cache_dir.glob("*.json"):
+            try:
+                entry.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def _issue_to_dict(issue: ConsistencyIssue) -> dict[str, Any]:
+    return {
+        "issue_type": issue.issue_type.value,
+        "description": issue.description,
+        "stages": list(issue.stages),
+        "severity": issue.severity.value,
+        "details": issue.details,
+    }
+
+
+def _issue_from_dict(data: dict[str, Any]) -> ConsistencyIssue:
+    return ConsistencyIssue(
+        issue_type=ProcessIssueTypes(data["issue_type"]),
+        description=data["description"],
+        stages=list(data["stages"]),
+        severity=IssueSeverity(data["severity"]),
+        details=dict(data["details"]),
+    )
+
+
+def _load_error_from_dict(data: dict[str, Any]) -> LoadError:
+    return LoadError(
+        error_type=LoadErrorType(data["error_type"]),
+        severity=ErrorSeverity(data["severity"]),
+        message=data["message"],
+        context=dict(data["context"]),
+    )
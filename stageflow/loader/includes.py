@@ -0,0 +1,240 @@
+"""
+Shared `$include` resolution with a parse cache and dependency graph.
+
+Stage files included by many processes are parsed once: parsed documents are
+cached by content hash, and a file whose ``(mtime_ns, size, inode)`` is
+unchanged is not even re-read. Included files may include further files
+(relative to their own directory); cycles are reported instead of recursing
+forever.
+
+Every resolution is recorded in an IncludeGraph mapping each process file to
+the files it includes (transitively), so caches and watchers can find the
+processes affected by a changed include.
+"""
+
+import copy
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from stageflow.cache import LRUCache
+from stageflow.loader.cache import hash_bytes
+from stageflow.loader.parsing import parse_document
+from stageflow.models import FileFormat
+
+INCLUDE_KEY = "$include"
+
+FileSignature = tuple[int, int, int]
+
+
+class IncludeError(Exception):
+    """Base exception for `$include` resolution failures."""
+
+    def __init__(self, message: str, path: Path):
+        super().__init__(message)
+        self.path = path
+
+
+class IncludeNotFoundError(IncludeError):
+    """Raised when an included file does not exist."""
+
+    pass
+
+
+class IncludeFormatError(IncludeError):
+    """Raised when an included file is not a mapping."""
+
+    pass
+
+
+class IncludeCycleError(IncludeError):
+    """Raised when files include each other in a cycle."""
+
+    def __init__(self, chain: list[Path]):
+        super().__init__(
+            "Include cycle: " + " -> ".join(str(path) for path in chain), chain[-1]
+        )
+        self.chain = chain
+
+
+def _key(path: Path) -> str:
+    return os.path.abspath(path)
+
+
+class IncludeGraph:
+    """Thread-safe map between process files and the files they include."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._includes: dict[str, frozenset[str]] = {}
+        self._dependents: dict[str, set[str]] = {}
+
+    def record(self, source: Path, includes: Iterable[Path]) -> None:
+        """Replace the recorded includes of a process file."""
+        source_key = _key(source)
+        new = frozenset(_key(path) for path in includes)
+        with self._lock:
+            old = self._includes.get(source_key, frozenset())
+            for include in old - new:
+                dependents = self._dependents.get(include)
+                if dependents is not None:
+                    dependents.discard(source_key)
+                    if not dependents:
+                        del self._dependents[include]
+            for include in new - old:
+                self._dependents.setdefault(include, set()).add(source_key)
+            if new:
+                self._includes[source_key] = new
+            else:
+                self._includes.pop(source_key, None)
+
+    def forget(self, source: Path) -> None:
+        """Drop a process file from the graph."""
+        self.record(source, ())
+
+    def includes_of(self, source: Path) -> frozenset[Path]:
+        """Files included (transitively) by a process file."""
+        with self._lock:
+            return frozenset(
+                Path(path) for path in self._includes.get(_key(source), ())
+            )
+
+    def dependents(self, include: Path) -> frozenset[Path]:
+        """Process files that include a file (directly or transitively)."""
+        with self._lock:
+            return frozenset(
+                Path(path) for path in self._dependents.get(_key(include), ())
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._includes)
+
+
+class IncludeResolver:
+    """
+    Resolves `$include` directives with caching shared across loads.
+
+    Safe to share between threads and loaders. Returned data is always a
+    private copy, so callers may modify it.
+    """
+
+    def __init__(self, max_documents: int = 512):
+        """
+        Initialize resolver.
+
+        Args:
+            max_documents: Parsed documents (and file hashes) kept in memory
+        """
+        self._documents: LRUCache[str, Any] = LRUCache(max_size=max_documents)
+        self._hashes: LRUCache[str, tuple[FileSignature, str]] = LRUCache(
+            max_size=max_documents
+        )
+        self.graph = IncludeGraph()
+        self.reads = 0
+        self.parses = 0
+
+    def load(self, path: Path) -> Any:
+        """
+        Parsed content of an include file (a private copy).
+
+        Raises:
+            IncludeNotFoundError: If the file does not exist
+            OSError, ValueError, ruamel.yaml.YAMLError: On read/parse errors
+        """
+        key = _key(path)
+        try:
+            st = os.stat(key)
+        except FileNotFoundError as e:
+            raise IncludeNotFoundError(
+                f"Stage include file not found: {path}", path
+            ) from e
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+        cached = self._hashes.get(key)
+        content_hash = cached[1] if cached and cached[0] == signature else None
+        data = self._documents.get(content_hash) if content_hash else None
+        if data is None:
+            content = Path(key).read_bytes()
+            self.reads += 1
+            content_hash = hash_bytes(content)
+            self._hashes.put(key, (signature, content_hash))
+            data = self._documents.get(content_hash)
+            if data is None:
+                file_format = (
+                    FileFormat.JSON if path.suffix.lower() == ".json" else None
+                )
+                data = parse_document(content, file_format)
+                self.parses += 1
+                self._documents.put(content_hash, data)
+        return copy.deepcopy(data)
+
+    def resolve(
+        self,
+        definition: dict[str, Any],
+        base_path: Path,
+        includes: list[Path] | None = None,
+        _chain: tuple[str, ...] = (),
+    ) -> dict[str, Any]:
+        """
+        Expand a mapping's `$include`, recursively.
+
+        Keys next to `$include` override the included content. Nested
+        includes are resolved relative to the including file.
+
+        Args:
+            definition: Mapping that may contain `$include`
+            base_path: Directory relative include paths are resolved from
+            includes: Optional list collecting every include file referenced
+
+        Returns:
+            Resolved mapping (without `$include`)
+
+        Raises:
+            IncludeError: For missing, non-mapping or cyclic includes
+        """
+        if INCLUDE_KEY not in definition:
+            return definition
+
+        include_path = base_path / definition[INCLUDE_KEY]
+        include_key = _key(include_path)
+        if includes is not None:
+            includes.append(include_path)
+        if include_key in _chain:
+            cycle = [Path(path) for path in _chain] + [include_path]
+            raise IncludeCycleError(cycle[_chain.index(include_key) :])
+
+        included = self.load(include_path)
+        if not isinstance(included, dict):
+            raise IncludeFormatError(
+                f"Stage include must be a dictionary: {include_path}", include_path
+            )
+        included = self.resolve(
+            included, include_path.parent, includes, (*_chain, include_key)
+        )
+
+        merged = dict(included)
+        for key, value in definition.items():
+            if key != INCLUDE_KEY:
+                merged[key] = value
+        return merged
+
+    def clear(self) -> None:
+        """Drop cached documents (the dependency graph is kept)."""
+        self._documents.clear()
+        self._hashes.clear()
+
+
+_shared_resolver: IncludeResolver | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_include_resolver() -> IncludeResolver:
+    """Process-wide resolver used by ProcessLoader unless one is given."""
+    global _shared_resolver
+    with _shared_lock:
+        if _shared_resolver is None:
+            _shared_resolver = IncludeResolver()
+        return _shared_resolver
@@ -12,8 +12,6 @@ import json
 from pathlib import Path
 from typing import Any
 
-from ruamel.yaml import YAML
-
 from stageflow.models import (
     ErrorSeverity,
     FileFormat,
@@ -28,6 +26,16 @@ from stageflow.models import (
 # and process.is_valid - no mapping to LoadError needed
 from stageflow.process import Process
 
+from .artifact import ArtifactError, ArtifactVerificationError, read_artifact
+from .cache import CompiledProcess, CompiledProcessCache, hash_bytes
+from .includes import (
+    IncludeCycleError,
+    IncludeFormatError,
+    IncludeNotFoundError,
+    IncludeResolver,
+    get_shared_include_resolver,
+)
+from .parsing import parse_document
 from .validators import (
     ProcessConfigValidator,
 )
@@ -41,9 +49,32 @@ class ProcessLoader:
     returns a unified ProcessLoadResult for all operations.
     """
 
-    def __init__(self):
-        """Initialize process loader."""
-        pass
+    def __init__(
+        self,
+        cache: CompiledProcessCache | None = None,
+        include_resolver: IncludeResolver | None = None,
+        lazy: bool = False,
+    ):
+        """Initialize process loader.
+
+        Args:
+            cache: Optional compiled process cache. Defaults to the cache
+                configured through STAGEFLOW_CACHE_* environment variables
+                (disabled unless STAGEFLOW_CACHE_ENABLED is set).
+            include_resolver: Resolver for `$include` directives. Defaults to
+                a process-wide resolver whose parse cache and dependency
+                graph are shared by all loaders.
+            lazy: Build loaded processes in lazy mode (stages materialized on
+                first access, analysis deferred unless known from a cache or
+                artifact). See ``Process``.
+        """
+        self.cache = cache if cache is not None else CompiledProcessCache.from_env()
+        self.include_resolver = (
+            include_resolver
+            if include_resolver is not None
+            else get_shared_include_resolver()
+        )
+        self.lazy = lazy
 
     def load(self, source: str | Path) -> ProcessLoadResult:
         """
@@ -66,6 +97,73 @@ class ProcessLoader:
         else:
             return self._load_from_registry(source_str)
 
+    def load_trusted(
+        self,
+        artifact_path: str | Path,
+        key: str | bytes | None = None,
+        expected_hash: str | None = None,
+    ) -> ProcessLoadResult:
+        """
+        Load a process from a verified artifact, skipping validation.
+
+        The artifact (see ``stageflow.loader.artifact.write_artifact``) must
+        pass a signature or hash check; the process is then built without
+        parsing, configuration validation or consistency analysis. Use
+        ``load()`` for untrusted input.
+
+        Args:
+            artifact_path: Artifact file
+            key: Signing key. Defaults to STAGEFLOW_ARTIFACT_KEY when set
+            expected_hash: SHA-256 digest the artifact payload must match
+
+        Returns:
+            ProcessLoadResult with status, process (if successful), and errors
+        """
+        from stageflow.manager.constants import get_artifact_key
+
+        if key is None:
+            key = get_artifact_key()
+        source = str(artifact_path)
+
+        try:
+            artifact = read_artifact(artifact_path, key=key, expected_hash=expected_hash)
+            process = artifact.to_process(lazy=self.lazy)
+        except ArtifactVerificationError as e:
+            status = LoadResultStatus.VALIDATION_ERROR
+            error = LoadError(
+                error_type=LoadErrorType.VALIDATION_ERROR,
+                severity=ErrorSeverity.FATAL,
+                message=f"Artifact verification failed: {e}",
+                context={"path": source},
+            )
+        except ArtifactError as e:
+            status = LoadResultStatus.FILE_ERROR
+            error = LoadError(
+                error_type=LoadErrorType.INVALID_FORMAT,
+                severity=ErrorSeverity.FATAL,
+                message=str(e),
+                context={"path": source},
+            )
+        except Exception as e:
+            status = LoadResultStatus.VALIDATION_ERROR
+            error = LoadError(
+                error_type=LoadErrorType.VALIDATION_ERROR,
+                severity=ErrorSeverity.FATAL,
+                message=f"Unexpected error creating Process instance: {e}",
+                context={"exception_type": type(e).__name__, "exception": str(e)},
+            )
+        else:
+            return ProcessLoadResult(
+                status=LoadResultStatus.SUCCESS,
+                process=process,
+                errors=[],
+                source=source,
+            )
+
+        return ProcessLoadResult(
+            status=status, process=None, errors=[error], source=source
+        )
+
     def detect_source_type(self, source: str) -> ProcessSourceType:
         """
         Detect whether source is a file or registry reference.
@@ -109,33 +207,37 @@ class ProcessLoader:
                 source=str(file_path),
             )
 
-        # Phase 2: File parsing
+        # Phase 2: File parsing (served from the compiled cache when possible)
         try:
+            content = file_path.read_bytes()
+            content_hash: str | None = None
+            if self.cache is not None:
+                content_hash = hash_bytes(content)
+                cached_result = self._load_compiled(file_path, content_hash)
+                if cached_result is not None:
+                    return cached_result
+
             file_format = self._detect_file_format(file_path)
-            with open(file_path, encoding="utf-8") as f:
-                if file_format == FileFormat.YAML:
-                    yaml_parser = YAML()
-                    raw_data = yaml_parser.load(f)
-                elif file_format == FileFormat.JSON:
-                    raw_data = json.load(f)
-                else:
-                    errors.append(
-                        LoadError(
-                            error_type=LoadErrorType.INVALID_FORMAT,
-                            severity=ErrorSeverity.FATAL,
-                            message=f"Unsupported file format: {file_path.suffix}",
-                            context={
-                                "path": str(file_path),
-                                "suffix": file_path.suffix,
-                            },
-                        )
-                    )
-                    return ProcessLoadResult(
-                        status=LoadResultStatus.PARSE_ERROR,
-                        process=None,
-                        errors=errors,
-                        source=str(file_path),
+            if file_format in (FileFormat.YAML, FileFormat.JSON):
+                raw_data = parse_document(content, file_format)
+            else:
+                errors.append(
+                    LoadError(
+                        error_type=LoadErrorType.INVALID_FORMAT,
+                        severity=ErrorSeverity.FATAL,
+                        message=f"Unsupported file format: {file_path.suffix}",
+                        context={
+                            "path": str(file_path),
+                            "suffix": file_path.suffix,
+                        },
                     )
+                )
+                return ProcessLoadResult(
+                    status=LoadResultStatus.PARSE_ERROR,
+                    process=None,
+                    errors=errors,
+                    source=str(file_path),
+                )
         except json.JSONDecodeError as e:
             errors.append(
                 LoadError(
@@ -173,8 +275,14 @@ class ProcessLoader:
             )
 
         # Phase 3: Structure extraction (pass base_path for include resolution)
-        process_config = self._extract_process_config(raw_data, errors, file_path.parent)
-        if not process_config:
+        includes: list[Path] = []
+        process_config = self._extract_process_config(
+            raw_data, errors, file_path.parent, includes
+        )
+        self.include_resolver.graph.record(file_path, includes)
+        if not process_config or any(
+            error.severity == ErrorSeverity.FATAL for error in errors
+        ):
             return ProcessLoadResult(
                 status=LoadResultStatus.STRUCTURE_ERROR,
                 process=None,
@@ -198,7 +306,7 @@ class ProcessLoader:
 
         # Phase 5: Process instantiation
         try:
-            process = Process(process_config)  # type: ignore[arg-type]
+            process = Process(process_config, lazy=self.lazy)  # type: ignore[arg-type]
 
             # Collect validation warnings
             warnings: list[LoadError] = []
@@ -207,6 +315,16 @@ class ProcessLoader:
                     [e for e in validator.errors if e.severity == ErrorSeverity.WARNING]
                 )
 
+            if self.cache is not None and content_hash is not None:
+                self.cache.put(
+                    file_path,
+                    content_hash,
+                    includes,
+                    process_config,
+                    process.issues,
+                    warnings,
+                )
+
             # Process is created - consistency issues are accessible via process.issues
             # and process.is_valid. No mapping needed.
             return ProcessLoadResult(
@@ -215,6 +333,7 @@ class ProcessLoader:
                 errors=[],
                 warnings=warnings,
                 source=str(file_path),
+                includes=includes,
             )
 
         except ValueError as e:
@@ -260,6 +379,48 @@ class ProcessLoader:
                 source=str(file_path),
             )
 
+    def _load_compiled(
+        self, file_path: Path, content_hash: str
+    ) -> ProcessLoadResult | None:
+        """
+        Rebuild a process from the compiled cache.
+
+        Skips parsing, include resolution, validation and analysis. Any
+        problem with the cached entry is treated as a miss.
+
+        Args:
+            file_path: Path to process definition file
+            content_hash: Hash of the file's current content
+
+        Returns:
+            ProcessLoadResult on a usable hit, otherwise None
+        """
+        if self.cache is None:
+            return None
+        compiled: CompiledProcess | None = self.cache.get(file_path, content_hash)
+        if compiled is None:
+            return None
+
+        try:
+            process = Process(
+                compiled.config,  # type: ignore[arg-type]
+                issues=compiled.issues,
+                trusted=True,
+                lazy=self.lazy,
+            )
+        except Exception:
+            return None
+        self.include_resolver.graph.record(file_path, compiled.includes)
+
+        return ProcessLoadResult(
+            status=LoadResultStatus.SUCCESS,
+            process=process,
+            errors=[],
+            warnings=compiled.warnings,
+            source=str(file_path),
+            includes=compiled.includes,
+        )
+
     def _load_from_registry(self, registry_id: str) -> ProcessLoadResult:
         """
         Load process from registry.
@@ -271,6 +432,8 @@ class ProcessLoader:
             ProcessLoadResult with status and errors
         """
         from stageflow.manager.config import ManagerConfig
+        from stageflow.manager.constants import get_persist_index
+        from stageflow.manager.process_cache import get_shared_process_cache
         from stageflow.manager.registry import ProcessRegistry, ProcessRegistryError
 
         # Strip the @ prefix to get the process name
@@ -279,10 +442,21 @@ class ProcessLoader:
         try:
             # Initialize registry with config from environment variables
             config = ManagerConfig.from_env()
-            registry = ProcessRegistry(config)
-
-            # Load the process from registry
-            process = registry.load_process(process_name)
+            cache = get_shared_process_cache()
+            # Unchanged processes are answered by name, without the registry
+            process = (
+                cache.get_named(config.processes_dir, process_name)
+                if cache is not None
+                else None
+            )
+            if process is None:
+                # Read-only lookup: only write the index file when opted in
+                registry = ProcessRegistry(
+                    config,
+                    persist_index=get_persist_index(),
+                    process_cache=cache,
+                )
+                process = registry.load_process(process_name)
 
             return ProcessLoadResult(
                 status=LoadResultStatus.SUCCESS,
@@ -345,7 +519,11 @@ class ProcessLoader:
             return FileFormat.YAML
 
     def _extract_process_config(
-        self, raw_data: Any, errors: list[LoadError], base_path: Path | None = None
+        self,
+        raw_data: Any,
+        errors: list[LoadError],
+        base_path: Path | None = None,
+        includes: list[Path] | None = None,
     ) -> dict[str, Any] | None:
         """
         Extract process configuration from raw file data.
@@ -358,6 +536,7 @@ class ProcessLoader:
             raw_data: Parsed YAML/JSON data
             errors: Error list to append to
             base_path: Base path for resolving relative includes
+            includes: Optional list collecting the include files referenced
 
         Returns:
             Process configuration dict or None if extraction failed
@@ -389,7 +568,7 @@ class ProcessLoader:
             # Resolve includes in stages
             if base_path and "stages" in process_config:
                 process_config["stages"] = self._resolve_stage_includes(
-                    process_config["stages"], base_path, errors
+                    process_config["stages"], base_path, errors, includes
                 )
             return process_config
 
@@ -397,7 +576,11 @@ class ProcessLoader:
         return raw_data
 
     def _resolve_stage_includes(
-        self, stages: dict[str, Any], base_path: Path, errors: list[LoadError]
+        self,
+        stages: dict[str, Any],
+        base_path: Path,
+        errors: list[LoadError],
+        includes: list[Path] | None = None,
     ) -> dict[str, Any]:
         """
         Resolve $include directives in stage definitions.
@@ -405,17 +588,20 @@ class ProcessLoader:
         Supports:
         - stage_id: {$include: "path/to/stage.yaml"}
         - stage_id: {$include: "path/to/stage.yaml", ...extra_fields}
+        - Nested includes inside included files (cycles are reported)
+
+        Parsed include files are cached by the shared IncludeResolver.
 
         Args:
             stages: Stages dictionary from process config
             base_path: Base path for resolving relative paths
             errors: Error list to append to
+            includes: Optional list collecting the include files referenced
 
         Returns:
             Stages dictionary with includes resolved
         """
         resolved_stages: dict[str, Any] = {}
-        yaml_parser = YAML()
 
         for stage_id, stage_def in stages.items():
             if not isinstance(stage_def, dict):
@@ -425,45 +611,29 @@ class ProcessLoader:
             if "$include" in stage_def:
                 include_path = base_path / stage_def["$include"]
                 try:
-                    if not include_path.exists():
-                        errors.append(
-                            LoadError(
-                                error_type=LoadErrorType.FILE_NOT_FOUND,
-                                severity=ErrorSeverity.FATAL,
-                                message=f"Stage include file not found: {include_path}",
-                                context={"stage": stage_id, "path": str(include_path)},
-                            )
+                    resolved_stages[stage_id] = self.include_resolver.resolve(
+                        stage_def, base_path, includes
+                    )
+                except IncludeNotFoundError as e:
+                    errors.append(
+                        LoadError(
+                            error_type=LoadErrorType.FILE_NOT_FOUND,
+                            severity=ErrorSeverity.FATAL,
+                            message=str(e),
+                            context={"stage": stage_id, "path": str(e.path)},
                         )
-                        resolved_stages[stage_id] = stage_def
-                        continue
-
-                    with open(include_path, encoding="utf-8") as f:
-                        file_format = self._detect_file_format(include_path)
-                        if file_format == FileFormat.YAML:
-                            included_data = yaml_parser.load(f)
-                        else:
-                            included_data = json.load(f)
-
-                    if not isinstance(included_data, dict):
-                        errors.append(
-                            LoadError(
-                                error_type=LoadErrorType.INVALID_FORMAT,
-                                severity=ErrorSeverity.FATAL,
-                                message=f"Stage include must be a dictionary: {include_path}",
-                                context={"stage": stage_id, "path": str(include_path)},
-                            )
+                    )
+                    resolved_stages[stage_id] = stage_def
+                except (IncludeFormatError, IncludeCycleError) as e:
+                    errors.append(
+                        LoadError(
+                            error_type=LoadErrorType.INVALID_FORMAT,
+                            severity=ErrorSeverity.FATAL,
+                            message=str(e),
+                            context={"stage": stage_id, "path": str(e.path)},
                         )
-                        resolved_stages[stage_id] = stage_def
-                        continue
-
-                    # Merge included data with any extra fields (except $include)
-                    merged = dict(included_data)
-                    for key, value in stage_def.items():
-                        if key != "$include":
-                            merged[key] = value
-
-                    resolved_stages[stage_id] = merged
-
+                    )
+                    resolved_stages[stage_id] = stage_def
                 except Exception as e:
                     errors.append(
                         LoadError(
@@ -0,0 +1,120 @@
+"""
+Fast document parsing for process and element files.
+
+Loading only needs plain data, so the default path uses ruamel's safe loader,
+which is backed by libyaml when ``ruamel.yaml.clib`` is installed and falls
+back to the pure-Python safe loader otherwise. Both keep YAML 1.2 semantics.
+The slower round-trip loader is used only when the caller needs comments and
+formatting preserved for editing. Content that is JSON is parsed with the
+standard library ``json`` module, which is much faster than any YAML loader.
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from ruamel.yaml import YAML
+
+from stageflow.models import FileFormat
+
+try:  # pragma: no cover - depends on the installed ruamel build
+    from ruamel.yaml import cyaml as _cyaml
+except ImportError:  # pragma: no cover
+    _cyaml = None
+
+HAS_LIBYAML = getattr(_cyaml, "CParser", None) is not None
+
+_local = threading.local()
+
+
+def yaml_backend() -> str:
+    """Name of the YAML implementation used by the fast path."""
+    return "libyaml" if HAS_LIBYAML else "pure-python"
+
+
+def _safe_yaml() -> YAML:
+    """Per-thread safe loader (YAML instances are not thread-safe)."""
+    parser = getattr(_local, "safe_yaml", None)
+    if parser is None:
+        parser = YAML(typ="safe")
+        _local.safe_yaml = parser
+    return parser
+
+
+def _looks_like_json(text: str) -> bool:
+    stripped = text.lstrip()
+    return stripped.startswith(("{", "["))
+
+
+class _DuplicateKeyError(ValueError):
+    """Raised by the JSON fast path so YAML reports the duplicate key."""
+
+
+def _unique_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """``object_pairs_hook`` rejecting duplicate keys (json keeps the last)."""
+    data = dict(pairs)
+    if len(data) != len(pairs):
+        raise _DuplicateKeyError("duplicate key")
+    return data
+
+
+def parse_document(
+    content: str | bytes,
+    file_format: FileFormat | None = None,
+    round_trip: bool = False,
+) -> Any:
+    """
+    Parse YAML or JSON content with the fastest suitable loader.
+
+    Args:
+        content: Document text (bytes are decoded as UTF-8)
+        file_format: Known format; JSON is parsed strictly with ``json``.
+            For YAML or unknown formats, content that looks like JSON is
+            tried with ``json`` first and falls back to YAML, which also
+            takes over on duplicate keys so they fail as they do in YAML.
+        round_trip: Preserve comments and formatting (ruamel round-trip
+            loader). Only needed when the data will be edited and saved.
+
+    Returns:
+        Parsed data
+
+    Raises:
+        json.JSONDecodeError: If ``file_format`` is JSON and parsing fails
+        ruamel.yaml.YAMLError: If YAML parsing fails
+        ruamel.yaml.constructor.DuplicateKeyError: If a YAML (or unknown
+            format) mapping repeats a key
+    """
+    text = content.decode("utf-8") if isinstance(content, bytes) else content
+
+    if file_format == FileFormat.JSON:
+        return json.loads(text)
+
+    if round_trip:
+        return YAML().load(text)
+
+    if _looks_like_json(text):
+        try:
+            return json.loads(text, object_pairs_hook=_unique_pairs)
+        except ValueError:
+            # Flow-style YAML, invalid JSON or a duplicate key - let the YAML
+            # parser decide
+            pass
+
+    return _safe_yaml().load(text)
+
+
+def load_document(path: str | Path, round_trip: bool = False) -> Any:
+    """
+    Read and parse a YAML/JSON file, using its extension as a format hint.
+
+    Args:
+        path: File to load
+        round_trip: Preserve comments and formatting for editing
+
+    Returns:
+        Parsed data
+    """
+    path = Path(path)
+    file_format = FileFormat.JSON if path.suffix.lower() == ".json" else None
+    return parse_document(path.read_bytes(), file_format, round_trip=round_trip)
@@ -1,7 +1,11 @@
 """Lock types and validation logic for StageFlow."""
 
+import threading
+import weakref
 from abc import ABC, abstractmethod
+from collections.abc import Hashable
 from dataclasses import dataclass, field
+from enum import Enum
 from typing import Any, cast
 
 from stageflow.elements import Element
@@ -13,6 +17,7 @@ from stageflow.models import (
     LockDefinitionDict,
     LockMetaData,
     LockType,
+    MemberSet,
     SpecialLockType,
 )
 
@@ -82,6 +87,57 @@ class LockResult:
 # LockMetaData, LockDefinitionDict, LockShorthandDict, and ConditionalLockDict
 # are now imported from stageflow.models above
 
+# Canonical, hashable description of what a lock checks (nested tuples)
+LockFingerprint = tuple
+
+
+# Scalars compared by value within their own type (bool is not an int here)
+_PLAIN_SCALARS = (type(None), bool, int, float, str)
+
+
+def _canonical(value: Any, strict: bool = False) -> Hashable:
+    """
+    Type-tagged, order-independent form of a definition value.
+
+    Values that only differ in type (``1``, ``1.0`` and ``True``, or a date
+    and its ISO string) get different forms. Enum members stand for their
+    value. Other objects are tagged with their type and ``repr``.
+
+    Args:
+        value: Definition value (scalar, list, tuple, set or dict)
+        strict: Raise TypeError for values that aren't plain JSON-like data
+
+    Returns:
+        Hashable canonical form
+    """
+    if isinstance(value, Enum):
+        return _canonical(value.value, strict)
+    if type(value) in _PLAIN_SCALARS:
+        return (type(value).__name__, value)
+    if isinstance(value, dict):
+        items = [
+            (_canonical(key, strict), _canonical(item, strict))
+            for key, item in value.items()
+        ]
+        return ("dict", tuple(sorted(items, key=repr)))
+    if isinstance(value, list | tuple):
+        return (
+            type(value).__name__,
+            tuple(_canonical(item, strict) for item in value),
+        )
+    if isinstance(value, set | frozenset):
+        return ("set", frozenset(_canonical(item, strict) for item in value))
+    if strict:
+        raise TypeError(f"Value of type {type(value).__name__} has no canonical form")
+    return (type(value).__qualname__, repr(value))
+
+
+def _canonical_value(value: Any) -> Hashable:
+    """Order-independent, type-tagged form of an expected value or metadata."""
+    if value is None:
+        return None
+    return _canonical(value)
+
 
 class BaseLock(ABC):
     """
@@ -97,15 +153,22 @@ class BaseLock(ABC):
     This class defines abstract methods that all locks must implement.
     SimpleLock and ConditionalLock both implement these in their own ways.
 
+    Locks are immutable once built: LockFactory shares a single instance
+    between all identical lock definitions.
+
     Attributes:
         property_path: Path to the property being validated
         lock_type: Type of lock validation to perform
+        fingerprint: Canonical hashable form of the lock's condition, computed
+            once at construction; equal for locks that check the same thing
+            (custom error messages are not part of it)
     """
 
     # Type hints for attributes (not enforced as abstract to allow
     # SimpleLock to use instance attributes and ConditionalLock to use properties)
     property_path: str
     lock_type: LockType
+    fingerprint: LockFingerprint
 
     @abstractmethod
     def validate(self, element: Element) -> "LockResult":
@@ -169,16 +232,33 @@ class SimpleLock(BaseLock):
         self.expected_value = config.get("expected_value")
         self.metadata = config.get("metadata", {}) or {}
         self.custom_error_message = config.get("error_message")
+        self._lock_meta = LockMetaData(
+            expected_value=self.expected_value,
+            min_value=self.metadata.get("min_value"),
+            max_value=self.metadata.get("max_value"),
+        )
+        if self.lock_type in (LockType.IN_LIST, LockType.NOT_IN_LIST) and isinstance(
+            self.expected_value, list | tuple | set
+        ):
+            self._lock_meta["members"] = MemberSet(self.expected_value)
+        elif self.lock_type == LockType.CONTAINS:
+            self._lock_meta["expected_text"] = str(self.expected_value)
+        lock_type_name = (
+            self.lock_type.value
+            if isinstance(self.lock_type, LockType)
+            else self.lock_type
+        )
+        self.fingerprint = (
+            lock_type_name,
+            self.property_path,
+            _canonical_value(self.expected_value),
+            _canonical_value(self.metadata) if self.metadata else None,
+        )
 
     def validate(self, element: "Element") -> LockResult:
         try:
             value = element.get_property(self.property_path)
-            lock_meta = LockMetaData(
-                expected_value=self.expected_value,
-                min_value=self.metadata.get("min_value"),
-                max_value=self.metadata.get("max_value"),
-            )
-            is_valid = self.lock_type.validate(value, lock_meta)
+            is_valid = self.lock_type.validate(value, self._lock_meta)
 
             # Generate error message: use custom if provided, otherwise generate
             if is_valid:
@@ -214,13 +294,23 @@ class SimpleLock(BaseLock):
                 error_message=error_message,
             )
 
+    def accepts(self, value: Any) -> bool:
+        """Check a property value directly (errors count as failures)."""
+        try:
+            return self.lock_type.validate(value, self._lock_meta)
+        except Exception:
+            return False
+
     def to_dict(self) -> dict[str, Any]:
         """Convert lock to JSON-serializable dictionary."""
-        return {
+        result = {
             "property_path": self.property_path,
             "type": self.lock_type.value if isinstance(self.lock_type, LockType) else self.lock_type,
             "expected_value": self.expected_value,
         }
+        if self.metadata:
+            result["metadata"] = self.metadata
+        return result
 
     def get_properties(self) -> list[ExtractedProperty]:
         """Return properties evaluated by this lock with inferred types."""
@@ -334,6 +424,12 @@ class ConditionalLock(BaseLock):
         self.then_locks = then_locks
         self.else_locks = else_locks or []
         self.max_depth = max_depth
+        self.fingerprint = (
+            LockType.CONDITIONAL.value,
+            frozenset(lock.fingerprint for lock in self.if_locks),
+            frozenset(lock.fingerprint for lock in self.then_locks),
+            frozenset(lock.fingerprint for lock in self.else_locks),
+        )
 
     @property
     def property_path(self) -> str:
@@ -500,6 +596,14 @@ class OrLogicLock(BaseLock):
 
         self.condition_groups = condition_groups
         self.short_circuit = short_circuit
+        # Groups are AND-ed locks; evaluation order only affects reporting
+        self.fingerprint = (
+            LockType.OR_LOGIC.value,
+            tuple(
+                frozenset(lock.fingerprint for lock in group)
+                for group in condition_groups
+            ),
+        )
 
     @property
     def property_path(self) -> str:
@@ -644,18 +748,70 @@ LockShorhands = {
 }
 
 
+# Process-wide table of live locks by definition, so identical definitions
+# (e.g. the same ``exists: email`` in thousands of gates) share one instance.
+# Entries go away with the last gate using them.
+_interned_locks: "weakref.WeakValueDictionary[Hashable, BaseLock]" = (
+    weakref.WeakValueDictionary()
+)
+_interned_locks_guard = threading.Lock()
+
+
 class LockFactory:
     """
     Factory for creating Lock instances from various syntax formats.
 
     Supports simplified shorthand syntax for common lock patterns while
     maintaining backward compatibility with verbose lock definitions.
+
+    Locks are interned: creating a lock from a definition identical to one
+    of a live lock returns that lock instead of building a new one.
     """
 
     SHORTHAND_KEYS = ["exists", "is_true", "is_false"]
 
     @classmethod
     def create(cls, lock_definition: LockDefinition) -> BaseLock:
+        """
+        Create (or reuse) the lock for a configuration.
+
+        Args:
+            lock_definition: Lock configuration dictionary
+
+        Returns:
+            Shared BaseLock instance for this definition
+
+        Raises:
+            ValueError: If configuration is invalid
+        """
+        try:
+            key = _canonical(lock_definition, strict=True)
+        except TypeError:
+            # Holds values other than plain data (e.g. dates): don't share
+            return cls._build(lock_definition)
+
+        with _interned_locks_guard:
+            lock = _interned_locks.get(key)
+        if lock is None:
+            built = cls._build(lock_definition)
+            with _interned_locks_guard:
+                lock = _interned_locks.setdefault(key, built)
+        return lock
+
+    @classmethod
+    def interned_count(cls) -> int:
+        """Number of distinct live locks in the interning table."""
+        with _interned_locks_guard:
+            return len(_interned_locks)
+
+    @classmethod
+    def clear_interned(cls) -> None:
+        """Forget interned locks (existing instances stay valid)."""
+        with _interned_locks_guard:
+            _interned_locks.clear()
+
+    @classmethod
+    def _build(cls, lock_definition: LockDefinition) -> BaseLock:
         """
         Create appropriate lock type from configuration.
 
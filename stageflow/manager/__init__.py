@@ -20,7 +20,13 @@ from .config import (
     ManagerConfigDict,
     ProcessFileFormat,
 )
-from .editor import ProcessEditor, ProcessEditorError, ValidationFailedError
+from .editor import (
+    ProcessEditor,
+    ProcessEditorError,
+    TransactionReport,
+    ValidationFailedError,
+)
+from .index import RegistryIndex, RegistryIndexEntry, get_shared_registry_index
 from .manager import (
     ProcessManager,
     ProcessManagerError,
@@ -28,7 +34,14 @@ from .manager import (
     ProcessSyncError,
     ProcessValidationError,
 )
-from .registry import ProcessRegistry, ProcessRegistryError
+from .process_cache import ProcessCache, get_shared_process_cache
+from .registry import (
+    ProcessRegistry,
+    ProcessRegistryError,
+    ProcessScanResult,
+    summarize_process,
+)
+from .watcher import ProcessWatcher, ReloadEvent, ReloadEventType
 
 __all__ = [
     # Configuration
@@ -40,9 +53,21 @@ __all__ = [
     "ProcessEditor",
     "ProcessEditorError",
     "ValidationFailedError",
+    "TransactionReport",
     # Registry
     "ProcessRegistry",
     "ProcessRegistryError",
+    "ProcessScanResult",
+    "summarize_process",
+    "RegistryIndex",
+    "RegistryIndexEntry",
+    "get_shared_registry_index",
+    "ProcessCache",
+    "get_shared_process_cache",
+    # Hot reload
+    "ProcessWatcher",
+    "ReloadEvent",
+    "ReloadEventType",
     # Manager
     "ProcessManager",
     "ProcessManagerError",
@@ -23,6 +23,15 @@ ENV_BACKUP_ENABLED: Final[str] = f"{ENV_VAR_PREFIX}BACKUP_ENABLED"
 ENV_BACKUP_DIR: Final[str] = f"{ENV_VAR_PREFIX}BACKUP_DIR"
 ENV_MAX_BACKUPS: Final[str] = f"{ENV_VAR_PREFIX}MAX_BACKUPS"
 
+# Compiled process cache settings
+ENV_CACHE_ENABLED: Final[str] = f"{ENV_VAR_PREFIX}CACHE_ENABLED"
+ENV_CACHE_DIR: Final[str] = f"{ENV_VAR_PREFIX}CACHE_DIR"
+ENV_PROCESS_CACHE_SIZE: Final[str] = f"{ENV_VAR_PREFIX}PROCESS_CACHE_SIZE"
+ENV_PERSIST_INDEX: Final[str] = f"{ENV_VAR_PREFIX}PERSIST_INDEX"
+
+# Trusted artifact settings
+ENV_ARTIFACT_KEY: Final[str] = f"{ENV_VAR_PREFIX}ARTIFACT_KEY"
+
 # Validation settings
 ENV_STRICT_VALIDATION: Final[str] = f"{ENV_VAR_PREFIX}STRICT_VALIDATION"
 ENV_AUTO_FIX_PERMISSIONS: Final[str] = f"{ENV_VAR_PREFIX}AUTO_FIX_PERMISSIONS"
@@ -39,6 +48,10 @@ DEFAULT_BACKUP_ENABLED: Final[bool] = False
 DEFAULT_MAX_BACKUPS: Final[int] = 5
 DEFAULT_STRICT_VALIDATION: Final[bool] = True
 DEFAULT_AUTO_FIX_PERMISSIONS: Final[bool] = True
+DEFAULT_CACHE_ENABLED: Final[bool] = False
+DEFAULT_CACHE_DIR: Final[str] = "~/.cache/stageflow"
+DEFAULT_PROCESS_CACHE_SIZE: Final[int] = 128
+DEFAULT_PERSIST_INDEX: Final[bool] = False
 
 
 # =============================================================================
@@ -159,6 +172,37 @@ def get_max_backups() -> int:
     return get_env_int(ENV_MAX_BACKUPS, DEFAULT_MAX_BACKUPS)
 
 
+def get_cache_enabled() -> bool:
+    """Get compiled process cache flag from environment or default."""
+    return get_env_bool(ENV_CACHE_ENABLED, DEFAULT_CACHE_ENABLED)
+
+
+def get_cache_dir() -> str:
+    """Get compiled process cache directory.
+
+    Precedence: STAGEFLOW_CACHE_DIR, then $XDG_CACHE_HOME/stageflow,
+    then ~/.cache/stageflow.
+    """
+    xdg_cache = os.getenv("XDG_CACHE_HOME")
+    default = os.path.join(xdg_cache, "stageflow") if xdg_cache else DEFAULT_CACHE_DIR
+    return get_env_str(ENV_CACHE_DIR, default)
+
+
+def get_process_cache_size() -> int:
+    """Get in-memory registry process cache capacity (0 disables it)."""
+    return max(0, get_env_int(ENV_PROCESS_CACHE_SIZE, DEFAULT_PROCESS_CACHE_SIZE))
+
+
+def get_persist_index() -> bool:
+    """Get whether ``@name`` loads may write the registry index file."""
+    return get_env_bool(ENV_PERSIST_INDEX, DEFAULT_PERSIST_INDEX)
+
+
+def get_artifact_key() -> str | None:
+    """Get the key used to verify trusted process artifacts, if configured."""
+    return os.getenv(ENV_ARTIFACT_KEY) or None
+
+
 def get_strict_validation() -> bool:
     """Get strict validation flag from environment or default."""
     return get_env_bool(ENV_STRICT_VALIDATION, DEFAULT_STRICT_VALIDATION)
@@ -192,6 +236,18 @@ Backup Settings:
   STAGEFLOW_MAX_BACKUPS         - Maximum backup files to keep
                                   Default: 5
 
+Compiled Process Cache:
+  STAGEFLOW_CACHE_ENABLED       - Cache parsed/analyzed processes on disk: true|false
+                                  Default: false
+  STAGEFLOW_CACHE_DIR           - Cache directory
+                                  Default: $XDG_CACHE_HOME/stageflow or ~/.cache/stageflow
+  STAGEFLOW_PROCESS_CACHE_SIZE  - Registry processes kept in memory for @name loads (0 disables)
+                                  Default: 128
+
+Trusted Artifacts:
+  STAGEFLOW_ARTIFACT_KEY        - Key verifying signed artifacts for trusted fast loads
+                                  Default: unset
+
 Validation Settings:
   STAGEFLOW_STRICT_VALIDATION   - Enable strict validation: true|false
                                   Default: true
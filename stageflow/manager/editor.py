@@ -1,8 +1,14 @@
-"""ProcessEditor for safe in-memory process mutations with backup/rollback mechanism."""
+"""ProcessEditor for safe in-memory process mutations with snapshots, rollback and undo."""
 
 import copy
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Any
 
+from ..models import AnalysisMode
 from ..process import ConsistencyIssue, Process, ProcessDefinition
 from ..stage import StageDefinition
 
@@ -21,28 +27,62 @@ class ValidationFailedError(ProcessEditorError):
         self.issues = issues
 
 
+@dataclass
+class TransactionReport:
+    """Outcome and analysis cost of an editor transaction.
+
+    Filled in when the transaction block exits.
+
+    Fields:
+        operations: Mutations applied inside the transaction
+        committed: Whether the changes became the current version
+        analysis_runs: Analysis passes run for the transaction (0 or 1)
+        analysis_seconds: Wall time spent in analysis at commit
+        stages_analyzed: Stages whose checks were computed, i.e. not served
+            from the analysis cache
+        issues: Issues of the final working copy
+    """
+
+    operations: int = 0
+    committed: bool = False
+    analysis_runs: int = 0
+    analysis_seconds: float = 0.0
+    stages_analyzed: int = 0
+    issues: list[ConsistencyIssue] = field(default_factory=list)
+
+
 class ProcessEditor:
     """
-    Safe in-memory process editor with backup/rollback mechanism.
+    Safe in-memory process editor with snapshots, rollback and undo/redo.
 
-    Provides safe editing capabilities for Process objects by maintaining
-    backups and automatically rolling back changes that would result in
-    invalid process configurations.
+    Provides safe editing capabilities for Process objects. Each edit is
+    applied to a structural copy of the current version (see
+    ``Process.copy``) that shares every untouched stage with it; the copy only
+    becomes current if it passes validation. Committed versions are never
+    mutated, so a snapshot is a reference, rollback is a pointer swap and the
+    undo/redo history only costs memory for the stages each edit changed.
 
     Key features:
-    - Backup/rollback mechanism for safe editing
+    - Copy-on-write edits: the process passed in is never modified
     - Dirty flag tracking for change detection
     - Automatic rollback on validation failures
+    - Undo/redo history of committed edits
+    - Transactions: batches of edits validated once, all-or-nothing
     - Integration with existing Process consistency validation
     - In-memory only operations until explicit sync
+    - Incremental re-analysis: per-stage analyzer results are cached by stage
+      fingerprint, so an edit only re-analyzes the stages it touched
     """
 
-    def __init__(self, process: Process):
+    DEFAULT_HISTORY_LIMIT = 100
+
+    def __init__(self, process: Process, history_limit: int = DEFAULT_HISTORY_LIMIT):
         """
         Initialize ProcessEditor with a Process object.
 
         Args:
             process: The Process instance to edit
+            history_limit: Maximum number of versions kept for undo
 
         Raises:
             ProcessEditorError: If the initial process has consistency issues
@@ -52,52 +92,143 @@ class ProcessEditor:
         # Validation occurs during save operations instead
 
         self._process = process
-        self._backup: ProcessDefinition | None = None
+        # Shared with every process version this editor creates
+        self._analysis_cache = process.analysis_cache
+        self._history_limit = history_limit
+        self._undo: deque[Process] = deque(maxlen=history_limit)
+        self._redo: list[Process] = []
+        self._baseline = process
         self._dirty = False
-        self._create_backup()
+        self._working: Process | None = None
+        self._report: TransactionReport | None = None
 
     def _create_backup(self) -> None:
-        """Create a deep copy backup of the current process configuration."""
-        self._backup = copy.deepcopy(self._process.to_dict())
+        """Make the current version the baseline restored by rollback()."""
+        self._baseline = self._process
         self._dirty = False
 
     def _restore_backup(self) -> None:
-        """Restore process from backup configuration."""
-        if self._backup is None:
-            raise ProcessEditorError("No backup available for restore operation")
-
-        # Reconstruct process from backup
-        self._process = Process(self._backup)
+        """Make the baseline version current again."""
+        if self._process is not self._baseline:
+            self._push_version(self._baseline)
         self._dirty = False
 
-    def _validate_and_commit(self) -> None:
+    def _push_version(self, process: Process) -> None:
+        """Make a version current, recording the previous one for undo."""
+        self._undo.append(self._process)
+        self._redo.clear()
+        self._process = process
+
+    def _working_copy(self) -> Process:
+        """Copy of the current version that an edit may mutate.
+
+        Inside a transaction every edit mutates the transaction's copy.
         """
-        Validate current process state and commit changes.
+        if self._working is not None:
+            return self._working
+        return self._process.copy()
+
+    def _ensure_no_transaction(self, operation: str) -> None:
+        if self._working is not None:
+            raise ProcessEditorError(f"Cannot {operation} inside a transaction")
+
+    def _validate_and_commit(self, working: Process) -> None:
+        """
+        Validate an edited working copy and make it the current version.
+
+        Inside a transaction validation is deferred to the commit.
 
         Raises:
-            ValidationFailedError: If validation fails, automatic rollback occurs
+            ValidationFailedError: If validation fails; the working copy is
+                discarded and the current version stays unchanged
         """
-        # Re-run analysis to update issues
-        self._process.reanalyze()
+        if self._report is not None:
+            self._report.operations += 1
+            return
 
-        if not self._process.is_valid:
-            issues = self._process.issues
-            # Automatic rollback on validation failure
-            self._restore_backup()
+        # Re-run analysis unless the mutation already refreshed it
+        if not working.issues_current:
+            working.reanalyze()
+
+        if not working.is_valid:
+            issues = working.issues
             raise ValidationFailedError(
                 f"Process validation failed, changes rolled back. Issues: "
                 f"{[issue.description for issue in issues]}",
                 issues,
             )
 
-        # If validation passes, update dirty flag
+        # If validation passes, the working copy becomes the current version
+        self._push_version(working)
         self._dirty = True
 
     @property
     def process(self) -> Process:
-        """Get the current process being edited."""
+        """Get the current process being edited.
+
+        Inside a transaction this is the transaction's uncommitted copy.
+        """
+        if self._working is not None:
+            return self._working
         return self._process
 
+    @property
+    def in_transaction(self) -> bool:
+        """Check if a transaction is open."""
+        return self._working is not None
+
+    @contextmanager
+    def transaction(self) -> Iterator[TransactionReport]:
+        """
+        Apply a batch of edits with a single validation at commit.
+
+        Edits inside the block mutate one working copy with analysis turned
+        off. When the block exits normally the copy is analyzed once and, if
+        valid, becomes the current version (a single undo step). If the block
+        raises, or the result is invalid, none of the edits are applied.
+
+        Yields:
+            TransactionReport, filled in when the block exits
+
+        Raises:
+            ProcessEditorError: If a transaction is already open
+            ValidationFailedError: If the edited process fails validation
+        """
+        self._ensure_no_transaction("open a transaction")
+        working = self._process.copy()
+        mode = working.analysis_mode
+        working.analysis_mode = AnalysisMode.OFF
+        report = TransactionReport()
+        self._working = working
+        self._report = report
+        try:
+            yield report
+        finally:
+            self._working = None
+            self._report = None
+        if report.operations == 0:
+            return
+
+        working.analysis_mode = mode
+        cache = working.analysis_cache
+        misses = cache.stats.misses
+        start = time.perf_counter()
+        issues = working.reanalyze()
+        report.analysis_seconds = time.perf_counter() - start
+        report.analysis_runs = 1
+        report.stages_analyzed = cache.stats.misses - misses
+        report.issues = issues
+
+        if not working.is_valid:
+            raise ValidationFailedError(
+                f"Process validation failed, transaction rolled back. Issues: "
+                f"{[issue.description for issue in issues]}",
+                issues,
+            )
+        self._push_version(working)
+        self._dirty = True
+        report.committed = True
+
     @property
     def is_dirty(self) -> bool:
         """Check if the process has unsaved changes."""
@@ -110,7 +241,7 @@ class ProcessEditor:
     @property
     def consistency_issues(self) -> list[ConsistencyIssue]:
         """Get current consistency issues in the process."""
-        return self._process.issues
+        return self.process.issues
 
     def add_stage(self, stage_id: str, config: StageDefinition) -> None:
         """
@@ -124,17 +255,18 @@ class ProcessEditor:
             ProcessEditorError: If stage_id already exists
             ValidationFailedError: If adding stage creates consistency issues
         """
-        if self._process.get_stage(stage_id) is not None:
+        if self.process.get_stage(stage_id) is not None:
             raise ProcessEditorError(f"Stage '{stage_id}' already exists in process")
 
         try:
-            self._process.add_stage(stage_id, config)
-            self._validate_and_commit()
+            working = self._working_copy()
+            # The new definition becomes a shared, never-mutated stage node
+            working.add_stage(stage_id, copy.deepcopy(config))
+            self._validate_and_commit(working)
         except Exception as e:
             if isinstance(e, ValidationFailedError):
                 raise
-            # Rollback on any other error
-            self._restore_backup()
+            # The working copy is discarded; the current version is unchanged
             raise ProcessEditorError(
                 f"Failed to add stage '{stage_id}': {str(e)}"
             ) from e
@@ -150,24 +282,24 @@ class ProcessEditor:
             ProcessEditorError: If stage doesn't exist or is initial/final stage
             ValidationFailedError: If removing stage creates consistency issues
         """
-        stage = self._process.get_stage(stage_id)
+        stage = self.process.get_stage(stage_id)
         if stage is None:
             raise ProcessEditorError(f"Stage '{stage_id}' not found in process")
 
-        if stage_id == self._process.initial_stage._id:
+        if stage_id == self.process.initial_stage._id:
             raise ProcessEditorError("Cannot remove initial stage from process")
 
-        if stage_id == self._process.final_stage._id:
+        if stage_id == self.process.final_stage._id:
             raise ProcessEditorError("Cannot remove final stage from process")
 
         try:
-            self._process.remove_stage(stage_id)
-            self._validate_and_commit()
+            working = self._working_copy()
+            working.remove_stage(stage_id)
+            self._validate_and_commit(working)
         except Exception as e:
             if isinstance(e, ValidationFailedError):
                 raise
-            # Rollback on any other error
-            self._restore_backup()
+            # The working copy is discarded; the current version is unchanged
             raise ProcessEditorError(
                 f"Failed to remove stage '{stage_id}': {str(e)}"
             ) from e
@@ -184,40 +316,20 @@ class ProcessEditor:
             ProcessEditorError: If stage doesn't exist
             ValidationFailedError: If update creates consistency issues
         """
-        if self._process.get_stage(stage_id) is None:
+        if self.process.get_stage(stage_id) is None:
             raise ProcessEditorError(f"Stage '{stage_id}' not found in process")
 
         try:
-            # Remove and re-add with new configuration
-            # First check if it's initial or final stage
-            is_initial = stage_id == self._process.initial_stage._id
-            is_final = stage_id == self._process.final_stage._id
-
-            if is_initial or is_final:
-                # For initial/final stages, we need to be more careful
-                # Store the old stage data before removal
-                old_stage = self._process.get_stage(stage_id)
-                if old_stage is None:
-                    raise ProcessEditorError(f"Stage '{stage_id}' not found")
-
-                # Update the stage in place by reconstructing the entire process
-                current_config = self._process.to_dict()
-                current_config["stages"][stage_id] = config
-
-                # Reconstruct process with updated configuration
-                self._process = Process(current_config)
-                self._validate_and_commit()
-            else:
-                # For non-initial/final stages, use remove and add
-                self._process.remove_stage(stage_id)
-                self._process.add_stage(stage_id, config)
-                self._validate_and_commit()
+            # Swap the stage in the copy (initial/final roles are kept), so
+            # only this stage is re-analyzed
+            working = self._working_copy()
+            working.replace_stage(stage_id, copy.deepcopy(config))
+            self._validate_and_commit(working)
 
         except Exception as e:
             if isinstance(e, ValidationFailedError):
                 raise
-            # Rollback on any other error
-            self._restore_backup()
+            # The working copy is discarded; the current version is unchanged
             raise ProcessEditorError(
                 f"Failed to update stage '{stage_id}': {str(e)}"
             ) from e
@@ -234,38 +346,77 @@ class ProcessEditor:
             ProcessEditorError: If either stage doesn't exist
             ValidationFailedError: If transition creates consistency issues
         """
-        if self._process.get_stage(from_stage) is None:
+        if self.process.get_stage(from_stage) is None:
             raise ProcessEditorError(
                 f"Source stage '{from_stage}' not found in process"
             )
 
-        if self._process.get_stage(to_stage) is None:
+        if self.process.get_stage(to_stage) is None:
             raise ProcessEditorError(f"Target stage '{to_stage}' not found in process")
 
         try:
-            self._process.add_transition(from_stage, to_stage)
-            self._validate_and_commit()
+            working = self._working_copy()
+            working.add_transition(from_stage, to_stage)
+            self._validate_and_commit(working)
         except Exception as e:
             if isinstance(e, ValidationFailedError):
                 raise
-            # Rollback on any other error
-            self._restore_backup()
+            # The working copy is discarded; the current version is unchanged
             raise ProcessEditorError(
                 f"Failed to add transition '{from_stage}' -> '{to_stage}': {str(e)}"
             ) from e
 
     def rollback(self) -> None:
         """
-        Manually rollback all changes to the last backup.
+        Manually rollback all changes to the last baseline.
 
         This restores the process to its state when the editor was created
-        or when sync() was last called.
+        or when sync() was last called. The rollback itself can be undone.
         """
+        self._ensure_no_transaction("roll back")
         self._restore_backup()
 
+    @property
+    def can_undo(self) -> bool:
+        """Check if there is a previous version to return to."""
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        """Check if there is an undone version to re-apply."""
+        return bool(self._redo)
+
+    def undo(self) -> None:
+        """
+        Return to the version before the last committed edit (or rollback).
+
+        Raises:
+            ProcessEditorError: If there is nothing to undo
+        """
+        self._ensure_no_transaction("undo")
+        if not self._undo:
+            raise ProcessEditorError("Nothing to undo")
+        self._redo.append(self._process)
+        self._process = self._undo.pop()
+        self._dirty = self._process is not self._baseline
+
+    def redo(self) -> None:
+        """
+        Re-apply the last undone version.
+
+        Raises:
+            ProcessEditorError: If there is nothing to redo
+        """
+        self._ensure_no_transaction("redo")
+        if not self._redo:
+            raise ProcessEditorError("Nothing to redo")
+        self._undo.append(self._process)
+        self._process = self._redo.pop()
+        self._dirty = self._process is not self._baseline
+
     def sync(self) -> None:
         """
-        Synchronize changes by creating a new backup.
+        Synchronize changes by making the current version the new baseline.
 
         This makes the current state the new baseline and clears the dirty flag.
         Call this after you're satisfied with the current changes and want to
@@ -274,6 +425,7 @@ class ProcessEditor:
         Raises:
             ValidationFailedError: If current state has consistency issues
         """
+        self._ensure_no_transaction("sync")
         if not self._process.is_valid:
             issues = self._process.issues
             raise ValidationFailedError(
@@ -292,8 +444,8 @@ class ProcessEditor:
             Tuple of (is_valid, list of consistency issues)
         """
         # Re-run analysis to get latest state
-        self._process.reanalyze()
-        return self._process.is_valid, self._process.issues
+        self.process.reanalyze()
+        return self.process.is_valid, self.process.issues
 
     def get_process_definition(self) -> ProcessDefinition:
         """
@@ -302,7 +454,7 @@ class ProcessEditor:
         Returns:
             ProcessDefinition dictionary representing current state
         """
-        return self._process.to_dict()
+        return self.process.to_dict()
 
     def __enter__(self) -> "ProcessEditor":
         """Context manager entry."""
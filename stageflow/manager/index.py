@@ -0,0 +1,471 @@
+"""
+Registry Index Module
+
+Persistent metadata index for a process registry directory.
+
+The index maps each process name to its file and records the file's stat
+information, content hash and a summary of the loaded process (stage count,
+validity, issue count). It is stored as JSON in the processes directory and
+refreshed incrementally:
+
+- Names and paths are rescanned only when the directory's mtime changes
+  (files added, removed or renamed)
+- Per-file metadata is rechecked with a single ``stat`` call
+- Summaries are recomputed only for files whose content hash changed, or
+  when a file pulled in through ``$include`` changed (included files are
+  rechecked the same way: ``stat`` first, content hash when that differs)
+
+Directory mtimes have coarse granularity, so a listing taken within
+``RACY_WINDOW_NS`` of the directory's last change is not trusted and the
+directory is rescanned on the next lookup. Writing the index file changes
+the directory's mtime too; that change alone does not trigger a rescan.
+The stored index records the directory mtime its listing matches, so a new
+index (another run, another registry) trusts the listing without a rescan.
+
+One index per directory is shared through get_shared_registry_index().
+"""
+
+import json
+import os
+import stat
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any
+
+from stageflow.loader.cache import hash_bytes
+
+INDEX_FILE_NAME = ".stageflow-index.json"
+
+# Bump whenever the index layout or the meaning of stored data changes
+INDEX_FORMAT_VERSION = 2
+
+# Extension precedence when several files share a process name
+PROCESS_EXTENSIONS: tuple[str, ...] = (".yaml", ".yml", ".json")
+
+RACY_WINDOW_NS = 2_000_000_000
+
+# Written as a fixed-width placeholder and patched in place once the index
+# file is in the directory, since that write itself changes the directory
+# mtime and rewriting a file's content does not
+_SAVED_MTIME_FIELD = '"saved_dir_mtime_ns":"'
+_SAVED_MTIME_WIDTH = 20
+
+# (mtime_ns, size, content hash) of an included file
+IncludeState = tuple[int, int, str]
+
+
+def include_state(path: str | Path) -> IncludeState | None:
+    """Stat and hash an included file (None if it cannot be read)."""
+    try:
+        st = os.stat(path)
+        content = Path(path).read_bytes()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, hash_bytes(content))
+
+
+def _recheck_includes(
+    includes: dict[str, IncludeState | None],
+) -> tuple[dict[str, IncludeState | None], bool]:
+    """Re-stat included files, hashing only those whose stat changed.
+
+    Returns the refreshed states and whether any content changed.
+    """
+    updated: dict[str, IncludeState | None] = {}
+    changed = False
+    for path, recorded in includes.items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            updated[path] = None
+            changed = changed or recorded is not None
+            continue
+        if recorded is not None and (st.st_mtime_ns, st.st_size) == recorded[:2]:
+            updated[path] = recorded
+            continue
+        state = include_state(path)
+        updated[path] = state
+        if state is None or recorded is None or state[2] != recorded[2]:
+            changed = True
+    return updated, changed
+
+
+@dataclass(frozen=True)
+class RegistryIndexEntry:
+    """Indexed metadata for one registry process file."""
+
+    name: str
+    file_path: Path
+    mtime_ns: int
+    size: int
+    ctime: float
+    content_hash: str | None = None
+    summary: dict[str, Any] | None = None
+    stale: bool = True
+    includes: dict[str, IncludeState | None] = field(default_factory=dict)
+
+    @property
+    def has_summary(self) -> bool:
+        """True if the summary matches the file's current content."""
+        return self.summary is not None and not self.stale
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "file": self.file_path.name,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "ctime": self.ctime,
+            "content_hash": self.content_hash,
+            "summary": self.summary,
+            "stale": self.stale,
+            "includes": {
+                path: list(state) if state is not None else None
+                for path, state in self.includes.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(
+        cls, name: str, directory: Path, data: dict[str, Any]
+    ) -> "RegistryIndexEntry":
+        return cls(
+            name=name,
+            file_path=directory / data["file"],
+            mtime_ns=int(data["mtime_ns"]),
+            size=int(data["size"]),
+            ctime=float(data["ctime"]),
+            content_hash=data.get("content_hash"),
+            summary=data.get("summary"),
+            stale=bool(data.get("stale", True)),
+            includes={
+                path: (int(state[0]), int(state[1]), str(state[2]))
+                if state is not None
+                else None
+                for path, state in (data.get("includes") or {}).items()
+            },
+        )
+
+
+class RegistryIndex:
+    """
+    Incrementally refreshed, optionally persistent index of a registry.
+
+    All methods are thread-safe. Failures to read or write the index file are
+    ignored; the index is then rebuilt from the directory.
+    """
+
+    def __init__(self, processes_dir: str | Path, persist: bool = True):
+        """
+        Initialize index.
+
+        A stored index is always read; ``persist`` only controls writing.
+
+        Args:
+            processes_dir: Registry directory to index
+            persist: Store the index in ``processes_dir/INDEX_FILE_NAME``
+                whenever it changes (see write() for explicit writes)
+        """
+        self.processes_dir = Path(processes_dir)
+        self.index_path = self.processes_dir / INDEX_FILE_NAME
+        self.persist = persist
+        self._lock = threading.RLock()
+        self._entries: dict[str, RegistryIndexEntry] = {}
+        self._dir_mtime_ns: int | None = None
+        # Directory mtime left by our own index write (see save())
+        self._saved_dir_mtime_ns: int | None = None
+        self._scanned_at_ns = 0
+        self._dirty = False
+        self.scans = 0
+        self._read()
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def names(self) -> list[str]:
+        """Sorted process names.
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        with self._lock:
+            self.refresh()
+            return sorted(self._entries)
+
+    def get(self, name: str) -> RegistryIndexEntry | None:
+        """Entry for a process, or None if it is not in the registry."""
+        with self._lock:
+            try:
+                self.refresh()
+            except OSError:
+                return None
+            return self._entries.get(name)
+
+    def stat(self, name: str) -> RegistryIndexEntry | None:
+        """
+        Entry for a process with file metadata re-checked.
+
+        A changed mtime or size marks the stored summary as stale; it is kept
+        so an unchanged content hash can revalidate it without a reload. A
+        changed included file also marks it stale and drops the content hash,
+        since the file itself may be unchanged.
+        """
+        with self._lock:
+            entry = self.get(name)
+            if entry is None:
+                return None
+            try:
+                st = entry.file_path.stat()
+            except OSError:
+                # Removed since the last scan
+                self._entries.pop(name, None)
+                self._dir_mtime_ns = None
+                self._dirty = True
+                return None
+            if st.st_mtime_ns != entry.mtime_ns or st.st_size != entry.size:
+                entry = replace(
+                    entry,
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    ctime=st.st_ctime,
+                    stale=True,
+                )
+                self._entries[name] = entry
+                self._dirty = True
+            if entry.includes:
+                includes, changed = _recheck_includes(entry.includes)
+                if changed:
+                    entry = replace(
+                        entry, includes=includes, content_hash=None, stale=True
+                    )
+                elif includes != entry.includes:
+                    # Touched but not modified
+                    entry = replace(entry, includes=includes)
+                if entry is not self._entries[name]:
+                    self._entries[name] = entry
+                    self._dirty = True
+            return entry
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring names and paths up to date with the directory.
+
+        Only rescans when the directory mtime changed (or is too recent to
+        trust). Entries whose mtime and size are unchanged keep their hash and
+        summary.
+
+        Args:
+            force: Rescan even if the directory looks unchanged
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        with self._lock:
+            dir_mtime_ns = self.processes_dir.stat().st_mtime_ns
+            trusted = (
+                not force
+                and self._dir_mtime_ns is not None
+                and dir_mtime_ns in (self._dir_mtime_ns, self._saved_dir_mtime_ns)
+                and self._scanned_at_ns - self._dir_mtime_ns > RACY_WINDOW_NS
+            )
+            if trusted:
+                return
+
+            scanned_at_ns = time.time_ns()
+            found: dict[str, tuple[int, Path, os.stat_result]] = {}
+            for file_path in self.processes_dir.iterdir():
+                suffix = file_path.suffix.lower()
+                if suffix not in PROCESS_EXTENSIONS:
+                    continue
+                if file_path.name == INDEX_FILE_NAME:
+                    continue
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    continue
+                if not stat.S_ISREG(st.st_mode):
+                    continue
+                rank = PROCESS_EXTENSIONS.index(suffix)
+                current = found.get(file_path.stem)
+                if current is None or rank < current[0]:
+                    found[file_path.stem] = (rank, file_path, st)
+
+            entries: dict[str, RegistryIndexEntry] = {}
+            for name, (_, file_path, st) in found.items():
+                previous = self._entries.get(name)
+                if (
+                    previous is not None
+                    and previous.file_path == file_path
+                    and previous.mtime_ns == st.st_mtime_ns
+                    and previous.size == st.st_size
+                ):
+                    entries[name] = previous
+                    continue
+                entries[name] = RegistryIndexEntry(
+                    name=name,
+                    file_path=file_path,
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    ctime=st.st_ctime,
+                    content_hash=previous.content_hash if previous else None,
+                    summary=previous.summary if previous else None,
+                    stale=True,
+                )
+
+            if entries != self._entries:
+                self._dirty = True
+            self._entries = entries
+            self._dir_mtime_ns = dir_mtime_ns
+            self._saved_dir_mtime_ns = None
+            self._scanned_at_ns = scanned_at_ns
+            self.scans += 1
+            self.save()
+
+    def set_summary(
+        self,
+        name: str,
+        content_hash: str,
+        summary: dict[str, Any] | None,
+        includes: dict[str, IncludeState | None] | None = None,
+    ) -> None:
+        """Record the summary computed for a given file content.
+
+        Args:
+            name: Process name
+            content_hash: Hash of the process file the summary was built from
+            summary: Summary to store
+            includes: States of the included files the summary depends on
+                (keeps the recorded ones if None)
+        """
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is None:
+                return
+            self._entries[name] = replace(
+                entry,
+                content_hash=content_hash,
+                summary=summary,
+                stale=False,
+                includes=entry.includes if includes is None else dict(includes),
+            )
+            self._dirty = True
+
+    def invalidate(self, name: str | None = None) -> None:
+        """Force a rescan on next lookup (and drop one entry's summary)."""
+        with self._lock:
+            self._dir_mtime_ns = None
+            self._saved_dir_mtime_ns = None
+            if name is not None and name in self._entries:
+                self._entries[name] = replace(self._entries[name], stale=True)
+                self._dirty = True
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self) -> bool:
+        """Write the index if it changed and persist is set. Returns True if written."""
+        with self._lock:
+            if not self.persist:
+                return False
+            return self.write()
+
+    def write(self) -> bool:
+        """Write the index if it changed, even if persist is off.
+
+        Returns:
+            True if written
+        """
+        with self._lock:
+            if not self._dirty:
+                return False
+            # Placeholder first, so it sits at a fixed offset
+            payload = json.dumps(
+                {
+                    "format": INDEX_FORMAT_VERSION,
+                    "saved_dir_mtime_ns": "0" * _SAVED_MTIME_WIDTH,
+                    "dir_mtime_ns": self._dir_mtime_ns,
+                    "scanned_at_ns": self._scanned_at_ns,
+                    "entries": {
+                        name: entry.to_dict()
+                        for name, entry in sorted(self._entries.items())
+                    },
+                },
+                separators=(",", ":"),
+            )
+            tmp_path = self.index_path.with_name(
+                f"{self.index_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                before_ns = self.processes_dir.stat().st_mtime_ns
+                tmp_path.write_text(payload, encoding="utf-8")
+                os.replace(tmp_path, self.index_path)
+                after_ns = self.processes_dir.stat().st_mtime_ns
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                return False
+            if before_ns in (self._dir_mtime_ns, self._saved_dir_mtime_ns):
+                # Only our own write changed the directory since the listing
+                # was taken, so the listing stays current
+                self._saved_dir_mtime_ns = after_ns
+                self._stamp_saved_mtime(payload, after_ns)
+            self._dirty = False
+            return True
+
+    def _stamp_saved_mtime(self, payload: str, dir_mtime_ns: int) -> None:
+        """Record the directory mtime left by the write in the stored index."""
+        offset = payload.index(_SAVED_MTIME_FIELD) + len(_SAVED_MTIME_FIELD)
+        try:
+            with self.index_path.open("r+b") as f:
+                f.seek(offset)
+                f.write(f"{dir_mtime_ns:0{_SAVED_MTIME_WIDTH}d}".encode("ascii"))
+        except OSError:
+            pass
+
+    def _read(self) -> None:
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != INDEX_FORMAT_VERSION:
+                return
+            self._entries = {
+                name: RegistryIndexEntry.from_dict(name, self.processes_dir, item)
+                for name, item in data["entries"].items()
+            }
+            # Listing state: refresh() trusts the stored listing while the
+            # directory mtime still matches it
+            self._dir_mtime_ns = int(data.get("dir_mtime_ns") or 0) or None
+            self._saved_dir_mtime_ns = int(data.get("saved_dir_mtime_ns") or 0) or None
+            self._scanned_at_ns = int(data.get("scanned_at_ns") or 0)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            self._entries = {}
+            self._dir_mtime_ns = None
+            self._saved_dir_mtime_ns = None
+            self._scanned_at_ns = 0
+
+
+_shared_indexes: dict[Path, RegistryIndex] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_registry_index(processes_dir: str | Path) -> RegistryIndex:
+    """
+    Process-wide index of a registry directory.
+
+    Shared by every registry on the directory so the stored index is read and
+    the directory listed at most once per process. The shared index does not
+    write on its own; registries that persist call write().
+    """
+    key = Path(os.path.abspath(processes_dir))
+    with _shared_lock:
+        index = _shared_indexes.get(key)
+        if index is None:
+            index = RegistryIndex(key, persist=False)
+            _shared_indexes[key] = index
+        return index
@@ -6,6 +6,7 @@ Coordinates between ProcessRegistry and ProcessEditor instances.
 """
 
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,7 @@ from stageflow.process import Process
 from .config import ManagerConfig
 from .editor import ProcessEditor
 from .registry import ProcessRegistry
+from .watcher import ProcessWatcher, ReloadEvent
 
 logger = logging.getLogger(__name__)
 
@@ -557,6 +559,23 @@ class ProcessManager:
             logger.error(f"Failed to close editor for '{process_name}': {e}")
             return False
 
+    def watch(
+        self,
+        interval: float = 1.0,
+        on_reload: Callable[[ReloadEvent], None] | None = None,
+    ) -> ProcessWatcher:
+        """
+        Create a hot-reload watcher over the managed processes directory.
+
+        Args:
+            interval: Seconds between polls
+            on_reload: Called for every applied or rejected change
+
+        Returns:
+            ProcessWatcher (not started)
+        """
+        return self._registry.watch(interval=interval, on_reload=on_reload)
+
     def get_statistics(self) -> dict[str, Any]:
         """
         Get statistics about the process manager state.
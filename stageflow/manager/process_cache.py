@@ -0,0 +1,258 @@
+"""
+Process Cache Module
+
+In-memory LRU cache of constructed processes for registry loads.
+
+Entries are keyed by process file path and validated against the
+``(mtime_ns, size, inode)`` of the file and of every file it includes
+(taken from the include dependency graph) on each lookup, so editing or
+atomically replacing any of them makes the next lookup reload the process.
+
+Every lookup returns a structural copy (``Process.copy()``), so callers may
+modify what they get without affecting the cached process or other callers.
+
+Registry names are remembered alongside the path they resolved to, so a
+``@name`` lookup can be answered without resolving the name again while the
+processes directory is unchanged.
+"""
+
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import replace
+from pathlib import Path
+
+from stageflow.cache import CacheStats, LRUCache
+from stageflow.loader.includes import IncludeGraph, get_shared_include_resolver
+from stageflow.process import Process
+
+FileSignature = tuple[int, int, int]
+_Entry = tuple[
+    FileSignature, tuple[tuple[Path, FileSignature | None], ...], Process
+]
+
+
+def file_signature(file_path: str | Path) -> FileSignature:
+    """Stat-based identity of a file's current content.
+
+    Raises:
+        OSError: If the file cannot be stat'ed
+    """
+    st = os.stat(file_path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _optional_signature(file_path: str | Path) -> FileSignature | None:
+    try:
+        return file_signature(file_path)
+    except OSError:
+        return None
+
+
+def directory_mtime_ns(directory: str | Path) -> int | None:
+    """Directory mtime, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+class ProcessCache:
+    """Bounded, thread-safe cache of processes keyed by file path."""
+
+    def __init__(
+        self, max_size: int = 128, include_graph: IncludeGraph | None = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Maximum number of processes kept in memory
+            include_graph: Include dependencies recorded by the loader
+                (defaults to the shared resolver's graph)
+        """
+        self.include_graph = (
+            include_graph
+            if include_graph is not None
+            else get_shared_include_resolver().graph
+        )
+        self._cache: LRUCache[str, _Entry] = LRUCache(max_size=max_size)
+        self._lock = threading.Lock()
+        self._stale = 0
+        # registry name key -> (directory mtime when resolved, file key)
+        self._names: dict[str, tuple[int, str]] = {}
+
+    @staticmethod
+    def _key(file_path: str | Path) -> str:
+        return os.path.abspath(file_path)
+
+    @staticmethod
+    def _is_current(entry: _Entry, signature: FileSignature) -> bool:
+        cached_signature, include_signatures, _ = entry
+        return cached_signature == signature and all(
+            _optional_signature(include) == include_signature
+            for include, include_signature in include_signatures
+        )
+
+    def get(self, file_path: str | Path) -> Process | None:
+        """Copy of the cached process for a file, or None if missing or out of date."""
+        key = self._key(file_path)
+        try:
+            signature = file_signature(key)
+        except OSError:
+            self._cache.invalidate(key)
+            return None
+
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if not self._is_current(entry, signature):
+            self._cache.invalidate(key)
+            with self._lock:
+                self._stale += 1
+            return None
+        return entry[2].copy()
+
+    def get_named(self, processes_dir: str | Path, name: str) -> Process | None:
+        """
+        Copy of the cached process for a registry name, without resolving it.
+
+        Answers only while the processes directory is unchanged since the
+        name was resolved (see get_or_load()). Returning None is not counted
+        as a miss; resolve the name and call get_or_load() next.
+
+        Args:
+            processes_dir: Registry directory the name belongs to
+            name: Process name
+
+        Returns:
+            Process copy, or None if the name must be resolved again
+        """
+        name_key = os.path.join(self._key(processes_dir), name)
+        with self._lock:
+            bound = self._names.get(name_key)
+        if bound is None:
+            return None
+        dir_mtime, key = bound
+        entry = self._cache.peek(key)
+        try:
+            current = (
+                entry is not None
+                and directory_mtime_ns(processes_dir) == dir_mtime
+                and self._is_current(entry, file_signature(key))
+            )
+        except OSError:
+            current = False
+        if not current:
+            with self._lock:
+                self._names.pop(name_key, None)
+            return None
+        # Count the hit and mark the entry as recently used
+        entry = self._cache.get(key)
+        return entry[2].copy() if entry is not None else None
+
+    def get_or_load(
+        self,
+        file_path: str | Path,
+        load: Callable[[Path], Process],
+        name: str | None = None,
+        dir_mtime_ns: int | None = None,
+    ) -> Process:
+        """
+        Return a copy of the cached process or load and cache it.
+
+        The file is stat'ed before loading, so a write racing with the load
+        leaves an entry that fails validation on the next lookup.
+
+        Args:
+            file_path: Process file
+            load: Builds the process from the file (exceptions propagate)
+            name: Registry name ``file_path`` was resolved from, answered by
+                get_named() afterwards
+            dir_mtime_ns: Mtime of the processes directory taken before the
+                name was resolved (required with ``name``)
+
+        Returns:
+            Process instance private to the caller
+        """
+        key = self._key(file_path)
+        if name is not None and dir_mtime_ns is not None:
+            name_key = os.path.join(os.path.dirname(key), name)
+            with self._lock:
+                self._names[name_key] = (dir_mtime_ns, key)
+
+        process = self.get(file_path)
+        if process is not None:
+            return process
+
+        try:
+            signature = file_signature(key)
+        except OSError:
+            return load(Path(file_path))
+        process = load(Path(file_path))
+        include_signatures = tuple(
+            (include, _optional_signature(include))
+            for include in sorted(self.include_graph.includes_of(Path(key)))
+        )
+        self._cache.put(key, (signature, include_signatures, process))
+        return process.copy()
+
+    def invalidate(self, file_path: str | Path) -> bool:
+        """Drop the entry for a file. Returns True if it was cached."""
+        return self._cache.invalidate(self._key(file_path))
+
+    def invalidate_include(self, include_path: str | Path) -> int:
+        """Drop every process that includes a file. Returns the number dropped."""
+        return sum(
+            self._cache.invalidate(self._key(source))
+            for source in self.include_graph.dependents(Path(include_path))
+        )
+
+    def clear(self) -> None:
+        """Drop all cached processes (counters are kept)."""
+        self._cache.clear()
+        with self._lock:
+            self._names.clear()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/eviction counters."""
+        with self._lock:
+            self._cache.reset_stats()
+            self._stale = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Counters and size. Out-of-date entries count as expirations."""
+        with self._lock:
+            stats = self._cache.stats
+            return replace(
+                stats,
+                hits=stats.hits - self._stale,
+                misses=stats.misses + self._stale,
+                expirations=stats.expirations + self._stale,
+            )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+_shared_cache: ProcessCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_process_cache() -> ProcessCache | None:
+    """
+    Process-wide cache used for ``@name`` registry loads.
+
+    Sized by STAGEFLOW_PROCESS_CACHE_SIZE; returns None when that is 0.
+    """
+    global _shared_cache
+    from stageflow.manager.constants import get_process_cache_size
+
+    with _shared_lock:
+        if _shared_cache is None:
+            size = get_process_cache_size()
+            if size == 0:
+                return None
+            _shared_cache = ProcessCache(max_size=size)
+        return _shared_cache
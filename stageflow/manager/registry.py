@@ -5,17 +5,38 @@ Handles process discovery, loading, and file operations for StageFlow processes.
 """
 
 import json
+import os
 import shutil
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from ruamel.yaml import YAML
 
-from stageflow.loader import LoadError, load_process
+from stageflow.loader import LoadError, ProcessLoader, load_process
+from stageflow.loader.cache import hash_bytes
+from stageflow.lock import SimpleLock
+from stageflow.models import StageFieldsDefinition
 from stageflow.process import Process, ProcessDefinition
 
 from .config import ManagerConfig, ProcessFileFormat
+from .index import (
+    IncludeState,
+    RegistryIndex,
+    get_shared_registry_index,
+    include_state,
+)
+from .process_cache import ProcessCache, directory_mtime_ns
+from .watcher import ProcessWatcher, ReloadEvent
 
 
 class ProcessRegistryError(Exception):
@@ -24,6 +45,91 @@ class ProcessRegistryError(Exception):
     pass
 
 
+@dataclass(frozen=True)
+class ProcessScanResult:
+    """Outcome of loading, validating and summarizing one registry process."""
+
+    name: str
+    file_path: Path | None
+    summary: Any = None
+    error: str | None = None
+    elapsed: float = 0.0
+    includes: dict[str, IncludeState | None] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        """True if the process loaded and was summarized."""
+        return self.error is None
+
+
+def summarize_process(process: Process) -> dict[str, Any]:
+    """Default scan summary: small, picklable facts about a loaded process."""
+    return {
+        "name": process.name,
+        "description": process.description,
+        "stage_count": len(process.stage_ids),
+        "valid": process.is_valid,
+        "issue_count": len(process.issues),
+    }
+
+
+def _plain_fields(fields: StageFieldsDefinition) -> list[str] | dict[str, Any]:
+    """Copy stage fields into a plain list or dict for serialization."""
+    if isinstance(fields, list):
+        return list(fields)
+    return dict(fields)
+
+
+def _scan_process(
+    name: str,
+    file_path: Path | None,
+    summarize: Callable[[Process], Any],
+) -> ProcessScanResult:
+    """Load and summarize one process. Runs inside scan workers."""
+    start = time.perf_counter()
+    if file_path is None:
+        return ProcessScanResult(name=name, file_path=None, error="Process not found")
+
+    try:
+        result = ProcessLoader().load(file_path)
+        if result.success and result.process is not None:
+            include_paths = {str(path) for path in result.includes}
+        else:
+            # Record failed includes too, so fixing them refreshes the summary
+            include_paths = {
+                error.context["path"]
+                for error in result.errors
+                if isinstance(error.context.get("path"), str)
+                and Path(error.context["path"]) != file_path
+            }
+        includes = {path: include_state(path) for path in sorted(include_paths)}
+        if not result.success or result.process is None:
+            error = f"Failed to load: {result.get_error_summary()}"
+            return ProcessScanResult(
+                name=name,
+                file_path=file_path,
+                error=error,
+                elapsed=time.perf_counter() - start,
+                includes=includes,
+            )
+        summary = summarize(result.process)
+    except Exception as e:
+        return ProcessScanResult(
+            name=name,
+            file_path=file_path,
+            error=f"Failed to load: {e}",
+            elapsed=time.perf_counter() - start,
+        )
+
+    return ProcessScanResult(
+        name=name,
+        file_path=file_path,
+        summary=summary,
+        elapsed=time.perf_counter() - start,
+        includes=includes,
+    )
+
+
 class ProcessRegistry:
     """
     Registry for managing multiple StageFlow processes.
@@ -32,18 +138,40 @@ class ProcessRegistry:
     using the existing StageFlow loader infrastructure.
     """
 
-    def __init__(self, config: ManagerConfig):
+    def __init__(
+        self,
+        config: ManagerConfig,
+        persist_index: bool = True,
+        process_cache: ProcessCache | None = None,
+    ):
         """
         Initialize the process registry.
 
         Args:
             config: Manager configuration containing directory and format settings
+            persist_index: Store the metadata index in the processes directory
+                so later runs can reuse it (the in-memory index is shared by
+                every registry on the directory either way)
+            process_cache: Optional in-memory cache of loaded processes,
+                possibly shared with other registries
         """
         self.config = config
+        self.process_cache = process_cache
+        self._persist_index = persist_index
         self._yaml = YAML(typ="safe", pure=True)
         self._yaml.preserve_quotes = True
         self._yaml.indent(mapping=2, sequence=4, offset=2)
 
+    @property
+    def index(self) -> RegistryIndex:
+        """Metadata index of the processes directory (shared per directory)."""
+        return get_shared_registry_index(self.config.processes_dir)
+
+    def _save_index(self) -> None:
+        """Store index changes in the processes directory if persisting."""
+        if self._persist_index:
+            self.index.write()
+
     def list_processes(self) -> list[str]:
         """
         List all available process names in the registry.
@@ -59,20 +187,12 @@ class ProcessRegistry:
                 f"Processes directory not accessible: {self.config.processes_dir}"
             )
 
-        process_names = set()
-
         try:
-            for file_path in self.config.processes_dir.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in [
-                    ".yaml",
-                    ".yml",
-                    ".json",
-                ]:
-                    process_names.add(file_path.stem)
+            names = self.index.names()
         except OSError as e:
             raise ProcessRegistryError(f"Failed to list processes: {e}") from e
-
-        return sorted(process_names)
+        self._save_index()
+        return names
 
     def process_exists(self, process_name: str) -> bool:
         """
@@ -87,15 +207,9 @@ class ProcessRegistry:
         if not process_name or not process_name.strip():
             return False
 
-        try:
-            # Try to find the process with any supported extension
-            for ext in ["yaml", "yml", "json"]:
-                file_path = self.config.processes_dir / f"{process_name}.{ext}"
-                if file_path.exists() and file_path.is_file():
-                    return True
-            return False
-        except OSError:
-            return False
+        entry = self.index.get(process_name)
+        self._save_index()
+        return entry is not None
 
     def get_process_file_path(self, process_name: str) -> Path | None:
         """
@@ -107,23 +221,24 @@ class ProcessRegistry:
         Returns:
             Path to the process file if it exists, None otherwise
         """
-        if not self.process_exists(process_name):
+        if not process_name or not process_name.strip():
             return None
 
-        # Try to find existing file with any extension
-        for ext in ["yaml", "yml", "json"]:
-            file_path = self.config.processes_dir / f"{process_name}.{ext}"
-            if file_path.exists():
-                return file_path
-
-        return None
+        entry = self.index.get(process_name)
+        self._save_index()
+        return entry.file_path if entry else None
 
-    def load_process(self, process_name: str) -> Process:
+    def load_process(self, process_name: str, use_cache: bool = True) -> Process:
         """
         Load a process from the registry.
 
+        With a process cache configured, an unchanged file is served from
+        memory, looked up by name before the index is consulted. Either way
+        the returned Process belongs to the caller.
+
         Args:
             process_name: Name of the process to load
+            use_cache: Set to False to bypass the process cache
 
         Returns:
             Process object
@@ -131,6 +246,15 @@ class ProcessRegistry:
         Raises:
             ProcessRegistryError: If process doesn't exist or loading fails
         """
+        cache = self.process_cache if use_cache else None
+        dir_mtime: int | None = None
+        if cache is not None:
+            process = cache.get_named(self.config.processes_dir, process_name)
+            if process is not None:
+                return process
+            # Taken before resolving, so a change in between is not missed
+            dir_mtime = directory_mtime_ns(self.config.processes_dir)
+
         file_path = self.get_process_file_path(process_name)
         if not file_path:
             available = ", ".join(self.list_processes()) or "none"
@@ -139,6 +263,10 @@ class ProcessRegistry:
             )
 
         try:
+            if cache is not None:
+                return cache.get_or_load(
+                    file_path, load_process, name=process_name, dir_mtime_ns=dir_mtime
+                )
             return load_process(file_path)
         except LoadError as e:
             raise ProcessRegistryError(
@@ -246,6 +374,9 @@ class ProcessRegistry:
         # Save the file
         try:
             self._write_process_file(target_path, data_dict)
+            self.index.invalidate(process_name)
+            if self.process_cache is not None:
+                self.process_cache.invalidate(target_path)
             return target_path
         except Exception as e:
             raise ProcessRegistryError(
@@ -281,18 +412,28 @@ class ProcessRegistry:
 
         try:
             file_path.unlink()
+            self.index.invalidate(process_name)
+            if self.process_cache is not None:
+                self.process_cache.invalidate(file_path)
             return True
         except OSError as e:
             raise ProcessRegistryError(
                 f"Failed to delete process '{process_name}': {e}"
             ) from e
 
-    def get_process_info(self, process_name: str) -> dict[str, Any]:
+    def get_process_info(
+        self, process_name: str, include_summary: bool = False
+    ) -> dict[str, Any]:
         """
         Get metadata information about a process.
 
+        File metadata comes from the registry index and costs a single stat.
+
         Args:
             process_name: Name of the process
+            include_summary: Also include content hash, stage count, validity
+                and issue count. These are cached in the index and the process
+                is only loaded again when its content changed.
 
         Returns:
             Dictionary with process metadata
@@ -300,31 +441,96 @@ class ProcessRegistry:
         Raises:
             ProcessRegistryError: If process doesn't exist
         """
-        file_path = self.get_process_file_path(process_name)
-        if not file_path:
+        entry = self.index.stat(process_name) if process_name else None
+        self._save_index()
+        if entry is None:
             raise ProcessRegistryError(f"Process '{process_name}' not found")
 
-        try:
-            stat = file_path.stat()
-            return {
-                "name": process_name,
-                "file_path": str(file_path),
-                "format": "yaml"
-                if file_path.suffix.lower() in [".yaml", ".yml"]
-                else "json",
-                "size_bytes": stat.st_size,
-                "modified_time": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "created_time": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            }
-        except OSError as e:
-            raise ProcessRegistryError(
-                f"Failed to get process info for '{process_name}': {e}"
-            ) from e
+        info: dict[str, Any] = {
+            "name": process_name,
+            "file_path": str(entry.file_path),
+            "format": "yaml"
+            if entry.file_path.suffix.lower() in [".yaml", ".yml"]
+            else "json",
+            "size_bytes": entry.size,
+            "modified_time": datetime.fromtimestamp(entry.mtime_ns / 1e9).isoformat(),
+            "created_time": datetime.fromtimestamp(entry.ctime).isoformat(),
+        }
+        if include_summary:
+            summaries = self.get_process_summaries([process_name])
+            info.update(summaries.get(process_name, {}))
+        return info
 
-    def list_process_info(self) -> list[dict[str, Any]]:
+    def get_process_summaries(
+        self,
+        names: Iterable[str] | None = None,
+        max_workers: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Summaries of registry processes, refreshed incrementally.
+
+        Each summary holds ``content_hash`` plus the fields of
+        summarize_process(), or ``valid=False`` and ``error`` if the process
+        cannot be loaded. Only processes whose content hash, or the content
+        of a file they include, changed since the last refresh are loaded
+        again, in parallel via scan().
+
+        Args:
+            names: Processes to summarize (defaults to every registry process)
+            max_workers: Worker count for reloading changed processes
+
+        Returns:
+            Mapping of process name to summary
+
+        Raises:
+            ProcessRegistryError: If processes directory is not accessible
+        """
+        index = self.index
+        process_names = list(self.list_processes() if names is None else names)
+
+        pending_hashes: dict[str, str] = {}
+        for name in process_names:
+            entry = index.stat(name)
+            if entry is None or entry.has_summary:
+                continue
+            try:
+                content_hash = hash_bytes(entry.file_path.read_bytes())
+            except OSError:
+                continue
+            if content_hash == entry.content_hash and entry.summary is not None:
+                # Touched but not modified
+                index.set_summary(name, content_hash, entry.summary)
+            else:
+                pending_hashes[name] = content_hash
+
+        if pending_hashes:
+            for outcome in self.scan(pending_hashes, max_workers=max_workers):
+                if outcome.success:
+                    summary = dict(outcome.summary)
+                else:
+                    summary = {"valid": False, "error": outcome.error}
+                index.set_summary(
+                    outcome.name,
+                    pending_hashes[outcome.name],
+                    summary,
+                    includes=outcome.includes,
+                )
+        self._save_index()
+
+        summaries: dict[str, dict[str, Any]] = {}
+        for name in process_names:
+            entry = index.get(name)
+            if entry is not None and entry.summary is not None:
+                summaries[name] = {"content_hash": entry.content_hash, **entry.summary}
+        return summaries
+
+    def list_process_info(self, include_summary: bool = False) -> list[dict[str, Any]]:
         """
         Get metadata information for all processes in the registry.
 
+        Args:
+            include_summary: Include cached load summaries (see get_process_info)
+
         Returns:
             List of process metadata dictionaries
 
@@ -332,17 +538,101 @@ class ProcessRegistry:
             ProcessRegistryError: If registry cannot be accessed
         """
         process_names = self.list_processes()
+        summaries = self.get_process_summaries(process_names) if include_summary else {}
         info_list = []
 
         for name in process_names:
             try:
-                info_list.append(self.get_process_info(name))
+                info = self.get_process_info(name)
             except ProcessRegistryError:
                 # Skip processes that can't be accessed
                 continue
+            info.update(summaries.get(name, {}))
+            info_list.append(info)
 
         return info_list
 
+    def scan(
+        self,
+        names: Iterable[str] | None = None,
+        summarize: Callable[[Process], Any] = summarize_process,
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> Iterator[ProcessScanResult]:
+        """
+        Load, validate and summarize registry processes concurrently.
+
+        Results are yielded as each process finishes, not in name order.
+        Failures are reported as results with ``error`` set; a broken
+        process never aborts the scan.
+
+        Args:
+            names: Processes to scan (defaults to every registry process)
+            summarize: Builds the per-process summary from the loaded Process.
+                With ``use_processes`` it must be picklable (a module-level
+                function or static method) and return a picklable value.
+            max_workers: Worker count (defaults to the CPU count)
+            use_processes: Use a process pool instead of threads. Loading is
+                CPU-bound, so processes scale with cores on large registries
+                at the cost of worker start-up time.
+
+        Yields:
+            ProcessScanResult for each process as it completes
+
+        Raises:
+            ProcessRegistryError: If processes directory is not accessible
+        """
+        process_names = list(self.list_processes() if names is None else names)
+        jobs = [(name, self.get_process_file_path(name)) for name in process_names]
+        if not jobs:
+            return
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        if workers <= 1:
+            for name, file_path in jobs:
+                yield _scan_process(name, file_path, summarize)
+            return
+
+        executor: Executor = (
+            ProcessPoolExecutor(max_workers=workers)
+            if use_processes
+            else ThreadPoolExecutor(max_workers=workers)
+        )
+        with executor:
+            futures = [
+                executor.submit(_scan_process, name, file_path, summarize)
+                for name, file_path in jobs
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                # Consumer stopped early - drop work that has not started
+                for future in futures:
+                    future.cancel()
+
+    def watch(
+        self,
+        interval: float = 1.0,
+        on_reload: Callable[[ReloadEvent], None] | None = None,
+    ) -> ProcessWatcher:
+        """
+        Create a hot-reload watcher for this registry's directory.
+
+        The watcher is not started; call ``start()`` or use it as a context
+        manager.
+
+        Args:
+            interval: Seconds between polls
+            on_reload: Called for every applied or rejected change
+
+        Returns:
+            ProcessWatcher serving the latest good version of each process
+        """
+        return ProcessWatcher(
+            self.config.processes_dir, interval=interval, on_reload=on_reload
+        )
+
     def _create_backup(self, process_name: str) -> None:
         """Create a backup of an existing process."""
         if not self.config.backup_enabled or not self.config.backup_dir:
@@ -403,7 +693,7 @@ class ProcessRegistry:
                 stage_data: dict[str, Any] = {
                     "name": stage_dict["name"],
                     "description": stage_dict.get("description", ""),
-                    "fields": dict(stage_dict.get("fields", {})),
+                    "fields": _plain_fields(stage_dict.get("fields", {})),
                     "expected_actions": [
                         {
                             "description": action.get("description", ""),
@@ -434,7 +724,7 @@ class ProcessRegistry:
                             "property_path": lock.property_path,
                         }
                         if (
-                            hasattr(lock, "expected_value")
+                            isinstance(lock, SimpleLock)
                             and lock.expected_value is not None
                         ):
                             lock_data["expected_value"] = lock.expected_value
@@ -0,0 +1,354 @@
+"""
+Process Watcher Module
+
+Hot reload of registry processes for long-running services.
+
+The watcher keeps the last good version of every registry process in memory
+and polls the processes directory and every `$include` dependency for
+changes. Stats are batched with one ``os.scandir`` per directory. Changed
+processes are rebuilt and validated in the background and swapped in
+atomically; readers never see a partially loaded process. A process that
+fails to load keeps serving its last good version until the file is fixed.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+from types import MappingProxyType
+
+from stageflow.loader import ProcessLoader
+from stageflow.models import ErrorSeverity, LoadError, LoadErrorType
+from stageflow.process import Process
+
+from .index import INDEX_FILE_NAME, PROCESS_EXTENSIONS
+
+logger = logging.getLogger(__name__)
+
+FileSignature = tuple[int, int, int]
+
+
+class ReloadEventType(StrEnum):
+    """What happened to a watched process."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ReloadEvent:
+    """A change applied (or rejected) by the watcher.
+
+    Fields:
+        name: Registry process name
+        event_type: Kind of change
+        process: Process now being served (last good version for FAILED,
+            None for DELETED or a process that never loaded)
+        errors: Load errors for FAILED events
+    """
+
+    name: str
+    event_type: ReloadEventType
+    process: Process | None = None
+    errors: list[LoadError] = field(default_factory=list)
+
+
+@dataclass
+class _WatchedProcess:
+    file_path: Path
+    signature: FileSignature
+    dependencies: dict[Path, FileSignature | None]
+
+
+def _signature(st: os.stat_result) -> FileSignature:
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _blocking_issue_errors(process: Process) -> list[LoadError]:
+    """Blocking consistency issues of a loaded process, as load errors."""
+    return [
+        LoadError(
+            error_type=LoadErrorType.VALIDATION_ERROR,
+            severity=ErrorSeverity.FATAL,
+            message=issue.description,
+            context={"issue_type": issue.issue_type.value, "stages": list(issue.stages)},
+        )
+        for issue in process.issues
+        if issue.issue_type in process.BLOCKING_ISSUE_TYPES
+    ]
+
+
+def _scan_signatures(paths: Iterable[Path]) -> dict[Path, FileSignature | None]:
+    """Stat many files with one ``os.scandir`` per parent directory."""
+    by_dir: dict[Path, set[str]] = {}
+    for path in paths:
+        by_dir.setdefault(path.parent, set()).add(path.name)
+
+    signatures: dict[Path, FileSignature | None] = {}
+    for directory, names in by_dir.items():
+        found: dict[str, FileSignature] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        try:
+                            found[entry.name] = _signature(entry.stat())
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+        for name in names:
+            signatures[directory / name] = found.get(name)
+    return signatures
+
+
+class ProcessWatcher:
+    """
+    Poll a registry directory and hot-swap changed processes.
+
+    Use ``poll()`` to check synchronously, or ``start()``/``stop()`` (or the
+    context manager) to poll on a background thread. ``get()`` and
+    ``processes`` are safe to call from any thread.
+    """
+
+    def __init__(
+        self,
+        processes_dir: str | Path,
+        interval: float = 1.0,
+        on_reload: Callable[[ReloadEvent], None] | None = None,
+        loader: ProcessLoader | None = None,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            processes_dir: Registry directory to watch
+            interval: Seconds between background polls
+            on_reload: Called for every event (from the polling thread)
+            loader: Loader used to rebuild processes
+        """
+        self.processes_dir = Path(processes_dir)
+        self.interval = interval
+        self.on_reload = on_reload
+        self.loader = loader if loader is not None else ProcessLoader()
+        self._processes: Mapping[str, Process] = MappingProxyType({})
+        self._failures: dict[str, list[LoadError]] = {}
+        self._watched: dict[str, _WatchedProcess] = {}
+        self._poll_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    @property
+    def processes(self) -> Mapping[str, Process]:
+        """Read-only snapshot of the processes currently served."""
+        return self._processes
+
+    def get(self, name: str) -> Process | None:
+        """Current good version of a process, or None."""
+        return self._processes.get(name)
+
+    def errors(self, name: str) -> list[LoadError]:
+        """Errors from the latest failed reload of a process (empty if none)."""
+        return list(self._failures.get(name, []))
+
+    # ------------------------------------------------------------------
+    # Polling
+    # ------------------------------------------------------------------
+
+    def _scan_process_files(self) -> dict[str, tuple[Path, FileSignature]] | None:
+        found: dict[str, tuple[int, Path, FileSignature]] = {}
+        try:
+            with os.scandir(self.processes_dir) as entries:
+                for entry in entries:
+                    suffix = os.path.splitext(entry.name)[1].lower()
+                    if suffix not in PROCESS_EXTENSIONS:
+                        continue
+                    if entry.name == INDEX_FILE_NAME:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        signature = _signature(entry.stat())
+                    except OSError:
+                        continue
+                    name = os.path.splitext(entry.name)[0]
+                    rank = PROCESS_EXTENSIONS.index(suffix)
+                    current = found.get(name)
+                    if current is None or rank < current[0]:
+                        found[name] = (rank, Path(entry.path), signature)
+        except OSError as e:
+            logger.warning(f"Cannot scan processes directory: {e}")
+            return None
+        return {name: (path, signature) for name, (_, path, signature) in found.items()}
+
+    def poll(self) -> list[ReloadEvent]:
+        """
+        Check for changes once and apply them.
+
+        Returns:
+            Events for every process that was added, modified, deleted or
+            failed to reload
+        """
+        with self._poll_lock:
+            files = self._scan_process_files()
+            if files is None:
+                # Directory temporarily unavailable - keep serving what we have
+                return []
+            dependency_signatures = _scan_signatures(
+                {dep for watched in self._watched.values() for dep in watched.dependencies}
+            )
+
+            changed: list[str] = []
+            for name, (file_path, signature) in files.items():
+                watched = self._watched.get(name)
+                if (
+                    watched is None
+                    or watched.file_path != file_path
+                    or watched.signature != signature
+                    or any(
+                        dependency_signatures.get(dep) != dep_signature
+                        for dep, dep_signature in watched.dependencies.items()
+                    )
+                ):
+                    changed.append(name)
+            deleted = [name for name in self._watched if name not in files]
+
+            events: list[ReloadEvent] = []
+            updates: dict[str, Process | None] = {}
+            for name in sorted(changed):
+                file_path, signature = files[name]
+                event = self._reload(name, file_path, signature)
+                events.append(event)
+                if event.event_type != ReloadEventType.FAILED:
+                    updates[name] = event.process
+            for name in sorted(deleted):
+                del self._watched[name]
+                self._failures.pop(name, None)
+                updates[name] = None
+                events.append(ReloadEvent(name=name, event_type=ReloadEventType.DELETED))
+
+            if updates:
+                self._swap(updates)
+
+        for event in events:
+            self._notify(event)
+        return events
+
+    def _reload(
+        self, name: str, file_path: Path, signature: FileSignature
+    ) -> ReloadEvent:
+        previous = self._processes.get(name)
+        result = self.loader.load(file_path)
+
+        if result.success and result.process is not None:
+            dependencies = list(result.includes)
+        else:
+            # Watch the failed includes too, so fixing them triggers a retry
+            dependencies = [
+                Path(error.context["path"])
+                for error in result.errors
+                if isinstance(error.context.get("path"), str)
+                and Path(error.context["path"]) != file_path
+            ]
+            watched = self._watched.get(name)
+            if watched is not None:
+                dependencies.extend(watched.dependencies)
+
+        self._watched[name] = _WatchedProcess(
+            file_path=file_path,
+            signature=signature,
+            dependencies=_scan_signatures(set(dependencies)),
+        )
+
+        if not result.is_valid:
+            errors = list(result.errors)
+            if result.process is not None:
+                # Loaded, but blocking consistency issues make it unusable
+                errors.extend(_blocking_issue_errors(result.process))
+            self._failures[name] = errors
+            logger.warning(
+                f"Reload of process '{name}' failed; keeping last good version"
+            )
+            return ReloadEvent(
+                name=name,
+                event_type=ReloadEventType.FAILED,
+                process=previous,
+                errors=errors,
+            )
+
+        self._failures.pop(name, None)
+        return ReloadEvent(
+            name=name,
+            event_type=ReloadEventType.MODIFIED
+            if previous is not None
+            else ReloadEventType.ADDED,
+            process=result.process,
+        )
+
+    def _swap(self, updates: dict[str, Process | None]) -> None:
+        processes = dict(self._processes)
+        for name, process in updates.items():
+            if process is None:
+                processes.pop(name, None)
+            else:
+                processes[name] = process
+        # Single reference assignment: readers see the old or the new snapshot
+        self._processes = MappingProxyType(processes)
+
+    def _notify(self, event: ReloadEvent) -> None:
+        if self.on_reload is None:
+            return
+        try:
+            self.on_reload(event)
+        except Exception:
+            logger.exception(f"Reload callback failed for process '{event.name}'")
+
+    # ------------------------------------------------------------------
+    # Background polling
+    # ------------------------------------------------------------------
+
+    @property
+    def running(self) -> bool:
+        """True while the background thread is polling."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "ProcessWatcher":
+        """Load all processes, then poll on a daemon thread."""
+        if self.running:
+            return self
+        self.poll()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="stageflow-process-watcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop background polling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception:
+                logger.exception("Process watcher poll failed")
+
+    def __enter__(self) -> "ProcessWatcher":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -30,6 +30,7 @@ from .base import (
     ActionSource,
     ActionType,
     ConditionalLockDict,
+    ElementLocation,
     ExpectedObjectSchmema,
     GateDefinition,
     LegacyProcessFileDict,
@@ -38,6 +39,7 @@ from .base import (
     LockMetaData,
     LockShorthandDict,
     LockType,
+    MemberSet,
     ProcessDefinition,
     ProcessElementEvaluationResult,
     ProcessFile,
@@ -47,6 +49,7 @@ from .base import (
     StageDefinition,
     StageFieldsDefinition,
     StageObjectPropertyDefinition,
+    item_string_cache,
 )
 
 # Consistency models
@@ -56,6 +59,7 @@ from .consistency import (
     TerminationAnalysis,
 )
 from .enums import (
+    AnalysisMode,
     ErrorSeverity,
     FileFormat,
     IssueSeverity,
@@ -78,7 +82,10 @@ from .errors import (
 # Property models (new unified system)
 from .properties import (
     BoolProperty,
+    CompiledField,
     DictProperty,
+    FieldValidationResult,
+    FieldValidator,
     ListProperty,
     NumberProperty,
     PropertiesParser,
@@ -108,6 +115,7 @@ __all__ = [
     "FileFormat",
     "LockTypeShorthand",
     "RegressionPolicy",
+    "AnalysisMode",
     "SpecialLockType",
     "LockType",
 
@@ -123,6 +131,8 @@ __all__ = [
     "TerminationAnalysis",
     # Lock types
     "LockMetaData",
+    "MemberSet",
+    "item_string_cache",
     "LockDefinitionDict",
     "LockShorthandDict",
     "ConditionalLockDict",
@@ -141,6 +151,7 @@ __all__ = [
     # Process types
     "ProcessDefinition",
     "ProcessElementEvaluationResult",
+    "ElementLocation",
     "RegressionDetails",
     "RegressionPolicyLiteral",
     # File format types
@@ -157,6 +168,9 @@ __all__ = [
     "DictProperty",
     "PropertiesParser",
     "PropertyValidator",
+    "FieldValidator",
+    "FieldValidationResult",
+    "CompiledField",
     # Schema lifecycle types
     "SchemaType",
     "PropertySource",
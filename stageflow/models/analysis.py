@@ -4,7 +4,9 @@ This module defines the input data structures for process analyzers,
 providing clear separation between data extraction and analysis logic.
 """
 
+from collections import deque
 from dataclasses import dataclass
+from functools import cached_property
 
 from .base import GateDefinition
 from .schema import StageSchema
@@ -38,9 +40,44 @@ class ProcessGraph:
     stage_ids: frozenset[str]
     stages_with_gates: frozenset[str]
 
+    @cached_property
+    def _adjacency(self) -> dict[str, list[str]]:
+        adjacency: dict[str, list[str]] = {}
+        for from_id, to_id in self.edges:
+            adjacency.setdefault(from_id, []).append(to_id)
+        return adjacency
+
+    @cached_property
+    def _reverse_adjacency(self) -> dict[str, list[str]]:
+        adjacency: dict[str, list[str]] = {}
+        for from_id, to_id in self.edges:
+            adjacency.setdefault(to_id, []).append(from_id)
+        return adjacency
+
     def get_targets(self, stage_id: str) -> list[str]:
         """Get all target stages from a given stage."""
-        return [to_id for from_id, to_id in self.edges if from_id == stage_id]
+        return list(self._adjacency.get(stage_id, ()))
+
+    @staticmethod
+    def _closure(start: str, adjacency: dict[str, list[str]]) -> frozenset[str]:
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            for neighbour in adjacency.get(queue.popleft(), ()):
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return frozenset(seen)
+
+    @cached_property
+    def reachable_from_initial(self) -> frozenset[str]:
+        """Stages reachable from the initial stage (including it), in O(V + E)."""
+        return self._closure(self.initial_id, self._adjacency)
+
+    @cached_property
+    def reaching_final(self) -> frozenset[str]:
+        """Stages with a path to the final stage (including it), in O(V + E)."""
+        return self._closure(self.final_id, self._reverse_adjacency)
 
     def has_path(
         self, from_id: str, to_id: str, exclude: set[str] | None = None
@@ -57,10 +94,10 @@ class ProcessGraph:
 
         exclude = exclude or set()
         visited: set[str] = set()
-        queue = [from_id]
+        queue = deque([from_id])
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             if current in visited:
                 continue
             # Allow starting node even if in exclude
@@ -68,7 +105,7 @@ class ProcessGraph:
                 continue
             visited.add(current)
 
-            for target in self.get_targets(current):
+            for target in self._adjacency.get(current, ()):
                 if target == to_id:
                     return True
                 if target not in visited and target not in exclude:
@@ -93,6 +130,8 @@ class StageSchemaMutations:
         final_schemas: Schema per gate at stage exit
         gates: Gate definitions for this stage
         is_transition_target: Whether any gate targets this stage
+        lock_fingerprints: Canonical lock fingerprints of each gate, aligned
+            with ``gates`` (empty when built from raw definitions)
     """
 
     stage_id: str
@@ -101,3 +140,4 @@ class StageSchemaMutations:
     final_schemas: dict[str, StageSchema]
     gates: tuple[GateDefinition, ...]
     is_transition_target: bool
+    lock_fingerprints: tuple[tuple[tuple, ...], ...] = ()
@@ -7,6 +7,9 @@ imported by other modules.
 """
 
 import re
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum, StrEnum
 from typing import TYPE_CHECKING, Any, Literal, NotRequired, Required, TypedDict
 
@@ -20,6 +23,8 @@ __all__ = [
     # Lock types
     "LockType",
     "LockMetaData",
+    "MemberSet",
+    "item_string_cache",
     "LockDefinitionDict",
     "LockShorthandDict",
     "ConditionalLockDict",
@@ -39,6 +44,7 @@ __all__ = [
     "RegressionPolicyLiteral",
     "ProcessDefinition",
     "ProcessElementEvaluationResult",
+    "ElementLocation",
     "RegressionDetails",
     # File format types
     "ProcessFileDict",
@@ -47,6 +53,80 @@ __all__ = [
 ]
 
 
+class MemberSet:
+    """
+    Hashed membership test over a collection of expected values.
+
+    Behaves like ``value in items`` for a list: hashable items are looked up
+    in a frozenset, unhashable ones (e.g. dicts) are compared one by one, and
+    unhashable values are only compared against those.
+    """
+
+    __slots__ = ("_hashed", "_unhashable")
+
+    def __init__(self, items: Iterable[Any]):
+        hashed: set[Any] = set()
+        unhashable: list[Any] = []
+        for item in items:
+            try:
+                hashed.add(item)
+            except TypeError:
+                unhashable.append(item)
+        self._hashed = frozenset(hashed)
+        self._unhashable = tuple(unhashable)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            if value in self._hashed:
+                return True
+        except TypeError:
+            pass
+        return any(value == item for item in self._unhashable)
+
+    def __len__(self) -> int:
+        return len(self._hashed) + len(self._unhashable)
+
+
+# id(collection) -> (collection, string forms of its items) for CONTAINS locks,
+# active only within item_string_cache()
+_item_strings: ContextVar[dict[int, tuple[Any, frozenset[str]]] | None] = ContextVar(
+    "_item_strings", default=None
+)
+
+
+@contextmanager
+def item_string_cache() -> Iterator[None]:
+    """
+    Share stringified collection items between CONTAINS locks.
+
+    Within the block, the first CONTAINS lock that falls back to comparing
+    string forms of a collection's items stores them as a set; later locks
+    on the same collection look them up instead of re-stringifying every
+    item. Meant to span one evaluation, during which element data must not
+    be mutated. Nested blocks reuse the outer cache.
+    """
+    if _item_strings.get() is not None:
+        yield
+        return
+    token = _item_strings.set({})
+    try:
+        yield
+    finally:
+        _item_strings.reset(token)
+
+
+def _contains_item_string(collection: Any, text: str) -> bool:
+    """Whether any item of the collection has the given string form."""
+    cache = _item_strings.get()
+    if cache is None:
+        return any(str(item) == text for item in collection)
+    entry = cache.get(id(collection))
+    if entry is None or entry[0] is not collection:
+        entry = (collection, frozenset(str(item) for item in collection))
+        cache[id(collection)] = entry
+    return text in entry[1]
+
+
 class LockType(Enum):
     """
     Built-in lock types for common validation scenarios.
@@ -185,11 +265,12 @@ class LockType(Enum):
                 elif hasattr(value, "__contains__"):
                     # For collections, check if expected_value is in the collection
                     # or if string representation matches any element
-                    # Type ignore needed because value could be various types
-                    return (
-                        expected_value in value  # type: ignore[operator]
-                        or str(expected_value) in [str(item) for item in value]
-                    )  # type: ignore[arg-type]
+                    if expected_value in value:  # type: ignore[operator]
+                        return True
+                    expected_text = lock_meta.get("expected_text")
+                    if expected_text is None:
+                        expected_text = str(expected_value)
+                    return _contains_item_string(value, expected_text)
                 else:
                     return False
             except (TypeError, AttributeError):
@@ -197,10 +278,10 @@ class LockType(Enum):
         if lock_type == LockType.IN_LIST:
             if not isinstance(expected_value, (list | tuple | set)):
                 return False
-            return value in expected_value
+            return value in lock_meta.get("members", expected_value)
 
         if lock_type == LockType.NOT_IN_LIST:
-            return value not in expected_value
+            return value not in lock_meta.get("members", expected_value)
 
         if lock_type == LockType.TYPE_CHECK:
             if isinstance(expected_value, str):
@@ -242,6 +323,10 @@ class LockMetaData(TypedDict, total=False):
     expected_value: Any
     min_value: int | None
     max_value: int | None
+    # Precomputed by SimpleLock: hashed IN_LIST/NOT_IN_LIST values and the
+    # string form of a CONTAINS expected value
+    members: MemberSet
+    expected_text: str
 
 
 class LockDefinitionDict(TypedDict, total=False):
@@ -608,6 +693,21 @@ class ProcessElementEvaluationResult(TypedDict):
     regression_details: RegressionDetails
 
 
+class ElementLocation(TypedDict):
+    """Where an element stands in a process (see Process.locate).
+
+    Fields:
+        stage: Furthest stage reached by following passing gates from the
+            initial stage
+        path: Stage IDs walked from the initial stage, ending with ``stage``
+        statuses: Stage ID -> status value ("incomplete", "blocked", "ready")
+            for every evaluated stage
+    """
+    stage: str
+    path: list[str]
+    statuses: dict[str, str]
+
+
 # ============================================================================
 # File Format Type Definitions
 # ============================================================================
@@ -160,3 +160,16 @@ class RegressionPolicy(StrEnum):
     IGNORE = "ignore"  # No regression checking (default for simple workflows)
     WARN = "warn"      # Report but allow progression (default, backward compatible)
     BLOCK = "block"    # Prevent transition until regression resolved
+
+
+class AnalysisMode(StrEnum):
+    """When a Process runs consistency analysis.
+
+    Values:
+        EAGER: Analyze on construction and after every mutation (default)
+        LAZY: Analyze on the first ``issues``/``is_valid`` read after a change
+        OFF: Never analyze automatically; only ``reanalyze()`` updates issues
+    """
+    EAGER = "eager"
+    LAZY = "lazy"
+    OFF = "off"
@@ -9,6 +9,7 @@ to maintain a clean vertical hierarchy and avoid circular imports.
 """
 
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, TypedDict
 
 from .enums import ErrorSeverity, LoadErrorType, LoadResultStatus
@@ -84,6 +85,7 @@ class ProcessLoadResult:
         errors: List of errors encountered (fatal errors prevent process creation)
         warnings: List of warnings (process created but has issues)
         source: Source identifier (file path or registry name)
+        includes: Files pulled in through `$include` while loading
     """
 
     status: LoadResultStatus
@@ -91,6 +93,7 @@ class ProcessLoadResult:
     errors: list[LoadError] = field(default_factory=list)
     warnings: list[LoadError] = field(default_factory=list)
     source: str = ""
+    includes: list[Path] = field(default_factory=list, compare=False)
 
     @property
     def success(self) -> bool:
@@ -9,11 +9,16 @@ Single file containing:
 """
 
 import re
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+if TYPE_CHECKING:
+    from stageflow.elements import Element
+
 # ============================================================================
 # Property Types Enum
 # ============================================================================
@@ -173,7 +178,7 @@ class PropertiesParser:
                 # Simple string: "email"
                 if isinstance(item, str):
                     if "." in item:
-                        cls._add_nested(result, item, "string")
+                        cls._add_nested(result, item, None)
                     else:
                         result[item] = StringProperty()
                 # Single-key dict: {"email": "string"} or {"email": {...}}
@@ -282,7 +287,9 @@ class PropertiesParser:
 
         # Add final property
         final = parts[-1]
-        if isinstance(spec, str):
+        if spec is None:
+            current[final] = StringProperty()
+        elif isinstance(spec, str):
             current[final] = cls._from_type(spec)
         else:
             current[final] = cls._from_dict(spec)
@@ -293,6 +300,30 @@ class PropertiesParser:
 # ============================================================================
 
 
+# Python types accepted for each property type
+_TYPE_MAP: dict[PropertyType, type | tuple[type, ...]] = {
+    PropertyType.STRING: str,
+    PropertyType.INT: int,
+    PropertyType.FLOAT: (int, float),
+    PropertyType.BOOL: bool,
+    PropertyType.LIST: list,
+    PropertyType.DICT: dict,
+}
+
+# Precompiled patterns for StringProperty.format
+_FORMAT_PATTERNS: dict[str, re.Pattern[str]] = {
+    name: re.compile(pattern, re.IGNORECASE)
+    for name, pattern in {
+        "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
+        "uri": r"^https?://[^\s]+$",
+        "uuid": r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    }.items()
+}
+
+# A compiled constraint: returns an error message, or None if the value passes
+ValueCheck = Callable[[Any], str | None]
+
+
 class PropertyValidator:
     """Validate element values against property models."""
 
@@ -307,7 +338,7 @@ class PropertyValidator:
 
         # Type check
         if not PropertyValidator._check_type(prop.type, value):
-            errors.append(f"Expected {prop.type.value}, got {type(value).__name__}")
+            errors.append(_type_error(prop.type, value))
             return (False, errors)
 
         # Type-specific validation
@@ -320,18 +351,79 @@ class PropertyValidator:
 
         return (len(errors) == 0, errors)
 
+    @staticmethod
+    def compile(prop: Property) -> tuple[ValueCheck, ...]:
+        """
+        Compile a property's constraints into value checks.
+
+        The type check always comes first; the other checks assume a value
+        of the right type. Regexes are compiled once here instead of on every
+        validation.
+
+        Returns: Tuple of checks, each returning an error message or None
+        """
+        expected_type = _TYPE_MAP[PropertyType(prop.type)]
+        checks: list[ValueCheck] = []
+
+        if isinstance(prop, StringProperty):
+            if prop.min_length:
+                checks.append(_min_size(prop.min_length, "Too short (min: {})"))
+            if prop.max_length:
+                checks.append(_max_size(prop.max_length, "Too long (max: {})"))
+            if prop.pattern:
+                pattern = re.compile(prop.pattern)
+                checks.append(
+                    lambda value: None if pattern.match(value) else "Pattern mismatch"
+                )
+            if prop.enum:
+                allowed = frozenset(prop.enum)
+                message = f"Must be one of: {prop.enum}"
+                checks.append(lambda value: None if value in allowed else message)
+            if prop.format:
+                format_pattern = _FORMAT_PATTERNS.get(prop.format)
+                message = f"Invalid {prop.format}"
+                checks.append(
+                    lambda value: None
+                    if format_pattern and format_pattern.match(value)
+                    else message
+                )
+        elif isinstance(prop, NumberProperty):
+            if prop.min is not None:
+                minimum = prop.min
+                message = f"Too small (min: {minimum})"
+                checks.append(lambda value: message if value < minimum else None)
+            if prop.max is not None:
+                maximum = prop.max
+                message = f"Too large (max: {maximum})"
+                checks.append(lambda value: message if value > maximum else None)
+        elif isinstance(prop, ListProperty):
+            if prop.min_items:
+                checks.append(_min_size(prop.min_items, "Too few items (min: {})"))
+            if prop.max_items:
+                checks.append(_max_size(prop.max_items, "Too many items (max: {})"))
+            if prop.unique:
+                checks.append(
+                    lambda value: None
+                    if len(value) == len({str(item) for item in value})
+                    else "Items must be unique"
+                )
+
+        prop_type = prop.type
+        # Shorthand fields (``fields: [email]``) and nested groups only name a
+        # path; their default type is not a declaration to enforce
+        type_declared = "type" in prop.model_fields_set
+
+        def check_type(value: Any) -> str | None:
+            if not type_declared or isinstance(value, expected_type):
+                return None
+            return _type_error(prop_type, value)
+
+        return (check_type, *checks)
+
     @staticmethod
     def _check_type(prop_type: PropertyType, value: Any) -> bool:
         """Check value type."""
-        type_map = {
-            PropertyType.STRING: str,
-            PropertyType.INT: int,
-            PropertyType.FLOAT: (int, float),
-            PropertyType.BOOL: bool,
-            PropertyType.LIST: list,
-            PropertyType.DICT: dict,
-        }
-        return isinstance(value, type_map[prop_type])
+        return isinstance(value, _TYPE_MAP[prop_type])
 
     @staticmethod
     def _validate_string(prop: StringProperty, value: str) -> list[str]:
@@ -388,10 +480,128 @@ class PropertyValidator:
     @staticmethod
     def _validate_format(format_name: str, value: str) -> bool:
         """Validate common formats."""
-        formats = {
-            "email": r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
-            "uri": r"^https?://[^\s]+$",
-            "uuid": r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        }
-        pattern = formats.get(format_name)
-        return bool(pattern and re.match(pattern, value, re.IGNORECASE))
+        pattern = _FORMAT_PATTERNS.get(format_name)
+        return bool(pattern and pattern.match(value))
+
+
+def _type_error(prop_type: PropertyType | str, value: Any) -> str:
+    return f"Expected {PropertyType(prop_type).value}, got {type(value).__name__}"
+
+
+def _min_size(limit: int, template: str) -> ValueCheck:
+    message = template.format(limit)
+    return lambda value: message if len(value) < limit else None
+
+
+def _max_size(limit: int, template: str) -> ValueCheck:
+    message = template.format(limit)
+    return lambda value: message if len(value) > limit else None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledField:
+    """One field of a stage, flattened to its full path with compiled checks."""
+
+    path: str
+    required: bool
+    default: Any
+    checks: tuple[ValueCheck, ...]  # type check first, see PropertyValidator.compile
+
+
+@dataclass(frozen=True)
+class FieldValidationResult:
+    """Outcome of checking an element against a stage's fields.
+
+    Attributes:
+        missing: Required paths absent from the element -> suggested default
+        invalid: Present paths whose value breaks a constraint -> messages
+    """
+
+    missing: dict[str, Any] = field(default_factory=dict)
+    invalid: dict[str, list[str]] = field(default_factory=dict)
+
+    @property
+    def valid(self) -> bool:
+        """Whether every field is present and satisfies its constraints."""
+        return not self.missing and not self.invalid
+
+
+class FieldValidator:
+    """
+    Stage fields compiled into a flat list of path checkers.
+
+    Nested DictProperty trees are flattened once at construction, in the
+    same depth-first order as they are declared, so validating an element is
+    a single loop over full paths: presence for required fields, then the
+    precompiled type and constraint checks for every field that has a value.
+    Null values are only checked for presence.
+    """
+
+    def __init__(self, properties: dict[str, Property]):
+        """
+        Compile fields.
+
+        Args:
+            properties: Parsed stage fields (as from PropertiesParser.parse)
+        """
+        fields: list[CompiledField] = []
+
+        def flatten(props: dict[str, Property], prefix: str = "") -> None:
+            for name, prop in props.items():
+                full_path = f"{prefix}.{name}" if prefix else name
+                fields.append(
+                    CompiledField(
+                        path=full_path,
+                        required=prop.required,
+                        default=prop.default,
+                        checks=PropertyValidator.compile(prop),
+                    )
+                )
+                if isinstance(prop, DictProperty) and prop.properties:
+                    flatten(prop.properties, full_path)
+
+        flatten(properties)
+        self.fields: tuple[CompiledField, ...] = tuple(fields)
+
+    @property
+    def paths(self) -> tuple[str, ...]:
+        """Paths of all fields, in validation order."""
+        return tuple(compiled.path for compiled in self.fields)
+
+    @property
+    def required_paths(self) -> tuple[str, ...]:
+        """Paths of required fields, in validation order."""
+        return tuple(compiled.path for compiled in self.fields if compiled.required)
+
+    def validate(self, element: "Element") -> FieldValidationResult:
+        """
+        Check presence and constraints of all fields in one pass.
+
+        Args:
+            element: Element to check
+
+        Returns:
+            FieldValidationResult with missing and invalid paths
+        """
+        missing: dict[str, Any] = {}
+        invalid: dict[str, list[str]] = {}
+        for compiled in self.fields:
+            if not element.has_property(compiled.path):
+                if compiled.required:
+                    missing[compiled.path] = compiled.default
+                continue
+            value = element.get_property(compiled.path)
+            if value is None:
+                continue
+            type_check, *constraints = compiled.checks
+            type_error = type_check(value)
+            if type_error is not None:
+                # Wrong type: the remaining checks don't apply
+                invalid[compiled.path] = [type_error]
+                continue
+            errors = [
+                error for check in constraints if (error := check(value)) is not None
+            ]
+            if errors:
+                invalid[compiled.path] = errors
+        return FieldValidationResult(missing=missing, invalid=invalid)
@@ -1,12 +1,20 @@
 """Core Process class for StageFlow multi-stage validation orchestration."""
 
-from typing import cast
+import copy
+import hashlib
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, cast
 
 from stageflow.models import (
     Action,
     ActionSource,
     ActionType,
+    AnalysisMode,
     ConsistencyIssue,
+    ElementLocation,
     ExpectedObjectSchmema,
     ProcessDefinition,
     ProcessElementEvaluationResult,
@@ -17,10 +25,94 @@ from stageflow.models import (
     StageDefinition,
     StageObjectPropertyDefinition,
     StageSchemaMutations,
+    item_string_cache,
 )
 
-from .elements import Element
-from .stage import Stage, StageEvaluationResult, StageStatus
+from .cache import CacheStats, LRUCache
+from .dependencies import DependencyIndex, PathDependencies
+from .elements import CachedElement, Element
+from .stage import (
+    Stage,
+    StageEvaluationResult,
+    StageStatus,
+    stage_schema_mutations,
+)
+
+if TYPE_CHECKING:
+    from .analysis import AnalysisCache
+
+
+class RouteTable:
+    """
+    Shortest routes over a transition graph.
+
+    For each target a breadth-first search over the reversed edges records,
+    for every stage that can reach the target, the next stage on a shortest
+    route to it. Tables are built on first use and kept, so a route query is
+    a walk over its own length.
+    """
+
+    def __init__(self, transitions: Iterable[tuple[str, str]]):
+        """
+        Initialize table.
+
+        Args:
+            transitions: (from_stage, to_stage) edges, in declaration order
+        """
+        self._successors: dict[str, list[str]] = {}
+        self._predecessors: dict[str, list[str]] = {}
+        for from_stage, to_stage in dict.fromkeys(transitions):
+            self._successors.setdefault(from_stage, []).append(to_stage)
+            self._predecessors.setdefault(to_stage, []).append(from_stage)
+        self._next_hops: dict[tuple[str, bool], dict[str, str]] = {}
+
+    def next_hops(self, target: str, forward: bool = True) -> dict[str, str]:
+        """
+        Next stage towards ``target`` for every stage that can reach it.
+
+        Args:
+            target: Stage the routes lead to (maps to itself)
+            forward: Follow transitions forwards; otherwise backwards
+
+        Returns:
+            Stage ID -> next stage ID on a shortest route to ``target``
+        """
+        key = (target, forward)
+        table = self._next_hops.get(key)
+        if table is None:
+            neighbours = self._predecessors if forward else self._successors
+            table = {target: target}
+            queue = deque([target])
+            while queue:
+                stage_id = queue.popleft()
+                for neighbour in neighbours.get(stage_id, ()):
+                    if neighbour not in table:
+                        table[neighbour] = stage_id
+                        queue.append(neighbour)
+            self._next_hops[key] = table
+        return table
+
+    def route(
+        self, source: str, target: str, forward: bool = True
+    ) -> list[str] | None:
+        """
+        Shortest route from ``source`` to ``target``, both included.
+
+        Args:
+            source: Stage the route starts at
+            target: Stage the route ends at
+            forward: Follow transitions forwards; otherwise backwards
+
+        Returns:
+            Ordered stage IDs, or None if ``target`` can't be reached
+        """
+        hops = self.next_hops(target, forward)
+        if source not in hops:
+            return None
+        route = [source]
+        while route[-1] != target:
+            route.append(hops[route[-1]])
+        return route
 
 
 class PathSearch:
@@ -36,34 +128,33 @@ class PathSearch:
     def get_path(
         self, current: str, foward: bool = True, visited: set[str] | None = None
     ) -> set[str] | None:
-        visited = set(visited) if visited else set()
-        visited.add(current)
-        if current == self.target:
-            return visited
-        posible_paths = (
-            [
-                to_stage
-                for from_stage, to_stage in self.transitions
-                if from_stage == current and to_stage not in visited
-            ]
-            if foward
-            else [
-                from_stage
-                for from_stage, to_stage in self.transitions
-                if to_stage == current and from_stage not in visited
-            ]
-        )
-        if not posible_paths:
-            return None  # Dead end
-
-        for path in posible_paths:
-            result = self.get_path(path, foward, visited)
-            if result:
-                return result
-        return None
+        """Stages on a shortest route from ``current`` to the target.
 
+        Stages in ``visited`` are treated as already used and can't be part
+        of the route (``current`` itself excepted).
+        """
+        transitions = self.transitions
+        if visited:
+            blocked = set(visited) - {current}
+            transitions = [
+                (from_stage, to_stage)
+                for from_stage, to_stage in transitions
+                if from_stage not in blocked and to_stage not in blocked
+            ]
+        route = RouteTable(transitions).route(current, self.target, foward)
+        return set(route) if route else None
 
 
+def _definition_targets(config: StageDefinition) -> list[str]:
+    """Transition targets declared by a stage definition's gates."""
+    gates = config.get("gates") or []
+    gate_defs = gates.values() if isinstance(gates, dict) else gates
+    targets = [
+        gate_def.get("target_stage")
+        for gate_def in gate_defs
+        if isinstance(gate_def, dict)
+    ]
+    return list(dict.fromkeys(target for target in targets if target))
 
 
 class Process:
@@ -84,7 +175,7 @@ class Process:
     })
 
     _transition_map: list[tuple[str, str]]
-    _issues: list[ConsistencyIssue]
+    _issues: list[ConsistencyIssue] | None
     initial_stage: Stage
     final_stage: Stage
     stage_index: set[str]
@@ -92,12 +183,29 @@ class Process:
     def __init__(
         self,
         config: ProcessDefinition,
+        issues: list[ConsistencyIssue] | None = None,
+        trusted: bool = False,
+        lazy: bool = False,
+        analysis: AnalysisMode | str | None = None,
+        analysis_cache: "AnalysisCache | None" = None,
     ):
         """
         Initialize Process with configuration.
 
         Args:
             config: Process configuration dictionary
+            issues: Precomputed consistency issues for this exact definition
+                (e.g. from a compiled cache); when given, analysis is skipped
+            trusted: The configuration was already validated (e.g. a verified
+                artifact); skips construction-time re-validation of actions and
+                gates, and analysis when no issues are given
+            lazy: Build stages from their definitions on first access.
+                Errors in a stage definition then surface when that stage is
+                first used. Implies ``analysis="lazy"`` unless given.
+            analysis: When to run consistency analysis (eager, lazy or off);
+                see ``AnalysisMode``
+            analysis_cache: Per-stage analysis results to reuse (e.g. shared
+                by the versions of a process an editor creates)
         """
         self.config = config  # Store original config for consistency checker
         self.name = config["name"]
@@ -118,8 +226,39 @@ class Process:
         stages_definition = config.get("stages", {})
         initial_stage = config.get("initial_stage", "")
         final_stage = config.get("final_stage", "")
+        self._version = 0
+        self._definition_hash: str | None = None
+        self._projection_paths: dict[str, tuple[str, ...]] = {}
+        self._result_cache: (
+            LRUCache[tuple[str, str, str], ProcessElementEvaluationResult] | None
+        ) = None
+        if analysis is None:
+            analysis = AnalysisMode.LAZY if lazy else AnalysisMode.EAGER
+        try:
+            self._analysis_mode = AnalysisMode(analysis)
+        except ValueError as err:
+            raise ValueError(
+                f"Invalid analysis mode '{analysis}'. "
+                f"Must be one of: {', '.join([m.value for m in AnalysisMode])}"
+            ) from err
+        self._trusted = trusted
+        self._lazy = lazy
+        self._analysis_cache = analysis_cache
+        self._fingerprints: dict[str, str] = {}
         self._set_stages(stages_definition, initial_stage, final_stage)
-        self._issues = self._run_analysis()
+        self._dependency_index: DependencyIndex | None = (
+            None if lazy else DependencyIndex(self.stages)
+        )
+        self._route_table: RouteTable | None = None
+        self._issues = None
+        self._issues_version = -1
+        self._valid = True
+        if issues is not None:
+            self._store_issues(list(issues))
+        elif trusted or self._analysis_mode == AnalysisMode.OFF:
+            self._store_issues([])
+        elif self._analysis_mode == AnalysisMode.EAGER:
+            self._store_issues(self._run_analysis())
 
     def _set_stages(
         self, stage_definition: dict[str, StageDefinition], initial: str, final: str
@@ -141,7 +280,8 @@ class Process:
         if len(set(index)) != len(index):
             raise ValueError("Process stages must have unique names")
         self._transition_map = []
-        self.stages = []
+        self._stages: dict[str, Stage | None] = {}
+        self._stage_definitions: dict[str, StageDefinition] = {}
         self._stage_index = set()
         for name in index:
             stage_config = stage_definition[name]
@@ -150,7 +290,10 @@ class Process:
                 stage_config = cast(StageDefinition, {})
             is_final = name == final
             stage_config["is_final"] = is_final
-            self._add_stage(name, stage_config)
+            if self._lazy:
+                self._add_stage_definition(name, stage_config)
+            else:
+                self._add_stage(name, stage_config, trusted=self._trusted)
         begin = self.get_stage(initial)
         end = self.get_stage(final)
         if not begin or not end:
@@ -161,16 +304,71 @@ class Process:
         # Validate that stages without gates are either final or terminal (referenced by other gates)
         self._validate_terminal_stages()
 
-    def _add_stage(self, id: str, config: StageDefinition) -> None:
+    def _add_stage(
+        self, id: str, config: StageDefinition, trusted: bool = False
+    ) -> None:
         """Add a new stage to the process."""
-        stage = Stage(id=id, config=config)
-        self.stages.append(stage)
         if id in self._stage_index:
             raise ValueError(f"Duplicate stage id '{id}' in process")
+        stage = Stage(id=id, config=config, trusted=trusted)
+        self._stages[id] = stage
+        self._stage_definitions[id] = config
+        self._fingerprints.pop(id, None)
         self._stage_index.add(id)
         for target in stage.posible_transitions:
             self._transition_map.append((id, target))
 
+    def _add_stage_definition(self, id: str, config: StageDefinition) -> None:
+        """Register a stage without building it (lazy mode)."""
+        self._stages[id] = None
+        self._stage_definitions[id] = config
+        self._fingerprints.pop(id, None)
+        self._stage_index.add(id)
+        for target in _definition_targets(config):
+            self._transition_map.append((id, target))
+
+    def _materialize(self, id: str) -> Stage:
+        """Get a stage object, building and keeping it if needed.
+
+        Args:
+            id: Stage id (must be a stage of this process)
+        """
+        stage = self._stages[id]
+        if stage is None:
+            stage = Stage(
+                id=id, config=self._stage_definitions[id], trusted=self._trusted
+            )
+            # Racing first accesses may each build an (equivalent) stage
+            self._stages[id] = stage
+        return stage
+
+    @property
+    def stages(self) -> list[Stage]:
+        """All stages in definition order (builds any not yet materialized)."""
+        return [self._materialize(id) for id in self._stages]
+
+    @stages.setter
+    def stages(self, stages: list[Stage]) -> None:
+        self._stages = {stage._id: stage for stage in stages}
+        self._stage_definitions = {stage._id: stage.to_dict() for stage in stages}
+        self._fingerprints = {}
+
+    @property
+    def stage_ids(self) -> list[str]:
+        """Stage ids in definition order, without building stages."""
+        return list(self._stages)
+
+    @property
+    def materialized_stages(self) -> list[str]:
+        """Ids of the stages built so far (all of them unless lazy)."""
+        return [id for id, stage in self._stages.items() if stage is not None]
+
+    def _has_gates(self, id: str) -> bool:
+        stage = self._stages[id]
+        if stage is not None:
+            return bool(stage.gates)
+        return bool(self._stage_definitions[id].get("gates"))
+
     def _validate_terminal_stages(self) -> None:
         """Validate that stages without gates are either final or referenced as targets."""
         # Terminal stage validation is now handled by the consistency checker
@@ -178,46 +376,196 @@ class Process:
         pass
 
     def _run_analysis(self) -> list[ConsistencyIssue]:
-        """Run process analysis and return issues."""
-        from stageflow.analysis import ProcessAnalyzer
+        """Run process analysis and return issues.
 
-        graph = self.to_graph()
-        mutations = self._extract_stage_mutations()
-        analyzer = ProcessAnalyzer(graph, mutations)
-        return analyzer.get_issues()
+        Graph checks always run. Stage and gate checks come from the analysis
+        cache unless the stage definition changed, so schema mutations are
+        only extracted for new or edited stages (for stages not yet
+        materialized, straight from their definitions).
+        """
+        from stageflow.analysis.graph import GraphAnalyzer
 
-    def _extract_stage_mutations(self) -> list[StageSchemaMutations]:
-        """Extract schema mutations for each stage."""
+        issues = GraphAnalyzer(self.to_graph()).get_issues()
+        cache = self.analysis_cache
         targets = {to_id for _, to_id in self._transition_map}
-        return [
-            stage.to_schema_mutations(is_transition_target=stage._id in targets)
-            for stage in self.stages
-        ]
+        for id in self._stages:
+            is_target = id in targets
+            issues.extend(
+                cache.stage_issues(
+                    (id, is_target, self._stage_fingerprint(id)),
+                    lambda id=id, is_target=is_target: self._stage_mutations(
+                        id, is_target
+                    ),
+                )
+            )
+        return issues
+
+    def _stage_mutations(self, id: str, is_target: bool) -> StageSchemaMutations:
+        stage = self._stages[id]
+        if stage is None:
+            return stage_schema_mutations(
+                id,
+                self._stage_definitions[id],
+                is_transition_target=is_target,
+                trusted=self._trusted,
+            )
+        return stage.to_schema_mutations(is_transition_target=is_target)
+
+    def _stage_fingerprint(self, id: str) -> str:
+        """Content hash of a stage definition (memoized until it changes)."""
+        value = self._fingerprints.get(id)
+        if value is None:
+            from stageflow.analysis.cache import fingerprint
+
+            value = fingerprint(self._stage_definitions[id])
+            self._fingerprints[id] = value
+        return value
+
+    @property
+    def analysis_cache(self) -> "AnalysisCache":
+        """Per-stage analysis results reused across re-analyses."""
+        if self._analysis_cache is None:
+            from stageflow.analysis import AnalysisCache
+
+            self._analysis_cache = AnalysisCache()
+        return self._analysis_cache
+
+    @property
+    def trusted(self) -> bool:
+        """Whether the process was built from a pre-validated definition."""
+        return self._trusted
+
+    @property
+    def lazy(self) -> bool:
+        """Whether stages are built on first access."""
+        return self._lazy
+
+    @property
+    def analysis_mode(self) -> AnalysisMode:
+        """When consistency analysis runs (see ``AnalysisMode``)."""
+        return self._analysis_mode
+
+    @analysis_mode.setter
+    def analysis_mode(self, mode: AnalysisMode | str) -> None:
+        self._analysis_mode = AnalysisMode(mode)
+
+    def _store_issues(self, issues: list[ConsistencyIssue]) -> None:
+        """Record issues and the validity flag for the current version."""
+        self._issues = issues
+        self._issues_version = self._version
+        self._valid = not any(
+            issue.issue_type in self.BLOCKING_ISSUE_TYPES for issue in issues
+        )
+
+    @property
+    def _issues_stale(self) -> bool:
+        if self._analysis_mode == AnalysisMode.OFF:
+            return self._issues is None
+        return self._issues is None or self._issues_version != self._version
 
     @property
     def issues(self) -> list[ConsistencyIssue]:
-        """Get consistency issues in the process."""
-        return self._issues
+        """Get consistency issues in the process (runs deferred analysis).
+
+        With analysis off these are the issues from the last ``reanalyze()``
+        (or the ones given on construction), even if the process changed since.
+        """
+        if self._issues_stale:
+            self._store_issues(self._run_analysis())
+        return cast(list[ConsistencyIssue], self._issues)
 
     @property
     def is_valid(self) -> bool:
-        """Check if process has no blocking issues."""
-        return not any(
-            issue.issue_type in self.BLOCKING_ISSUE_TYPES
-            for issue in self._issues
-        )
+        """Check if process has no blocking issues.
+
+        Cached per process version, so repeated checks are a flag lookup.
+        """
+        if self._issues_stale:
+            self._store_issues(self._run_analysis())
+        return self._valid
+
+    @property
+    def issues_current(self) -> bool:
+        """Whether ``issues`` reflect the current version of the process."""
+        return self._issues is not None and self._issues_version == self._version
 
     def reanalyze(self) -> list[ConsistencyIssue]:
         """Re-run analysis after mutations and return issues.
 
         Call this after modifying the process (add_stage, remove_stage, etc.)
-        to update the consistency issues.
+        to update the consistency issues. Runs regardless of the analysis mode.
 
         Returns:
             Updated list of consistency issues
         """
-        self._issues = self._run_analysis()
-        return self._issues
+        self._store_issues(self._run_analysis())
+        return self._issues  # type: ignore[return-value]
+
+    def _analyze_after_mutation(self) -> None:
+        """Refresh issues after a structural change when analysis is eager."""
+        if self._analysis_mode == AnalysisMode.EAGER:
+            self._store_issues(self._run_analysis())
+
+    @contextmanager
+    def deferred_analysis(self) -> Iterator["Process"]:
+        """Batch mutations and analyze once at the end.
+
+        Inside the block analysis behaves as in lazy mode. On exit the
+        previous mode is restored and, if it is eager, a single analysis pass
+        runs over the final process.
+        """
+        previous = self._analysis_mode
+        self._analysis_mode = AnalysisMode.LAZY
+        try:
+            yield self
+        finally:
+            self._analysis_mode = previous
+        if previous == AnalysisMode.EAGER and self._issues_stale:
+            self._store_issues(self._run_analysis())
+
+    def _invalidate_caches(self) -> None:
+        """Bump the process version and drop state derived from the definition."""
+        self._version += 1
+        self._definition_hash = None
+        self._projection_paths = {}
+        self._dependency_index = None
+        self._route_table = None
+
+    @property
+    def route_table(self) -> RouteTable:
+        """Shortest-route tables over the transitions of this process version."""
+        if self._route_table is None:
+            self._route_table = RouteTable(self._transition_map)
+        return self._route_table
+
+    @property
+    def dependency_index(self) -> DependencyIndex:
+        """Index from property path to the fields, locks, gates and stages reading it."""
+        if self._dependency_index is None:
+            self._dependency_index = DependencyIndex(self.stages)
+        return self._dependency_index
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter incremented on every structural mutation."""
+        return self._version
+
+    @property
+    def definition_hash(self) -> str:
+        """Stable content hash of the process definition.
+
+        Covers the serialized stages, regression policy and transition map,
+        so it changes whenever the process is mutated.
+        """
+        if self._definition_hash is None:
+            payload = {
+                "definition": self.to_dict(),
+                "regression_policy": self.regression_policy,
+                "transitions": sorted(self._transition_map),
+            }
+            encoded = json.dumps(payload, sort_keys=True, default=str)
+            self._definition_hash = hashlib.sha256(encoded.encode()).hexdigest()
+        return self._definition_hash
 
     # =========================================================================
     # Path Finding Methods (public API for analyzers)
@@ -236,8 +584,9 @@ class Process:
         """
         if from_stage_id == to_stage_id:
             return True
+        if not exclude:
+            return from_stage_id in self.route_table.next_hops(to_stage_id)
 
-        exclude = exclude or set()
         if from_stage_id in exclude:
             return False
 
@@ -261,25 +610,30 @@ class Process:
         return [to_id for from_id, to_id in self._transition_map if from_id == stage_id]
 
     def _get_path_to_final(self, stage: Stage) -> list[Stage]:
-        """Get path from given stage to final stage."""
-        search = PathSearch(self._transition_map, self.final_stage._id)
-        path_ids = search.get_path(stage._id) or []
+        """Get the shortest path from given stage to final stage, in order."""
+        path_ids = self.route_table.route(stage._id, self.final_stage._id) or []
         stages_path = [self.get_stage(stage_id) for stage_id in path_ids]
         return [s for s in stages_path if s]
 
     def _get_previous_stages(self, current_stage: Stage) -> list[Stage]:
-        """Get a path of previous stages leading to the current stage."""
-        search = PathSearch(self._transition_map, self.initial_stage._id)
-        previous_ids = search.get_path(current_stage._id, foward=False) or []
+        """Get the shortest path of previous stages, from the initial stage on."""
+        previous_ids = (
+            self.route_table.route(
+                current_stage._id, self.initial_stage._id, forward=False
+            )
+            or []
+        )
         # Exclude the current stage itself from previous stages
-        stages = [self.get_stage(stage_id) for stage_id in previous_ids if stage_id != current_stage._id]
+        stages = [self.get_stage(stage_id) for stage_id in reversed(previous_ids[1:])]
         return [stage for stage in stages if stage]
 
     def _check_regression(
         self,
         element: Element,
         current_stage: Stage,
-        policy: "RegressionPolicy"
+        policy: "RegressionPolicy",
+        previous: RegressionDetails | None = None,
+        affected: PathDependencies | None = None,
     ) -> "RegressionDetails":
         """
         Check if element has regressed from previous stages.
@@ -291,6 +645,9 @@ class Process:
             element: Element being evaluated
             current_stage: Current stage in process
             policy: Regression policy being applied
+            previous: Optional earlier regression details for the same element
+            affected: Dependents of changed paths; stages not listed reuse
+                their outcome from ``previous``
 
         Returns:
             RegressionDetails with comprehensive regression information
@@ -313,6 +670,14 @@ class Process:
         failed_gates = {}
 
         for stage in previous_stages:
+            if previous is not None and affected is not None:
+                if stage._id not in affected.stages:
+                    self._copy_regression_outcome(
+                        previous, stage._id, failed_stages, failed_statuses,
+                        missing_properties, failed_gates,
+                    )
+                    continue
+
             result = stage.evaluate(element)
 
             if result.status != StageStatus.READY:
@@ -349,6 +714,27 @@ class Process:
 
         return details
 
+    @staticmethod
+    def _copy_regression_outcome(
+        previous: RegressionDetails,
+        stage_id: str,
+        failed_stages: list[str],
+        failed_statuses: dict[str, str],
+        missing_properties: dict[str, list[str]],
+        failed_gates: dict[str, list[str]],
+    ) -> None:
+        """Carry one stage's regression outcome over from earlier details."""
+        if stage_id not in previous["failed_stages"]:
+            return
+        failed_stages.append(stage_id)
+        failed_statuses[stage_id] = previous["failed_statuses"][stage_id]
+        previous_missing = previous.get("missing_properties", {})
+        if stage_id in previous_missing:
+            missing_properties[stage_id] = previous_missing[stage_id]
+        previous_gates = previous.get("failed_gates", {})
+        if stage_id in previous_gates:
+            failed_gates[stage_id] = previous_gates[stage_id]
+
     def _extract_missing_properties(self, result: StageEvaluationResult) -> list[str]:
         """Extract missing property names from INCOMPLETE result."""
         import re
@@ -389,20 +775,15 @@ class Process:
         return messages
 
     def _find_route(self, from_stage_id: str, to_stage_id: str) -> list[str] | None:
-        """Find a route from one stage to another."""
-        search = PathSearch(self._transition_map, to_stage_id)
-        route = search.get_path(from_stage_id)
-        if not route:
-            route = search.get_path(to_stage_id, foward=False)
-        return list(route) if route else None
+        """Find the shortest route from one stage to another, both included."""
+        return self.route_table.route(from_stage_id, to_stage_id)
 
     # Utility methods
     def get_stage(self, stage_id: str) -> Stage | None:
         """Retrieve stage by id."""
-        for stage in self.stages:
-            if stage._id == stage_id:
-                return stage
-        return None
+        if stage_id not in self._stages:
+            return None
+        return self._materialize(stage_id)
 
     def get_sorted_stages(self) -> list[str]:
         """Get stages in topological order for visualization."""
@@ -426,9 +807,9 @@ class Process:
             collect_stages(self.initial_stage._id)
 
         # Add remaining stages
-        for stage in self.stages:
-            if stage._id not in visited:
-                stage_order.append(stage._id)
+        for stage_id in self._stages:
+            if stage_id not in visited:
+                stage_order.append(stage_id)
 
         return stage_order
 
@@ -521,12 +902,31 @@ class Process:
         if not current_stage:
             raise ValueError(f"Stage '{stage_name}' not found in process")
 
-        # Evaluate current stage
-        current_stage_result = current_stage.evaluate(element)
+        if self._result_cache is None:
+            with item_string_cache():
+                return self._evaluate_in_stage(element, current_stage)
 
-        # Inject stage_prop into transition actions if configured
-        current_stage_result = self._inject_stage_prop_into_actions(current_stage_result)
+        cache_key = self._result_cache_key(element, current_stage)
+        result = self._result_cache.get(cache_key)
+        if result is None:
+            with item_string_cache():
+                result = self._evaluate_in_stage(element, current_stage)
+            self._result_cache.put(cache_key, result)
+        # Hand out a fresh top-level dict so callers cannot alter the cached entry
+        return cast(ProcessElementEvaluationResult, dict(result))
 
+    def _evaluate_in_stage(
+        self,
+        element: Element,
+        current_stage: Stage,
+        previous: ProcessElementEvaluationResult | None = None,
+        affected: PathDependencies | None = None,
+    ) -> ProcessElementEvaluationResult:
+        """Evaluate element against a resolved stage, including regression checks.
+
+        With ``previous`` and ``affected``, unaffected gate, lock and regression
+        outcomes are reused from the previous result.
+        """
         # Get regression policy
         try:
             policy = RegressionPolicy(self.regression_policy)
@@ -534,6 +934,24 @@ class Process:
             # Invalid policy, default to WARN
             policy = RegressionPolicy.WARN
 
+        previous_stage_result = None
+        previous_regression = None
+        if previous is not None and affected is not None:
+            previous_regression = previous["regression_details"]
+            # A BLOCK override replaces the stage's own outcome, so it cannot be reused
+            if not (
+                policy == RegressionPolicy.BLOCK and previous_regression["detected"]
+            ):
+                previous_stage_result = previous["stage_result"]
+
+        # Evaluate current stage
+        current_stage_result = current_stage.evaluate(
+            element, previous=previous_stage_result, affected=affected
+        )
+
+        # Inject stage_prop into transition actions if configured
+        current_stage_result = self._inject_stage_prop_into_actions(current_stage_result)
+
         # Check regression if not ignored
         if policy == RegressionPolicy.IGNORE:
             regression_details = RegressionDetails(
@@ -544,7 +962,11 @@ class Process:
             )
         else:
             regression_details = self._check_regression(
-                element, current_stage, policy
+                element,
+                current_stage,
+                policy,
+                previous=previous_regression,
+                affected=affected,
             )
 
             # If policy is BLOCK and regression detected, override status
@@ -576,6 +998,105 @@ class Process:
             regression_details=regression_details
         )
 
+    # Result caching
+    def enable_result_cache(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        cache: LRUCache | None = None,
+    ) -> LRUCache:
+        """
+        Put an LRU/TTL result cache in front of evaluate().
+
+        Entries are keyed by the process definition hash, the resolved stage
+        and a hash of the element projected onto the paths that evaluation
+        reads (the stage's required paths, plus previous stages' paths when
+        regression checks are enabled). Changes to unrelated element fields
+        therefore still hit the cache, and mutating the process changes the
+        definition hash so stale entries are never served.
+
+        Cached results are shared between hits; treat them as read-only.
+
+        Args:
+            max_size: Maximum number of cached results
+            ttl: Optional entry lifetime in seconds
+            cache: Existing cache to use (e.g. shared between processes)
+
+        Returns:
+            The cache now in use
+        """
+        self._result_cache = cache if cache is not None else LRUCache(max_size, ttl)
+        return self._result_cache
+
+    def disable_result_cache(self) -> None:
+        """Stop caching evaluation results."""
+        self._result_cache = None
+
+    @property
+    def result_cache(self) -> LRUCache | None:
+        """The evaluation result cache, if enabled."""
+        return self._result_cache
+
+    @property
+    def cache_stats(self) -> CacheStats | None:
+        """Hit/miss/eviction counters of the result cache, if enabled."""
+        return self._result_cache.stats if self._result_cache is not None else None
+
+    def _get_projection_paths(self, stage: Stage) -> tuple[str, ...]:
+        """Get the element paths whose values determine the stage's result."""
+        paths = self._projection_paths.get(stage._id)
+        if paths is None:
+            collected = list(stage.required_paths)
+            if self.regression_policy != RegressionPolicy.IGNORE.value:
+                for previous in self._get_previous_stages(stage):
+                    collected.extend(previous.required_paths)
+            paths = tuple(dict.fromkeys(collected))
+            self._projection_paths[stage._id] = paths
+        return paths
+
+    def _result_cache_key(
+        self, element: Element, stage: Stage
+    ) -> tuple[str, str, str]:
+        """Build the cache key for evaluating element in stage."""
+        projection = [
+            (path, element.has_property(path), element.get_property(path))
+            for path in self._get_projection_paths(stage)
+        ]
+        try:
+            encoded = json.dumps(
+                projection, sort_keys=True, default=repr, separators=(",", ":")
+            )
+        except TypeError:
+            # Mixed-type mapping keys cannot be sorted; fall back to repr
+            encoded = repr(projection)
+        digest = hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+        return (self.definition_hash, stage._id, digest)
+
+    def copy(self) -> "Process":
+        """Structural copy that shares stages with this process.
+
+        Stage objects and stage definitions are treated as immutable and
+        shared; only the containers indexing them are copied, so a mutation of
+        either process never affects the other. Cached issues, fingerprints
+        and the analysis cache carry over, while the result cache does not.
+
+        Returns:
+            New Process with the same definition and version
+        """
+        clone = copy.copy(self)
+        clone.config = cast(
+            ProcessDefinition,
+            {**self.config, "stages": dict(self.config.get("stages") or {})},
+        )
+        clone._stages = dict(self._stages)
+        clone._stage_definitions = dict(self._stage_definitions)
+        clone._fingerprints = dict(self._fingerprints)
+        clone._stage_index = set(self._stage_index)
+        clone._transition_map = list(self._transition_map)
+        clone._projection_paths = dict(self._projection_paths)
+        clone._result_cache = None
+        return clone
+
     # Mutation methods
     def add_stage(self, id: str, config: StageDefinition) -> None:
         """Add a new stage to the process."""
@@ -584,7 +1105,8 @@ class Process:
         if "stages" not in self.config:
             self.config["stages"] = {}
         self.config["stages"][id] = config
-        self._issues = self._run_analysis()
+        self._invalidate_caches()
+        self._analyze_after_mutation()
 
     def remove_stage(self, stage_name: str) -> None:
         """Remove a stage from the process."""
@@ -593,19 +1115,50 @@ class Process:
             raise ValueError(f"Stage '{stage_name}' not found in process")
         if stage.is_final or stage.name == self.initial_stage.name:
             raise ValueError("Cannot remove initial or final stage from process")
-        self.stages.remove(stage)
+        del self._stages[stage._id]
+        self._stage_definitions.pop(stage._id, None)
+        self._fingerprints.pop(stage._id, None)
         self._stage_index.remove(stage._id)
         self._transition_map = [
             (from_stage, to_stage)
             for from_stage, to_stage in self._transition_map
             if from_stage != stage._id and to_stage != stage._id
         ]
-        self._issues = self._run_analysis()
+        self._invalidate_caches()
+        self._analyze_after_mutation()
+
+    def replace_stage(self, stage_id: str, config: StageDefinition) -> None:
+        """Replace a stage's definition in place.
+
+        Keeps the stage's position and its role as initial or final stage.
+        Transitions out of the stage are replaced by the new gates' targets.
+        """
+        if stage_id not in self._stages:
+            raise ValueError(f"Stage '{stage_id}' not found in process")
+        if stage_id == self.final_stage._id:
+            config["is_final"] = True
+        stage = Stage(id=stage_id, config=config)
+        self._stages[stage_id] = stage
+        self._stage_definitions[stage_id] = config
+        self._fingerprints.pop(stage_id, None)
+        self._transition_map = [
+            (from_stage, to_stage)
+            for from_stage, to_stage in self._transition_map
+            if from_stage != stage_id
+        ] + [(stage_id, target) for target in stage.posible_transitions]
+        if stage_id == self.initial_stage._id:
+            self.initial_stage = stage
+        if stage_id == self.final_stage._id:
+            self.final_stage = stage
+        self.config.setdefault("stages", {})[stage_id] = config
+        self._invalidate_caches()
+        self._analyze_after_mutation()
 
     def add_transition(self, from_stage: str, to_stage: str) -> None:
         """Add a transition between two stages."""
         self._transition_map.append((from_stage, to_stage))
-        self._issues = self._run_analysis()
+        self._invalidate_caches()
+        self._analyze_after_mutation()
 
     def get_schema(
         self, stage_name: str, partial: bool = True
@@ -712,11 +1265,143 @@ class Process:
         # Priority 3: Default to initial_stage
         return self.initial_stage._id
 
+    def reevaluate(
+        self,
+        prev_result: ProcessElementEvaluationResult,
+        element: Element,
+        changed_paths: Iterable[str],
+        current_stage_name: str | None = None,
+    ) -> ProcessElementEvaluationResult:
+        """
+        Re-evaluate an element after some of its properties changed.
+
+        Uses the dependency index to re-run only the required-field checks,
+        locks, gates and regression checks that read a changed path (or a
+        parent/child of one); everything else is reused from ``prev_result``.
+        Falls back to a full evaluation when the resolved stage differs from
+        the one in ``prev_result``.
+
+        Args:
+            prev_result: Result of the last evaluation of this element
+            element: Element with the changes applied
+            changed_paths: Property paths modified since ``prev_result``
+            current_stage_name: Optional explicit stage name
+
+        Returns:
+            ProcessElementEvaluationResult equivalent to a full evaluate()
+        """
+        if not self.is_valid:
+            raise ValueError(
+                "Cannot evaluate element in an inconsistent process configuration"
+            )
+
+        changed_paths = list(changed_paths)
+        stage_name = self._extract_current_stage(element, current_stage_name)
+        if stage_name != prev_result["stage"]:
+            return self.evaluate(element, stage_name)
+
+        current_stage = self.get_stage(stage_name)
+        if not current_stage:
+            raise ValueError(f"Stage '{stage_name}' not found in process")
+
+        affected = self.dependency_index.affected(changed_paths)
+        if not affected:
+            return cast(ProcessElementEvaluationResult, dict(prev_result))
+
+        with item_string_cache():
+            return self._evaluate_in_stage(
+                element, current_stage, previous=prev_result, affected=affected
+            )
+
     def evaluate_batch(
-        self, elements: list[Element]
+        self, elements: Iterable[Element], current_stage_name: str | None = None
     ) -> list[ProcessElementEvaluationResult]:
-        """Evaluate multiple elements in batch."""
-        return [self.evaluate(element) for element in elements]
+        """
+        Evaluate multiple elements in batch.
+
+        Accepts any iterable, so lazy sources such as ``JsonlElementStore``
+        are consumed one element at a time.
+
+        Args:
+            elements: Elements to evaluate
+            current_stage_name: Optional explicit stage applied to every element
+
+        Returns:
+            Evaluation results in input order
+        """
+        return [self.evaluate(element, current_stage_name) for element in elements]
+
+    def evaluate_all_stages(self, element: Element) -> dict[str, StageEvaluationResult]:
+        """
+        Evaluate an element against every stage of the process.
+
+        All stages read the element through one CachedElement, so each
+        property path is resolved once and a lock shared by several gates
+        (identical definitions are interned by LockFactory) is validated once.
+
+        Args:
+            element: Element to evaluate
+
+        Returns:
+            Stage ID -> StageEvaluationResult, in stage order
+        """
+        if not self.is_valid:
+            raise ValueError(
+                "Cannot evaluate element in an inconsistent process configuration"
+            )
+        cached = CachedElement(element)
+        with item_string_cache():
+            return {stage._id: stage.evaluate(cached) for stage in self.stages}
+
+    def locate(self, element: Element, all_stages: bool = False) -> ElementLocation:
+        """
+        Find the furthest stage an element reaches from the initial stage.
+
+        Walks from ``initial_stage`` through the first passing gate of each
+        READY stage, stopping at a stage that is not READY, at the final
+        stage or when a stage repeats. Stage evaluations share one
+        CachedElement, as in ``evaluate_all_stages``.
+
+        Args:
+            element: Element to locate
+            all_stages: Report the status of every stage, not only the walked ones
+
+        Returns:
+            ElementLocation with the furthest stage, the walked path and the
+            status of each evaluated stage
+        """
+        if not self.is_valid:
+            raise ValueError(
+                "Cannot evaluate element in an inconsistent process configuration"
+            )
+        cached = CachedElement(element)
+        statuses: dict[str, str] = {}
+        path: list[str] = []
+        with item_string_cache():
+            stage: Stage | None = self.initial_stage
+            while stage is not None and stage._id not in statuses:
+                result = stage.evaluate(cached)
+                statuses[stage._id] = result.status.value
+                path.append(stage._id)
+                if result.status != StageStatus.READY or stage is self.final_stage:
+                    break
+                passing = next(
+                    (
+                        gate
+                        for gate in stage.gates
+                        if gate.name in result.results
+                        and result.results[gate.name].success
+                    ),
+                    None,
+                )
+                stage = self.get_stage(passing.target_stage) if passing else None
+
+            if all_stages:
+                for other in self.stages:
+                    if other._id not in statuses:
+                        statuses[other._id] = other.evaluate(cached).status.value
+
+        return ElementLocation(stage=path[-1], path=path, statuses=statuses)
 
     # Serialization methods
     def to_dict(self) -> ProcessDefinition:
@@ -745,6 +1430,6 @@ class Process:
             edges=tuple(self._transition_map),
             initial_id=self.initial_stage._id,
             final_id=self.final_stage._id,
-            stage_ids=frozenset(s._id for s in self.stages),
-            stages_with_gates=frozenset(s._id for s in self.stages if s.gates),
+            stage_ids=frozenset(self._stages),
+            stages_with_gates=frozenset(id for id in self._stages if self._has_gates(id)),
         )
@@ -11,6 +11,7 @@ from ruamel.yaml import YAML
 
 from stageflow.element import Element, create_element
 from stageflow.gate import GateDefinition
+from stageflow.loader.parsing import parse_document
 from stageflow.lock import (
     LockType,
 )
@@ -151,8 +152,7 @@ class FileReader:
     @staticmethod
     def _parse_yaml(file_handle) -> dict:
         """Parse YAML content."""
-        yaml = YAML(typ="safe", pure=True)
-        return yaml.load(file_handle)
+        return parse_document(file_handle.read())
 
     @staticmethod
     def _parse_json(file_handle) -> dict:
@@ -1,9 +1,11 @@
 """Stage definition and validation for StageFlow."""
 
+import threading
 from dataclasses import dataclass
 from enum import StrEnum
 from typing import Any, cast
 
+from .dependencies import PathDependencies
 from .elements import Element
 from .gate import Gate, GateResult
 from .models import (
@@ -11,6 +13,7 @@ from .models import (
     ActionDefinition,
     ActionSource,
     ActionType,
+    FieldValidator,
     GateDefinition,
     InferredType,
     PropertySchema,
@@ -20,6 +23,23 @@ from .models import (
     StageSchemaMutations,
 )
 
+# Field type name -> inferred schema type
+_FIELD_TYPE_MAPPING: dict[str, InferredType] = {
+    "string": InferredType.STRING,
+    "int": InferredType.INTEGER,
+    "number": InferredType.NUMBER,
+    "bool": InferredType.BOOLEAN,
+    "list": InferredType.ARRAY,
+    "dict": InferredType.OBJECT,
+}
+
+# Attributes the initial and final schemas are derived from; assigning any of
+# them drops the memoized schemas
+_SCHEMA_INPUTS = frozenset({"name", "gates", "stage_actions", "_properties"})
+
+# Serializes schema builds so concurrent readers build each stage's schemas once
+_schema_build_lock = threading.Lock()
+
 
 class StageStatus(StrEnum):
     """Stage evaluation status indicating required action.
@@ -147,6 +167,53 @@ class StageEvaluationResult:
     validation_messages: list[str]       # Generated from gate failures
 
 
+@dataclass(frozen=True)
+class ActionTemplate:
+    """Static part of a computed action, rendered once per stage.
+
+    Only the action ID index and per-evaluation values (defaults, actual
+    values, validated properties) are filled in when an action is built.
+    """
+
+    name: str
+    id_name: str  # sanitized name, as used in action IDs
+    description: str = ""
+    instructions: tuple[str, ...] = ()
+
+    def action_id(self, index: int, stage_id: str) -> str:
+        """Action ID at the given position within an evaluation."""
+        return f"{index}:{stage_id}:{self.id_name}"
+
+
+@dataclass(frozen=True)
+class StageEvaluationPlan:
+    """Everything about a stage's evaluation that doesn't depend on the element.
+
+    Built once per stage (see Stage.plan); Stage.evaluate only runs the
+    checks and fills dynamic values into these templates.
+
+    Fields:
+        fields: Compiled field checks (flattened required and typed paths)
+        gates: Gates in evaluation order
+        configured_actions: Fully built EXECUTE_ACTION actions from
+            expected_actions, with IDs and unique names
+        transitions: TRANSITION action template per gate name
+        ready_messages: READY validation message per gate name
+        resolve_actions: RESOLVE_VALIDATION name per gate name
+        provide_actions: PROVIDE_DATA template per required field path
+        fix_actions: RESOLVE_VALIDATION template per field path
+    """
+
+    fields: FieldValidator
+    gates: tuple[Gate, ...]
+    configured_actions: tuple[Action, ...]
+    transitions: dict[str, ActionTemplate]
+    ready_messages: dict[str, str]
+    resolve_actions: dict[str, ActionTemplate]
+    provide_actions: dict[str, ActionTemplate]
+    fix_actions: dict[str, ActionTemplate]
+
+
 
 
 # StageObjectPropertyDefinition, ExpectedObjectSchmema, and StageDefinition
@@ -169,6 +236,7 @@ class Stage:
         self,
         id: str,
         config: StageDefinition,
+        trusted: bool = False,
     ):
         """
         Initialize Stage with configuration.
@@ -176,34 +244,17 @@ class Stage:
         Args:
             id: Unique identifier for the stage
             config: Stage configuration dictionary
+            trusted: Skip re-validating gates and actions (already validated)
         """
         self._id = id
+        self._schemas: tuple[StageSchema, dict[str, StageSchema]] | None = None
+        self._plan: StageEvaluationPlan | None = None
         # Stage name can come from config (if specified) or defaults to the id
         self.name = config.get("name", id)
         self.description = config.get("description", "")
 
         # Define gates and required properties from those gates
-        # Gates can be either a dict (with gate names as keys) or a list
-        gates_config = config.get("gates", [])
-        if isinstance(gates_config, dict):
-            # Convert dict format to list format, adding gate name
-            gates_list = [
-                {**gate_def, "name": gate_name}
-                for gate_name, gate_def in gates_config.items()
-            ]
-        else:
-            gates_list = gates_config
-
-        gates_definition: list[GateDefinition] = [
-            cast(
-                GateDefinition,
-                {
-                    **gate_def,
-                    "parent_stage": self._id,
-                },
-            )
-            for gate_def in gates_list
-        ]
+        gates_definition = _gate_definitions(self._id, config)
         self.is_final = config.get("is_final", False)
         # Allow stages without gates if they are final or if they are terminal states
         # (We'll validate terminal states at the process level where we have full context)
@@ -211,19 +262,17 @@ class Stage:
             # This validation will be moved to process level where we can check
             # if this stage is referenced as a target by other gates
             pass
-        self.gates = tuple(Gate(definition) for definition in gates_definition)
+        self.gates = tuple(
+            Gate(definition, trusted=trusted) for definition in gates_definition
+        )
         self._evaluated_paths = [
             path for gate in self.gates for path in gate.required_paths
         ]
+        self._required_paths: tuple[str, ...] | None = None
+        self._field_validator: FieldValidator | None = None
 
         # Parse new fields property using Pydantic models
-        from stageflow.models import PropertiesParser
-
-        fields_spec = config.get("fields", [])
-        if fields_spec:
-            self._properties = PropertiesParser.parse(fields_spec)
-        else:
-            self._properties = {}
+        self._properties = _parse_fields(config)
 
         # Note: Schema validation disabled to allow gates to add new properties
         # (schema transformation feature). Gate properties can exist outside fields.
@@ -231,16 +280,56 @@ class Stage:
 
         # Validate action definitions
         actions = config.get("expected_actions", [])
-        self._validate_actions(actions)
+        if not trusted:
+            self._validate_actions(actions)
         self.stage_actions = actions
 
         # Gate target validation moved to ProcessConsistencyChecker
+        self._plan = self._build_plan()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SCHEMA_INPUTS:
+            super().__setattr__("_schemas", None)
+            super().__setattr__("_plan", None)
+        if name == "_properties":
+            super().__setattr__("_field_validator", None)
+            super().__setattr__("_required_paths", None)
 
     @property
     def posible_transitions(self) -> list[str]:
         """Get all possible target stages from this stage's gates."""
         return list({gate.target_stage for gate in self.gates})
 
+    @property
+    def required_paths(self) -> tuple[str, ...]:
+        """Get every element path read when evaluating this stage.
+
+        Includes field paths (at any nesting level) and the paths checked by
+        gate locks, in a stable order.
+        """
+        if self._required_paths is None:
+            paths = [*self.field_paths, *sorted(set(self._evaluated_paths))]
+            self._required_paths = tuple(dict.fromkeys(paths))
+        return self._required_paths
+
+    @property
+    def required_field_paths(self) -> tuple[str, ...]:
+        """Get the paths of required fields checked for presence, at any depth."""
+        return self.field_validator.required_paths
+
+    @property
+    def field_paths(self) -> tuple[str, ...]:
+        """Get the paths of all fields, checked for presence or constraints."""
+        return self.field_validator.paths
+
+    @property
+    def field_validator(self) -> FieldValidator:
+        """Stage fields compiled into flat path checkers (built on first use)."""
+        if self._field_validator is None:
+            self._field_validator = FieldValidator(self._properties)
+        return self._field_validator
+
     def _validate_schema(self, properties: dict[str, Any]) -> None:
         """Validate that all evaluated paths exist in the fields definition."""
         from stageflow.models import DictProperty, Property
@@ -380,29 +469,109 @@ class Stage:
                 target_stages.append(gate.target_stage)
                 gate_names.append(gate.name)
 
-    def _get_missing_properties(self, element: Element) -> dict[str, Any]:
-        """Check for required properties that are missing from the element."""
-        from stageflow.models import Property
-
-        missing = {}
-
-        def check_properties(props: dict[str, Property], prefix: str = ""):
-            """Recursively check nested properties."""
-            from stageflow.models import DictProperty
-
-            for name, prop in props.items():
-                full_path = f"{prefix}.{name}" if prefix else name
-
-                # Only check required properties
-                if prop.required and not element.has_property(full_path):
-                    missing[full_path] = prop.default
+    @property
+    def plan(self) -> StageEvaluationPlan:
+        """Evaluation plan of this stage (rebuilt after schema inputs change)."""
+        if self._plan is None:
+            self._plan = self._build_plan()
+        return self._plan
+
+    def _build_plan(self) -> StageEvaluationPlan:
+        """Pre-render action templates and messages for evaluate()."""
+        from stageflow.common import (
+            ensure_unique_action_names,
+            generate_action_id,
+            generate_action_name,
+            sanitize_action_name,
+        )
 
-                # Recursively check nested dict properties
-                if isinstance(prop, DictProperty) and prop.properties:
-                    check_properties(prop.properties, full_path)
+        def template(
+            name: str, description: str = "", *instructions: str
+        ) -> ActionTemplate:
+            return ActionTemplate(
+                name=name,
+                id_name=sanitize_action_name(name),
+                description=description,
+                instructions=instructions,
+            )
 
-        check_properties(self._properties)
-        return missing
+        # Configured actions are always the whole BLOCKED action list, so
+        # their IDs and de-duplicated names are fixed per stage
+        configured: list[Action] = []
+        for index, action_def in enumerate(self.stage_actions):
+            name = action_def.get("name") or generate_action_name(
+                action_type=ActionType.EXECUTE_ACTION,
+            )
+            configured.append({
+                "action_id": generate_action_id(
+                    index=index, stage_id=self._id, name=name
+                ),
+                "name": name,
+                "action_type": ActionType.EXECUTE_ACTION,
+                "source": ActionSource.CONFIGURED,
+                "description": action_def.get("description", ""),
+                "instructions": action_def.get("instructions", []),
+                "related_properties": action_def.get("related_properties", []),
+                "target_properties": action_def.get("target_properties", []),
+                "related_gates": None,  # Configured actions don't tie to specific gates
+                "target_stage": None,
+                "default_value": None,
+            })
+        ensure_unique_action_names(configured)
+
+        field_validator = self.field_validator
+        return StageEvaluationPlan(
+            fields=field_validator,
+            gates=self.gates,
+            configured_actions=tuple(configured),
+            transitions={
+                gate.name: template(
+                    generate_action_name(
+                        action_type=ActionType.TRANSITION,
+                        target_stage=gate.target_stage,
+                    ),
+                    f"Ready to transition to '{gate.target_stage}'",
+                    f"All requirements satisfied for stage '{self.name}'",
+                    f"Proceed to next stage: '{gate.target_stage}'",
+                )
+                for gate in self.gates
+            },
+            ready_messages={
+                gate.name: (
+                    f"Ready to transition to '{gate.target_stage}' "
+                    f"via gate '{gate.name}'"
+                )
+                for gate in self.gates
+            },
+            resolve_actions={
+                gate.name: template(
+                    generate_action_name(
+                        action_type=ActionType.RESOLVE_VALIDATION,
+                        gate_name=gate.name,
+                    )
+                )
+                for gate in self.gates
+            },
+            provide_actions={
+                path: template(
+                    generate_action_name(
+                        action_type=ActionType.PROVIDE_DATA, property_path=path
+                    ),
+                    f"Provide required property '{path}'",
+                    f"Add the '{path}' property to the element",
+                )
+                for path in field_validator.required_paths
+            },
+            fix_actions={
+                path: template(
+                    generate_action_name(
+                        action_type=ActionType.RESOLVE_VALIDATION, property_path=path
+                    ),
+                    f"Fix invalid property '{path}'",
+                )
+                for path in field_validator.paths
+            },
+        )
 
     def _build_actions(
         self,
@@ -411,6 +580,7 @@ class Stage:
         gate_evaluation_results: dict[str, GateResult] | None = None,
         passing_gate: "Gate | None" = None,
         passing_gate_result: GateResult | None = None,
+        invalid_properties: dict[str, list[str]] | None = None,
     ) -> list[Action]:
         """Build actions based on evaluation status with "configured first" priority.
 
@@ -426,180 +596,169 @@ class Stage:
             gate_evaluation_results: Dict of gate_name → GateResult (for BLOCKED)
             passing_gate: The gate that passed (for READY)
             passing_gate_result: The successful gate result (for READY)
+            invalid_properties: Dict of property_path → errors (for BLOCKED
+                before gates ran)
 
         Returns:
             List of Action appropriate for the given status
         """
-        from stageflow.common import (
-            ensure_unique_action_names,
-            generate_action_id,
-            generate_action_name,
-        )
+        from stageflow.common import ensure_unique_action_names
 
+        plan = self.plan
         actions: list[Action] = []
-        action_index = 0  # Global action index for this evaluation
 
         if status == StageStatus.INCOMPLETE and missing_properties:
             # INCOMPLETE: Always compute PROVIDE_DATA actions
-            for prop_path, default_value in missing_properties.items():
-                name = generate_action_name(
-                    action_type=ActionType.PROVIDE_DATA,
-                    property_path=prop_path
-                )
-                action_id = generate_action_id(
-                    index=action_index,
-                    stage_id=self._id,
-                    name=name,
-                )
+            for action_index, (prop_path, default_value) in enumerate(
+                missing_properties.items()
+            ):
+                template = plan.provide_actions[prop_path]
 
                 # Generate helpful instructions for providing data
-                instructions = [f"Add the '{prop_path}' property to the element"]
+                instructions = list(template.instructions)
                 if default_value is not None:
                     instructions.append(f"Suggested value: {default_value}")
 
-                action: Action = {
-                    "action_id": action_id,
-                    "name": name,
+                actions.append({
+                    "action_id": template.action_id(action_index, self._id),
+                    "name": template.name,
                     "action_type": ActionType.PROVIDE_DATA,
                     "source": ActionSource.COMPUTED,
-                    "description": f"Provide required property '{prop_path}'",
+                    "description": template.description,
                     "instructions": instructions,
                     "related_properties": [],
                     "target_properties": [prop_path],
                     "related_gates": None,
                     "target_stage": None,
                     "default_value": default_value,
-                }
-                actions.append(action)
-                action_index += 1
+                })
 
-        elif status == StageStatus.BLOCKED and gate_evaluation_results:
+        elif status == StageStatus.BLOCKED and (
+            gate_evaluation_results or invalid_properties
+        ):
             # BLOCKED: "Configured first" priority
-            if self.stage_actions:
+            if plan.configured_actions:
                 # Stage has configured expected_actions - use ONLY those
-                for action_def in self.stage_actions:
-                    name = action_def.get("name") or generate_action_name(
-                        action_type=ActionType.EXECUTE_ACTION,
-                    )
-                    action_id = generate_action_id(
-                        index=action_index,
-                        stage_id=self._id,
-                        name=name,
-                    )
-
-                    action: Action = {
-                        "action_id": action_id,
-                        "name": name,
-                        "action_type": ActionType.EXECUTE_ACTION,
-                        "source": ActionSource.CONFIGURED,
-                        "description": action_def.get("description", ""),
-                        "instructions": action_def.get("instructions", []),
-                        "related_properties": action_def.get("related_properties", []),
-                        "target_properties": action_def.get("target_properties", []),
-                        "related_gates": None,  # Configured actions don't tie to specific gates
+                return [
+                    cast(Action, dict(action)) for action in plan.configured_actions
+                ]
+            elif invalid_properties:
+                # No configured actions - compute from invalid fields
+                for action_index, (prop_path, errors) in enumerate(
+                    invalid_properties.items()
+                ):
+                    template = plan.fix_actions[prop_path]
+                    actions.append({
+                        "action_id": template.action_id(action_index, self._id),
+                        "name": template.name,
+                        "action_type": ActionType.RESOLVE_VALIDATION,
+                        "source": ActionSource.COMPUTED,
+                        "description": template.description,
+                        "instructions": [
+                            f"Update the '{prop_path}' property: {error}"
+                            for error in errors
+                        ],
+                        "related_properties": [],
+                        "target_properties": [prop_path],
+                        "related_gates": None,
                         "target_stage": None,
                         "default_value": None,
-                    }
-                    actions.append(action)
-                    action_index += 1
+                    })
             else:
                 # No configured actions - compute from failed gates
-                for gate in self.gates:
-                    gate_result = gate_evaluation_results.get(gate.name)
-                    if gate_result and not gate_result.success:
-                        for lock_result in gate_result.failed:
-                            name = generate_action_name(
-                                action_type=ActionType.RESOLVE_VALIDATION,
-                                gate_name=gate.name,
-                            )
-                            action_id = generate_action_id(
-                                index=action_index,
-                                stage_id=self._id,
-                                name=name,
-                            )
-
-                            # Generate helpful instructions for resolving validation
-                            instructions = [
-                                f"Update the '{lock_result.property_path}' property to satisfy validation",
-                            ]
-                            if hasattr(lock_result, 'expected_value') and lock_result.expected_value is not None:
-                                instructions.append(f"Expected: {lock_result.expected_value}")
-                            if hasattr(lock_result, 'actual_value') and lock_result.actual_value is not None:
-                                instructions.append(f"Current: {lock_result.actual_value}")
-
-                            action: Action = {
-                                "action_id": action_id,
-                                "name": name,
-                                "action_type": ActionType.RESOLVE_VALIDATION,
-                                "source": ActionSource.COMPUTED,
-                                "description": lock_result.error_message
-                                or f"Resolve validation for '{lock_result.property_path}'",
-                                "instructions": instructions,
-                                "related_properties": [],
-                                "target_properties": [lock_result.property_path],
-                                "related_gates": [gate.name],
-                                "target_stage": None,
-                                "default_value": None,
-                            }
-                            actions.append(action)
-                            action_index += 1
+                action_index = 0
+                gate_results = gate_evaluation_results or {}
+                for gate in plan.gates:
+                    gate_result = gate_results.get(gate.name)
+                    if not gate_result or gate_result.success:
+                        continue
+                    template = plan.resolve_actions[gate.name]
+                    for lock_result in gate_result.failed:
+                        # Generate helpful instructions for resolving validation
+                        instructions = [
+                            f"Update the '{lock_result.property_path}' property to satisfy validation",
+                        ]
+                        if lock_result.expected_value is not None:
+                            instructions.append(f"Expected: {lock_result.expected_value}")
+                        if lock_result.actual_value is not None:
+                            instructions.append(f"Current: {lock_result.actual_value}")
+
+                        actions.append({
+                            "action_id": template.action_id(action_index, self._id),
+                            "name": template.name,
+                            "action_type": ActionType.RESOLVE_VALIDATION,
+                            "source": ActionSource.COMPUTED,
+                            "description": lock_result.error_message
+                            or f"Resolve validation for '{lock_result.property_path}'",
+                            "instructions": instructions,
+                            "related_properties": [],
+                            "target_properties": [lock_result.property_path],
+                            "related_gates": [gate.name],
+                            "target_stage": None,
+                            "default_value": None,
+                        })
+                        action_index += 1
 
         elif status == StageStatus.READY and passing_gate and passing_gate_result:
-            # READY: Always compute TRANSITION action
-            validated_properties = [
-                lock_result.property_path
-                for lock_result in passing_gate_result.passed
-            ]
-
-            name = generate_action_name(
-                action_type=ActionType.TRANSITION,
-                target_stage=passing_gate.target_stage,
-            )
-            action_id = generate_action_id(
-                index=0,  # READY status always has single transition action
-                stage_id=self._id,
-                name=name,
-            )
-
-            # Generate helpful instructions for transition
-            instructions = [
-                f"All requirements satisfied for stage '{self.name}'",
-                f"Proceed to next stage: '{passing_gate.target_stage}'",
-            ]
-
-            action: Action = {
-                "action_id": action_id,
-                "name": name,
+            # READY: Always compute TRANSITION action (index 0, the only action)
+            template = plan.transitions[passing_gate.name]
+            return [{
+                "action_id": template.action_id(0, self._id),
+                "name": template.name,
                 "action_type": ActionType.TRANSITION,
                 "source": ActionSource.COMPUTED,
-                "description": f"Ready to transition to '{passing_gate.target_stage}'",
-                "instructions": instructions,
-                "related_properties": validated_properties,
+                "description": template.description,
+                "instructions": list(template.instructions),
+                "related_properties": [
+                    lock_result.property_path
+                    for lock_result in passing_gate_result.passed
+                ],
                 "target_properties": [],
                 "related_gates": [passing_gate.name],
                 "target_stage": passing_gate.target_stage,
                 "default_value": None,
-            }
-            actions.append(action)
+            }]
 
         # Ensure all action names are unique within this evaluation
         ensure_unique_action_names(actions)
 
         return actions
 
-    def evaluate(self, element: Element) -> StageEvaluationResult:
+    def evaluate(
+        self,
+        element: Element,
+        previous: StageEvaluationResult | None = None,
+        affected: PathDependencies | None = None,
+    ) -> StageEvaluationResult:
         """
         Evaluate element against this stage's requirements.
 
+        When ``previous`` and ``affected`` are given, only the required-field
+        check, gates and locks that depend on changed paths are re-run; the
+        rest is reused from ``previous``.
+
         Args:
             element: Element to evaluate
+            previous: Optional earlier result of this stage for the same element
+            affected: Dependents of the paths changed since ``previous``
 
         Returns:
             StageEvaluationResult containing evaluation outcome and details
         """
-        missing_properties = self._get_missing_properties(element)
-        schema_valid = len(missing_properties) == 0
-        if not schema_valid:
+        if previous is not None and affected is not None:
+            if self._id not in affected.stages:
+                return previous
+            # Only the required-field check can change an INCOMPLETE outcome
+            if (
+                self._id not in affected.field_stages
+                and previous.status == StageStatus.INCOMPLETE
+            ):
+                return previous
+
+        plan = self.plan
+        fields = plan.fields.validate(element)
+        missing_properties = fields.missing
+        if missing_properties:
             validation_messages = [
                 f"Missing required property '{prop}' (suggested default: {default})"
                 for prop, default in missing_properties.items()
@@ -615,11 +774,28 @@ class Stage:
                 validation_messages=validation_messages,
             )
 
+        # Fields with values of the wrong type or out of their constraints
+        # block the stage before any gate runs
+        if fields.invalid:
+            return StageEvaluationResult(
+                status=StageStatus.BLOCKED,
+                results={},
+                actions=self._build_actions(
+                    status=StageStatus.BLOCKED,
+                    invalid_properties=fields.invalid,
+                ),
+                validation_messages=[
+                    f"Invalid property '{prop}': {error}"
+                    for prop, errors in fields.invalid.items()
+                    for error in errors
+                ],
+            )
+
         gate_evaluation_results = {}
-        for gate in self.gates:
-            gate_result = gate.evaluate(element)
+        for gate in plan.gates:
+            gate_result = self._evaluate_gate(gate, element, previous, affected)
             if gate_result.success:
-                transition_message = f"Ready to transition to '{gate.target_stage}' via gate '{gate.name}'"
+                transition_message = plan.ready_messages[gate.name]
 
                 return StageEvaluationResult(
                     status=StageStatus.READY,
@@ -635,7 +811,7 @@ class Stage:
 
         # Collect validation messages from failed gates
         validation_messages = []
-        for gate in self.gates:
+        for gate in plan.gates:
             gate_result = gate_evaluation_results.get(gate.name)
             if gate_result and not gate_result.success:
                 # Get contextualized messages for this gate
@@ -654,6 +830,26 @@ class Stage:
             validation_messages=validation_messages,
         )
 
+    def _evaluate_gate(
+        self,
+        gate: Gate,
+        element: Element,
+        previous: StageEvaluationResult | None,
+        affected: PathDependencies | None,
+    ) -> GateResult:
+        """Evaluate a gate, reusing its previous result or unaffected locks."""
+        if previous is None or affected is None:
+            return gate.evaluate(element)
+
+        previous_gate = previous.results.get(gate.name)
+        if previous_gate is not None and (self._id, gate.name) not in affected.gates:
+            return previous_gate
+        return gate.evaluate(
+            element,
+            previous=previous_gate,
+            stale_locks=affected.stale_locks(self._id, gate.name),
+        )
+
     def get_schema(self) -> dict[str, Any]:
         """Extract schema definition for this stage (backward compatible).
 
@@ -690,11 +886,7 @@ class Stage:
 
     def get_initial_schema(self) -> StageSchema:
         """Get schema for stage entry (fields only)."""
-        return StageSchema(
-            properties=self._fields_to_property_schemas(),
-            stage_id=self._id,
-            stage_name=self.name
-        )
+        return _copy_schema(self._get_schemas()[0])
 
     def get_final_schemas(self) -> dict[str, StageSchema]:
         """Get final schema for each gate (primary method).
@@ -702,7 +894,10 @@ class Stage:
         Returns:
             {gate_name: StageSchema}
         """
-        return {gate.name: self._build_final_schema(gate) for gate in self.gates}
+        return {
+            gate_name: _copy_schema(schema)
+            for gate_name, schema in self._get_schemas()[1].items()
+        }
 
     def get_final_schema(self, gate_name: str) -> StageSchema:
         """Get final schema for a specific gate.
@@ -713,74 +908,46 @@ class Stage:
         Raises:
             ValueError: If gate_name not found
         """
-        schemas = self.get_final_schemas()
+        schemas = self._get_schemas()[1]
         if gate_name not in schemas:
             available = list(schemas.keys())
             raise ValueError(f"Gate '{gate_name}' not found. Available: {available}")
-        return schemas[gate_name]
+        return _copy_schema(schemas[gate_name])
+
+    def _get_schemas(self) -> tuple[StageSchema, dict[str, StageSchema]]:
+        """Get the memoized (initial schema, final schema per gate) pair.
+
+        Built on first use and shared by all later calls until one of the
+        stage's schema inputs is reassigned. Callers must not mutate the
+        returned schemas; the public getters hand out copies.
+        """
+        schemas = self._schemas
+        if schemas is None:
+            with _schema_build_lock:
+                schemas = self._schemas
+                if schemas is None:
+                    initial = StageSchema(
+                        properties=self._fields_to_property_schemas(),
+                        stage_id=self._id,
+                        stage_name=self.name,
+                    )
+                    finals = {
+                        gate.name: self._build_final_schema(gate, initial)
+                        for gate in self.gates
+                    }
+                    schemas = self._schemas = (initial, finals)
+        return schemas
 
     def _fields_to_property_schemas(self) -> dict[str, PropertySchema]:
         """Convert stage fields to PropertySchema dict."""
-        from stageflow.models import Property
+        return _property_schemas(self._properties)
 
-        result: dict[str, PropertySchema] = {}
-        for name, prop in self._properties.items():
-            if not isinstance(prop, Property):
-                continue
-            type_val = prop.type.value if hasattr(prop.type, 'value') else prop.type
-            # Map property type to InferredType
-            type_mapping = {
-                "string": InferredType.STRING,
-                "int": InferredType.INTEGER,
-                "number": InferredType.NUMBER,
-                "bool": InferredType.BOOLEAN,
-                "list": InferredType.ARRAY,
-                "dict": InferredType.OBJECT,
-            }
-            inferred = type_mapping.get(type_val, InferredType.ANY)
-            schema: PropertySchema = {
-                "type": inferred,
-                "required": prop.required,
-                "source": PropertySource.FIELD,
-            }
-            if prop.default is not None:
-                schema["default"] = prop.default
-            if prop.description:
-                schema["description"] = prop.description
-            result[name] = schema
-        return result
-
-    def _build_final_schema(self, gate: Gate) -> StageSchema:
+    def _build_final_schema(self, gate: Gate, initial: StageSchema) -> StageSchema:
         """Build final schema for a specific gate.
 
         Merges: initial (fields) + action target_properties + gate lock props
         """
-        # 1. Start with initial schema properties
-        properties: dict[str, PropertySchema] = dict(self.get_initial_schema()["properties"])
-
-        # 2. Add target_properties from stage_actions (where results are captured)
-        for action_def in self.stage_actions:
-            target_props = action_def.get("target_properties", [])
-            for prop_path in target_props:
-                if prop_path not in properties:
-                    properties[prop_path] = PropertySchema(
-                        type=InferredType.ANY,
-                        source=PropertySource.ACTION
-                    )
-
-        # 3. Add gate lock properties
-        for extracted in gate.get_properties():
-            if extracted["path"] not in properties:
-                properties[extracted["path"]] = PropertySchema(
-                    type=extracted["inferred_type"],
-                    source=PropertySource.GATE_LOCK
-                )
-
-        return StageSchema(
-            properties=properties,
-            stage_id=self._id,
-            stage_name=self.name
-        )
+        return _final_schema(gate, initial, self.stage_actions)
 
     # Serialization
     def to_dict(self) -> StageDefinition:
@@ -820,11 +987,153 @@ class Stage:
         Returns:
             StageSchemaMutations instance for this stage
         """
+        initial_schema, final_schemas = self._get_schemas()
         return StageSchemaMutations(
             stage_id=self._id,
             is_final=self.is_final,
-            initial_schema=self.get_initial_schema(),
-            final_schemas=self.get_final_schemas(),
+            initial_schema=initial_schema,
+            final_schemas=final_schemas,
             gates=tuple(g.to_dict() for g in self.gates),
             is_transition_target=is_transition_target,
+            lock_fingerprints=tuple(g.lock_fingerprints for g in self.gates),
         )
+
+
+def _gate_definitions(stage_id: str, config: StageDefinition) -> list[GateDefinition]:
+    """Gate definitions of a stage config, named and tagged with the stage."""
+    # Gates can be either a dict (with gate names as keys) or a list
+    gates_config = config.get("gates", [])
+    if isinstance(gates_config, dict):
+        # Convert dict format to list format, adding gate name
+        gates_list = [
+            {**gate_def, "name": gate_name}
+            for gate_name, gate_def in gates_config.items()
+        ]
+    else:
+        gates_list = gates_config
+
+    return [
+        cast(GateDefinition, {**gate_def, "parent_stage": stage_id})
+        for gate_def in gates_list
+    ]
+
+
+def _parse_fields(config: StageDefinition) -> dict[str, Any]:
+    """Parse the ``fields`` of a stage config into Property models."""
+    from stageflow.models import PropertiesParser
+
+    fields_spec = config.get("fields", [])
+    if fields_spec:
+        return PropertiesParser.parse(fields_spec)
+    return {}
+
+
+def _property_schemas(properties: dict[str, Any]) -> dict[str, PropertySchema]:
+    """Convert parsed stage fields to PropertySchema dict."""
+    from stageflow.models import Property
+
+    result: dict[str, PropertySchema] = {}
+    for name, prop in properties.items():
+        if not isinstance(prop, Property):
+            continue
+        type_val = prop.type.value if hasattr(prop.type, 'value') else prop.type
+        schema: PropertySchema = {
+            "type": _FIELD_TYPE_MAPPING.get(type_val, InferredType.ANY),
+            "required": prop.required,
+            "source": PropertySource.FIELD,
+        }
+        if prop.default is not None:
+            schema["default"] = prop.default
+        if prop.description:
+            schema["description"] = prop.description
+        result[name] = schema
+    return result
+
+
+def _final_schema(
+    gate: Gate, initial: StageSchema, stage_actions: list[ActionDefinition]
+) -> StageSchema:
+    """Merge initial (fields) + action target_properties + gate lock props."""
+    # 1. Start with initial schema properties
+    properties: dict[str, PropertySchema] = dict(initial["properties"])
+
+    # 2. Add target_properties from stage_actions (where results are captured)
+    for action_def in stage_actions:
+        target_props = action_def.get("target_properties", [])
+        for prop_path in target_props:
+            if prop_path not in properties:
+                properties[prop_path] = PropertySchema(
+                    type=InferredType.ANY,
+                    source=PropertySource.ACTION
+                )
+
+    # 3. Add gate lock properties
+    for extracted in gate.get_properties():
+        if extracted["path"] not in properties:
+            properties[extracted["path"]] = PropertySchema(
+                type=extracted["inferred_type"],
+                source=PropertySource.GATE_LOCK
+            )
+
+    return StageSchema(
+        properties=properties,
+        stage_id=initial["stage_id"],
+        stage_name=initial["stage_name"],
+    )
+
+
+def stage_schema_mutations(
+    id: str,
+    config: StageDefinition,
+    is_transition_target: bool = False,
+    trusted: bool = False,
+) -> StageSchemaMutations:
+    """
+    Schema mutations of a stage definition, without building the Stage.
+
+    Parses only the fields and gates the analysis reads, so a lazy process
+    can be analyzed without constructing stages it has not used. Gives the
+    same result as ``Stage(id, config).to_schema_mutations(...)``.
+
+    Args:
+        id: Stage id
+        config: Stage definition
+        is_transition_target: Whether this stage is targeted by any gate
+        trusted: Skip re-validating gates (already validated)
+
+    Returns:
+        StageSchemaMutations for the stage
+    """
+    gates = tuple(
+        Gate(definition, trusted=trusted)
+        for definition in _gate_definitions(id, config)
+    )
+    initial = StageSchema(
+        properties=_property_schemas(_parse_fields(config)),
+        stage_id=id,
+        stage_name=config.get("name", id),
+    )
+    stage_actions = config.get("expected_actions", [])
+    return StageSchemaMutations(
+        stage_id=id,
+        is_final=config.get("is_final", False),
+        initial_schema=initial,
+        final_schemas={
+            gate.name: _final_schema(gate, initial, stage_actions) for gate in gates
+        },
+        gates=tuple(gate.to_dict() for gate in gates),
+        is_transition_target=is_transition_target,
+        lock_fingerprints=tuple(gate.lock_fingerprints for gate in gates),
+    )
+
+
+def _copy_schema(schema: StageSchema) -> StageSchema:
+    """Copy a memoized schema down to its property entries."""
+    return StageSchema(
+        properties={
+            name: cast(PropertySchema, dict(prop))
+            for name, prop in schema["properties"].items()
+        },
+        stage_id=schema["stage_id"],
+        stage_name=schema["stage_name"],
+    )
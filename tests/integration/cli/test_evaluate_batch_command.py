@@ -0,0 +1,164 @@
+"""Integration tests for the evaluate command's JSONL batch mode."""
+
+import json
+from pathlib import Path
+
+import pytest
+from ruamel.yaml import YAML
+from typer.testing import CliRunner
+
+from stageflow.cli.main import app
+from stageflow.process import Process
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Create a CLI runner for testing."""
+    return CliRunner()
+
+
+@pytest.fixture
+def process_file(tmp_path: Path) -> Path:
+    """Write a minimal two-stage process definition."""
+    path = tmp_path / "orders.yaml"
+    YAML().dump(
+        {
+            "process": {
+                "name": "orders",
+                "initial_stage": "start",
+                "final_stage": "end",
+                "stages": {
+                    "start": {
+                        "name": "Start",
+                        "fields": ["order"],
+                        "gates": {
+                            "to_end": {
+                                "target_stage": "end",
+                                "locks": [{"exists": "email"}],
+                            }
+                        },
+                    },
+                    "end": {"name": "End", "fields": []},
+                },
+            }
+        },
+        path,
+    )
+    return path
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path) -> Path:
+    """Write a small JSONL corpus keyed by order.id."""
+    path = tmp_path / "orders.jsonl"
+    records = [
+        {"order": {"id": "A-1"}, "email": "a@example.com"},
+        {"order": {"id": "A-2"}},
+        {"order": {"id": "A-3"}, "email": "c@example.com"},
+    ]
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+class TestEvaluateBatchCommand:
+    """Test `stageflow evaluate --jsonl`."""
+
+    def test_evaluates_every_record(self, runner, process_file, jsonl_file):
+        """Verify all records are evaluated and reported in JSON mode."""
+        # Arrange & Act
+        result = runner.invoke(
+            app, ["evaluate", str(process_file), "--jsonl", str(jsonl_file), "--json"]
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["total_count"] == 3
+        assert [r["element"] for r in data["results"]] == ["0", "1", "2"]
+        assert [r["evaluation"]["status"] for r in data["results"]] == [
+            "ready",
+            "blocked",
+            "ready",
+        ]
+
+    def test_selects_records_by_id(self, runner, process_file, jsonl_file):
+        """Verify --id restricts evaluation to the selected records."""
+        # Arrange & Act
+        result = runner.invoke(
+            app,
+            [
+                "evaluate",
+                str(process_file),
+                "--jsonl",
+                str(jsonl_file),
+                "--id-path",
+                "order.id",
+                "--id",
+                "A-2",
+                "--json",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert [r["element"] for r in data["results"]] == ["A-2"]
+
+    def test_unknown_id_fails(self, runner, process_file, jsonl_file):
+        """Verify unknown ids are reported as an error."""
+        # Arrange & Act
+        result = runner.invoke(
+            app,
+            [
+                "evaluate",
+                str(process_file),
+                "--jsonl",
+                str(jsonl_file),
+                "--id-path",
+                "order.id",
+                "--id",
+                "Z-9",
+                "--json",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "Z-9" in json.loads(result.output)["error"]
+
+    def test_record_error_is_reported_for_that_record_only(
+        self, runner, process_file, jsonl_file, mocker
+    ):
+        """Verify one failing record doesn't mark the rest of a --stage run failed."""
+        # Arrange
+        evaluate = Process.evaluate
+
+        def failing_evaluate(process, element, current_stage_name=None):
+            if not element.has_property("email"):
+                raise ValueError("cannot evaluate record")
+            return evaluate(process, element, current_stage_name)
+
+        mocker.patch.object(Process, "evaluate", failing_evaluate)
+
+        # Act
+        result = runner.invoke(
+            app,
+            [
+                "evaluate",
+                str(process_file),
+                "--jsonl",
+                str(jsonl_file),
+                "--stage",
+                "start",
+                "--json",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["results"][1] == {"element": "1", "error": "cannot evaluate record"}
+        assert [r["evaluation"]["status"] for r in data["results"][::2]] == [
+            "ready",
+            "ready",
+        ]
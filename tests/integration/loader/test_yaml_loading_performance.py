@@ -0,0 +1,106 @@
+"""Benchmark of the fast parsing layer against the round-trip YAML loader.
+
+Runs over every parseable example process file plus a generated large process.
+The timing comparison is marked ``benchmark`` and excluded from the default
+run (select it with ``pytest -m benchmark``); per-loader timings are recorded
+as test properties (e.g. in ``--junitxml`` reports).
+"""
+
+import json
+import time
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from ruamel.yaml import YAML
+
+from stageflow.loader import parse_document, yaml_backend
+
+EXAMPLES_DIR = Path(__file__).parents[3] / "examples"
+ROUNDS = 3
+
+
+def _large_process_yaml(stage_count: int = 150) -> str:
+    stages = {}
+    for i in range(stage_count):
+        stage = {
+            "name": f"Stage {i}",
+            "fields": {f"field_{i}_{j}": {"type": "string"} for j in range(5)},
+        }
+        if i < stage_count - 1:
+            stage["gates"] = {
+                f"to_{i + 1}": {
+                    "target_stage": f"stage_{i + 1}",
+                    "locks": [{"exists": f"field_{i}_{j}"} for j in range(5)],
+                }
+            }
+        stages[f"stage_{i}"] = stage
+    document = {
+        "process": {
+            "name": "large",
+            "initial_stage": "stage_0",
+            "final_stage": f"stage_{stage_count - 1}",
+            "stages": stages,
+        }
+    }
+    yaml = YAML()
+    stream = StringIO()
+    yaml.dump(document, stream)
+    return stream.getvalue()
+
+
+@pytest.fixture(scope="module")
+def documents() -> list[str]:
+    contents = [_large_process_yaml()]
+    for path in sorted(EXAMPLES_DIR.rglob("*.yaml")):
+        text = path.read_text(encoding="utf-8")
+        try:
+            YAML().load(text)
+        except Exception:
+            # Examples include intentionally broken files
+            continue
+        contents.append(text)
+    return contents
+
+
+def _time(loader, documents: list[str]) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for document in documents:
+            loader(document)
+    return time.perf_counter() - start
+
+
+class TestYamlLoadingBenchmark:
+    """Compare round-trip and fast loading on real process files."""
+
+    def test_fast_loader_returns_same_data(self, documents):
+        """Verify the fast path is a drop-in replacement for loading."""
+        # Arrange
+        round_trip = YAML()
+
+        # Act & Assert
+        for document in documents:
+            assert parse_document(document) == round_trip.load(document)
+
+    @pytest.mark.benchmark
+    def test_fast_loader_is_faster_than_round_trip(self, documents, record_property):
+        """Benchmark fast vs round-trip loading of process files."""
+        # Arrange
+        round_trip = YAML()
+        json_documents = [json.dumps(parse_document(d)) for d in documents]
+
+        # Act
+        round_trip_time = _time(round_trip.load, documents)
+        fast_time = _time(parse_document, documents)
+        json_time = _time(parse_document, json_documents)
+
+        # Assert
+        record_property("yaml_backend", yaml_backend())
+        record_property("documents", len(documents) * ROUNDS)
+        record_property("round_trip_seconds", round(round_trip_time, 3))
+        record_property("fast_safe_seconds", round(fast_time, 3))
+        record_property("json_path_seconds", round(json_time, 3))
+        # Small tolerance for noisy parallel runs
+        assert fast_time < round_trip_time * 1.1
+        assert json_time < fast_time
@@ -0,0 +1,193 @@
+"""Unit tests for the gate lock constraint solver."""
+
+import pytest
+
+from stageflow.analysis.constraints import solve_locks
+from stageflow.analysis.gate import GateAnalyzer
+from stageflow.elements import DictElement
+from stageflow.gate import Gate
+from stageflow.lock import LockFactory
+from stageflow.models import LockType, ProcessIssueTypes
+
+
+def _lock(lock_type: str, path: str = "x", value=None, **extra) -> dict:
+    return {"type": lock_type, "property_path": path, "expected_value": value, **extra}
+
+
+def _solve(*definitions):
+    return solve_locks([LockFactory.create(definition) for definition in definitions])
+
+
+class TestConflicts:
+    """Test detection of gates that can never pass."""
+
+    @pytest.mark.parametrize(
+        "definitions",
+        [
+            [_lock("greater_than", value=10), _lock("less_than", value=5)],
+            [_lock("greater_than", value=5), _lock("less_than", value=5)],
+            [
+                _lock("range", metadata={"min_value": 1, "max_value": 5}),
+                _lock("greater_than", value=7),
+            ],
+            [_lock("in_list", value=["a", "b"]), _lock("in_list", value=["c"])],
+            [_lock("equals", value="a"), _lock("not_in_list", value=["a", "b"])],
+            [_lock("equals", value=3), _lock("greater_than", value=5)],
+            [_lock("in_list", value=[1, 2]), _lock("not_in_list", value=[1, 2])],
+        ],
+    )
+    def test_unsatisfiable_gates(self, definitions):
+        """Verify intervals and value sets are intersected per property."""
+        # Arrange & Act
+        constraints = _solve(*definitions)
+
+        # Assert
+        assert not constraints.satisfiable
+
+    def test_satisfiable_gate(self):
+        """Verify compatible locks on several properties report no conflict."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("greater_than", value=1),
+            _lock("less_than", value=10),
+            _lock("in_list", "status", ["open", "closed"]),
+            _lock("not_in_list", "status", ["closed"]),
+            _lock("regex", "status", "^o"),
+        )
+
+        # Assert
+        assert constraints.satisfiable
+        assert constraints.conflicts == ()
+
+    def test_or_logic_paths_are_solved_with_gate(self):
+        """Verify a gate fails when every OR path contradicts its other locks."""
+        # Arrange
+        either = {
+            "type": "OR_LOGIC",
+            "conditions": [
+                {"locks": [_lock("equals", value=1)]},
+                {"locks": [_lock("less_than", value=0)]},
+            ],
+        }
+
+        # Act
+        dead = _solve(_lock("greater_than", value=5), either)
+        alive = _solve(_lock("greater_than", value=0), either)
+
+        # Assert
+        assert not dead.satisfiable
+        assert alive.satisfiable
+
+    def test_type_sensitive_locks_are_not_folded(self):
+        """Verify type checks never cause a conflict with equality locks."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("equals", value=1), _lock("type_check", value="float")
+        )
+
+        # Assert
+        assert constraints.satisfiable
+        assert constraints.redundant == frozenset()
+
+
+class TestRedundancy:
+    """Test detection of redundant and implied locks."""
+
+    def test_weaker_bounds_are_redundant(self):
+        """Verify only the tightest lower and upper bound locks are kept."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("greater_than", value=3),
+            _lock("greater_than", value=5),
+            _lock("less_than", value=9),
+            _lock("range", metadata={"min_value": 0, "max_value": 20}),
+        )
+
+        # Assert
+        assert constraints.redundant == frozenset({0, 3})
+
+    def test_value_set_makes_other_locks_redundant(self):
+        """Verify locks passed by every allowed value are redundant."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("in_list", value=["a", "b"]),
+            _lock("equals", value="b"),
+            {"exists": "x"},
+        )
+
+        # Assert
+        assert constraints.redundant == frozenset({0, 2})
+
+    def test_duplicates_keep_one_copy(self):
+        """Verify repeated identical locks are redundant except the first."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("regex", value="^a"),
+            _lock("regex", value="^a"),
+            _lock("greater_than", "n", 1),
+            _lock("greater_than", "n", 1),
+        )
+
+        # Assert
+        assert constraints.redundant == frozenset({1, 3})
+
+    def test_implied_locks(self):
+        """Verify a property narrowed to one value implies EQUALS and EXISTS."""
+        # Arrange & Act
+        constraints = _solve(
+            _lock("in_list", value=["a", "b"]), _lock("not_in_list", value=["a"])
+        )
+
+        # Assert
+        assert {"type": LockType.EQUALS, "property_path": "x", "expected_value": "b"} in (
+            constraints.implied
+        )
+        assert {"type": LockType.EXISTS, "property_path": "x", "expected_value": True} in (
+            constraints.implied
+        )
+
+
+class TestGateIntegration:
+    """Test conflict reporting and evaluation-time pruning."""
+
+    def test_analyzer_reports_range_conflict(self):
+        """Verify GateAnalyzer reports conflicts found by the solver."""
+        # Arrange
+        gate = {
+            "name": "check",
+            "target_stage": "done",
+            "locks": [
+                _lock("range", "score", metadata={"min_value": 0, "max_value": 10}),
+                _lock("greater_than", "score", 50),
+            ],
+        }
+
+        # Act
+        issues = GateAnalyzer(gate, "start").get_issues()
+
+        # Assert
+        assert [issue.issue_type for issue in issues] == [ProcessIssueTypes.LOGICAL_CONFLICT]
+        assert "score" in issues[0].description
+
+    def test_redundant_locks_skip_validation(self, mocker):
+        """Verify implied locks are not validated when their support passes."""
+        # Arrange
+        gate = Gate({
+            "name": "check",
+            "target_stage": "done",
+            "locks": [_lock("greater_than", value=3), _lock("greater_than", value=5)],
+        })
+        weaker = gate.locks[0]
+        spy = mocker.spy(weaker, "validate")
+
+        # Act
+        passing = gate.evaluate(DictElement({"x": 7}))
+        failing = gate.evaluate(DictElement({"x": 4}))
+
+        # Assert
+        assert passing.success
+        assert passing.lock_results[0] == weaker.validate(DictElement({"x": 7}))
+        assert spy.call_count == 2  # once for the failing element, once above
+        assert not failing.success
+        assert failing.lock_results[0].success
+        assert [result.expected_value for result in failing.failed] == [5]
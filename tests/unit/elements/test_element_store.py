@@ -0,0 +1,191 @@
+"""Unit tests for the memory-mapped JSONL element store."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from stageflow.elements import DictElement, ElementStoreError, JsonlElementStore
+from stageflow.process import Process
+from stageflow.stage import StageStatus
+
+
+def write_jsonl(path: Path, records: list) -> Path:
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return path
+
+
+@pytest.fixture
+def records() -> list[dict]:
+    return [
+        {"order": {"id": "A-1"}, "email": "a@example.com"},
+        {"order": {"id": "A-2"}},
+        {"order": {"id": "A-3"}, "email": "c@example.com"},
+    ]
+
+
+@pytest.fixture
+def jsonl_file(tmp_path: Path, records: list[dict]) -> Path:
+    return write_jsonl(tmp_path / "orders.jsonl", records)
+
+
+class TestJsonlElementStoreAccess:
+    """Test lazy record access by position and by id."""
+
+    def test_iterates_all_records_in_file_order(self, jsonl_file, records):
+        """Verify iteration yields one DictElement per record."""
+        # Arrange & Act
+        with JsonlElementStore(jsonl_file) as store:
+            elements = list(store)
+
+        # Assert
+        assert len(elements) == 3
+        assert all(isinstance(e, DictElement) for e in elements)
+        assert [e.to_dict() for e in elements] == records
+
+    def test_blank_lines_are_skipped(self, tmp_path):
+        """Verify blank lines do not produce records or shift positions."""
+        # Arrange
+        path = tmp_path / "data.jsonl"
+        path.write_text('{"a": 1}\n\n   \n{"a": 2}')
+
+        # Act
+        with JsonlElementStore(path) as store:
+            values = [store[i].get_property("a") for i in range(len(store))]
+
+        # Assert
+        assert values == [1, 2]
+
+    def test_get_by_id_path(self, jsonl_file):
+        """Verify records can be looked up through a nested id path."""
+        # Arrange & Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            element = store.get("A-3")
+            missing = store.get("Z-9")
+
+        # Assert
+        assert element is not None
+        assert element.get_property("email") == "c@example.com"
+        assert missing is None
+
+    def test_select_skips_unknown_ids(self, jsonl_file):
+        """Verify select yields only known ids, in requested order."""
+        # Arrange & Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            selected = list(store.select(["A-3", "nope", "A-1"]))
+
+        # Assert
+        assert [e.get_property("order.id") for e in selected] == ["A-3", "A-1"]
+
+    def test_id_lookup_without_id_path_raises(self, jsonl_file):
+        """Verify id lookups require an id_path."""
+        # Arrange & Act & Assert
+        with JsonlElementStore(jsonl_file) as store:
+            with pytest.raises(ElementStoreError, match="id_path"):
+                store.get("A-1")
+
+    def test_non_object_record_raises_on_access(self, tmp_path):
+        """Verify non-object records are reported when read."""
+        # Arrange
+        path = write_jsonl(tmp_path / "bad.jsonl", [{"a": 1}, [1, 2]])
+
+        # Act & Assert
+        with JsonlElementStore(path) as store:
+            assert store[0].get_property("a") == 1
+            with pytest.raises(ElementStoreError, match="JSON object"):
+                store[1]
+
+    def test_missing_file_raises(self, tmp_path):
+        """Verify opening a missing file raises ElementStoreError."""
+        # Arrange & Act & Assert
+        with pytest.raises(ElementStoreError, match="Cannot open"):
+            JsonlElementStore(tmp_path / "missing.jsonl")
+
+
+class TestJsonlElementStoreIndex:
+    """Test sidecar offset index persistence and invalidation."""
+
+    def test_index_is_persisted_next_to_file(self, jsonl_file):
+        """Verify the offset index is written as a sidecar file."""
+        # Arrange & Act
+        JsonlElementStore(jsonl_file, id_path="order.id").close()
+        index = json.loads((jsonl_file.parent / "orders.jsonl.idx").read_text())
+
+        # Assert
+        assert index["id_path"] == "order.id"
+        assert len(index["offsets"]) == 3
+        assert index["ids"] == {"A-1": 0, "A-2": 1, "A-3": 2}
+
+    def test_valid_index_is_reused(self, jsonl_file, mocker):
+        """Verify a matching sidecar index avoids rescanning the file."""
+        # Arrange
+        JsonlElementStore(jsonl_file, id_path="order.id").close()
+        build = mocker.spy(JsonlElementStore, "_build_index")
+
+        # Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            element = store.get("A-2")
+
+        # Assert
+        assert build.call_count == 0
+        assert element is not None
+
+    def test_stale_index_is_rebuilt(self, jsonl_file, records):
+        """Verify the index is rebuilt after the data file changes."""
+        # Arrange
+        JsonlElementStore(jsonl_file, id_path="order.id").close()
+        write_jsonl(jsonl_file, records + [{"order": {"id": "A-4"}}])
+
+        # Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            # Assert
+            assert len(store) == 4
+            assert "A-4" in store
+
+    def test_index_for_other_id_path_is_not_reused(self, jsonl_file):
+        """Verify an index built for another id path is ignored."""
+        # Arrange
+        JsonlElementStore(jsonl_file).close()
+
+        # Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            # Assert
+            assert store.ids == ["A-1", "A-2", "A-3"]
+
+
+class TestProcessBatchEvaluationFromStore:
+    """Test Process.evaluate_batch with a lazy element store."""
+
+    def test_evaluate_batch_consumes_store(self, jsonl_file):
+        """Verify evaluate_batch accepts the store's lazy iterators."""
+        # Arrange
+        process = Process(
+            {
+                "name": "orders",
+                "initial_stage": "start",
+                "final_stage": "end",
+                "stages": {
+                    "start": {
+                        "name": "Start",
+                        "fields": ["order"],
+                        "gates": {
+                            "to_end": {
+                                "target_stage": "end",
+                                "locks": [{"exists": "email"}],
+                            }
+                        },
+                    },
+                    "end": {"name": "End", "fields": []},
+                },
+            }
+        )
+
+        # Act
+        with JsonlElementStore(jsonl_file, id_path="order.id") as store:
+            results = process.evaluate_batch(store.select(["A-1", "A-2"]), "start")
+
+        # Assert
+        assert [r["stage_result"].status for r in results] == [
+            StageStatus.READY,
+            StageStatus.BLOCKED,
+        ]
@@ -0,0 +1,155 @@
+"""Unit tests for verified artifacts and trusted fast loads."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from stageflow.elements import create_element
+from stageflow.loader import (
+    ArtifactVerificationError,
+    ProcessLoader,
+    read_artifact,
+    write_artifact,
+)
+from stageflow.models import LoadResultStatus
+
+PROCESS_YAML = """\
+process:
+  name: flow
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      expected_actions:
+        - description: Provide an email
+      gates:
+        done:
+          target_stage: end
+          locks:
+            - exists: email
+    end:
+      fields: []
+"""
+
+KEY = "ci-secret"
+
+
+@pytest.fixture
+def process(tmp_path: Path):
+    path = tmp_path / "flow.yaml"
+    path.write_text(PROCESS_YAML)
+    result = ProcessLoader(cache=None).load(path)
+    assert result.success
+    return result.process
+
+
+@pytest.fixture
+def loader() -> ProcessLoader:
+    return ProcessLoader(cache=None)
+
+
+class TestTrustedLoad:
+    """Test that verified artifacts skip validation and analysis."""
+
+    def test_signed_artifact_round_trip(self, process, loader, tmp_path):
+        """Verify a signed artifact rebuilds an equivalent, working process."""
+        # Arrange
+        artifact = tmp_path / "flow.artifact.json"
+        write_artifact(process, artifact, key=KEY)
+
+        # Act
+        result = loader.load_trusted(artifact, key=KEY)
+
+        # Assert
+        assert result.success
+        trusted = result.process
+        assert trusted.trusted
+        assert trusted.to_dict() == process.to_dict()
+        assert trusted.issues == process.issues
+        evaluation = trusted.evaluate(create_element({"email": "a@b.c"}), "start")
+        assert evaluation["stage_result"].status == "ready"
+
+    def test_validation_and_analysis_are_skipped(self, process, loader, tmp_path):
+        """Verify no validator, action check or analysis runs on trusted loads."""
+        # Arrange
+        artifact = tmp_path / "flow.artifact.json"
+        digest = write_artifact(process, artifact)
+
+        # Act
+        with (
+            patch("stageflow.loader.loader.ProcessConfigValidator") as validator,
+            patch("stageflow.stage.Stage._validate_actions") as validate_actions,
+            patch("stageflow.process.Process._run_analysis") as run_analysis,
+        ):
+            result = loader.load_trusted(artifact, expected_hash=digest)
+
+        # Assert
+        assert result.success
+        validator.assert_not_called()
+        validate_actions.assert_not_called()
+        run_analysis.assert_not_called()
+
+    def test_tampered_artifact_is_rejected(self, process, loader, tmp_path):
+        """Verify edits to the payload fail the signature check."""
+        # Arrange
+        artifact = tmp_path / "flow.artifact.json"
+        write_artifact(process, artifact, key=KEY)
+        entry = json.loads(artifact.read_text())
+        entry["config"]["initial_stage"] = "end"
+        artifact.write_text(json.dumps(entry))
+
+        # Act
+        result = loader.load_trusted(artifact, key=KEY)
+
+        # Assert
+        assert result.status == LoadResultStatus.VALIDATION_ERROR
+        assert "verification failed" in result.errors[0].message
+
+    def test_wrong_key_or_hash_is_rejected(self, process, tmp_path):
+        """Verify the signature and pinned hash are both enforced."""
+        # Arrange
+        artifact = tmp_path / "flow.artifact.json"
+        write_artifact(process, artifact, key=KEY)
+
+        # Act & Assert
+        with pytest.raises(ArtifactVerificationError):
+            read_artifact(artifact, key="other")
+        with pytest.raises(ArtifactVerificationError):
+            read_artifact(artifact, expected_hash="0" * 64)
+
+    def test_unverified_load_is_refused(self, process, tmp_path, monkeypatch):
+        """Verify a trusted load without key or hash is not allowed."""
+        # Arrange
+        monkeypatch.delenv("STAGEFLOW_ARTIFACT_KEY", raising=False)
+        artifact = tmp_path / "flow.artifact.json"
+        write_artifact(process, artifact)
+
+        # Act
+        result = ProcessLoader(cache=None).load_trusted(artifact)
+
+        # Assert
+        assert not result.success
+        assert "signing key or an expected hash" in result.errors[0].message
+
+    def test_key_from_environment(self, process, loader, tmp_path, monkeypatch):
+        """Verify STAGEFLOW_ARTIFACT_KEY is used when no key is passed."""
+        # Arrange
+        monkeypatch.setenv("STAGEFLOW_ARTIFACT_KEY", KEY)
+        artifact = tmp_path / "flow.artifact.json"
+        write_artifact(process, artifact, key=KEY)
+
+        # Act
+        result = loader.load_trusted(artifact)
+
+        # Assert
+        assert result.success
+
+    def test_missing_artifact_is_file_error(self, loader, tmp_path):
+        """Verify unreadable artifacts are reported as file errors."""
+        # Arrange & Act
+        result = loader.load_trusted(tmp_path / "missing.json", key=KEY)
+
+        # Assert
+        assert result.status == LoadResultStatus.FILE_ERROR
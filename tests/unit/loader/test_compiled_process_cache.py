@@ -0,0 +1,145 @@
+"""Unit tests for the on-disk compiled process cache."""
+
+from pathlib import Path
+
+import pytest
+
+from stageflow.loader import CompiledProcessCache, ProcessLoader
+from stageflow.process import Process
+
+PROCESS_YAML = """\
+process:
+  name: cached_process
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      $include: start.yaml
+    end:
+      name: End
+      fields: []
+"""
+
+START_STAGE_YAML = """\
+name: Start
+fields:
+  - email
+gates:
+  to_end:
+    target_stage: end
+    locks:
+      - exists: verified
+"""
+
+
+@pytest.fixture
+def process_file(tmp_path: Path) -> Path:
+    (tmp_path / "start.yaml").write_text(START_STAGE_YAML)
+    path = tmp_path / "process.yaml"
+    path.write_text(PROCESS_YAML)
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> CompiledProcessCache:
+    return CompiledProcessCache(tmp_path / "cache")
+
+
+class TestCompiledProcessCache:
+    """Test compiled cache hits, misses and invalidation."""
+
+    def test_second_load_is_served_from_cache(self, process_file, cache, mocker):
+        """Verify a cache hit skips YAML parsing and analysis."""
+        # Arrange
+        loader = ProcessLoader(cache=cache)
+        first = loader.load(process_file)
+        analysis = mocker.spy(Process, "_run_analysis")
+        parse = mocker.spy(ProcessLoader, "_extract_process_config")
+
+        # Act
+        second = loader.load(process_file)
+
+        # Assert
+        assert first.success and second.success
+        assert analysis.call_count == 0
+        assert parse.call_count == 0
+        assert cache.hits == 1
+        assert second.process.to_dict() == first.process.to_dict()
+        assert second.process.issues == first.process.issues
+
+    def test_editing_the_file_invalidates_entry(self, process_file, cache):
+        """Verify a changed process file is reloaded from source."""
+        # Arrange
+        loader = ProcessLoader(cache=cache)
+        loader.load(process_file)
+        process_file.write_text(PROCESS_YAML.replace("cached_process", "renamed"))
+
+        # Act
+        result = loader.load(process_file)
+
+        # Assert
+        assert result.process.name == "renamed"
+        assert cache.hits == 0
+
+    def test_editing_an_include_invalidates_entry(self, process_file, cache):
+        """Verify changes to included stage files are detected."""
+        # Arrange
+        loader = ProcessLoader(cache=cache)
+        loader.load(process_file)
+        include = process_file.parent / "start.yaml"
+        include.write_text(START_STAGE_YAML.replace("name: Start", "name: Begin"))
+
+        # Act
+        result = loader.load(process_file)
+
+        # Assert
+        assert result.process.get_stage("start").name == "Begin"
+        assert cache.hits == 0
+
+    def test_corrupt_entry_is_treated_as_miss(self, process_file, cache):
+        """Verify unreadable entries fall back to a normal load."""
+        # Arrange
+        loader = ProcessLoader(cache=cache)
+        loader.load(process_file)
+        for entry in cache.cache_dir.glob("*.json"):
+            entry.write_text("{not json")
+
+        # Act
+        result = loader.load(process_file)
+
+        # Assert
+        assert result.success
+        assert cache.misses == 2
+
+    def test_clear_removes_entries(self, process_file, cache):
+        """Verify clear() deletes every cached entry."""
+        # Arrange
+        ProcessLoader(cache=cache).load(process_file)
+
+        # Act
+        removed = cache.clear()
+
+        # Assert
+        assert removed == 1
+        assert list(cache.cache_dir.glob("*.json")) == []
+
+    def test_cache_is_disabled_by_default(self, monkeypatch):
+        """Verify no cache is used unless enabled via environment."""
+        # Arrange
+        monkeypatch.delenv("STAGEFLOW_CACHE_ENABLED", raising=False)
+
+        # Act & Assert
+        assert ProcessLoader().cache is None
+
+    def test_cache_enabled_from_environment(self, monkeypatch, tmp_path):
+        """Verify STAGEFLOW_CACHE_ENABLED and STAGEFLOW_CACHE_DIR configure the cache."""
+        # Arrange
+        monkeypatch.setenv("STAGEFLOW_CACHE_ENABLED", "true")
+        monkeypatch.setenv("STAGEFLOW_CACHE_DIR", str(tmp_path / "env-cache"))
+
+        # Act
+        loader = ProcessLoader()
+
+        # Assert
+        assert loader.cache is not None
+        assert loader.cache.cache_dir == tmp_path / "env-cache"
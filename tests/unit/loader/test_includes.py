@@ -0,0 +1,172 @@
+"""Unit tests for shared `$include` resolution."""
+
+from pathlib import Path
+
+import pytest
+
+from stageflow.loader import ProcessLoader
+from stageflow.loader.includes import IncludeCycleError, IncludeResolver
+from stageflow.manager import ManagerConfig, ProcessCache, ProcessRegistry
+
+PROCESS_YAML = """\
+process:
+  name: {name}
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      $include: stages/start.yaml
+    end:
+      fields: []
+"""
+
+START_STAGE_YAML = """\
+$include: base/start_base.yaml
+name: Start
+"""
+
+BASE_STAGE_YAML = """\
+name: Base
+description: Shared start stage
+gates:
+  done:
+    target_stage: end
+    locks:
+      - exists: email
+"""
+
+
+@pytest.fixture
+def registry_dir(tmp_path: Path) -> Path:
+    (tmp_path / "stages" / "base").mkdir(parents=True)
+    (tmp_path / "stages" / "start.yaml").write_text(START_STAGE_YAML)
+    (tmp_path / "stages" / "base" / "start_base.yaml").write_text(BASE_STAGE_YAML)
+    for name in ("alpha", "beta", "gamma"):
+        (tmp_path / f"{name}.yaml").write_text(PROCESS_YAML.format(name=name))
+    return tmp_path
+
+
+class TestIncludeResolver:
+    """Test nested includes, caching and cycle detection."""
+
+    def test_nested_includes_are_merged(self, registry_dir):
+        """Verify includes resolve relative to the including file."""
+        # Arrange
+        loader = ProcessLoader(cache=None, include_resolver=IncludeResolver())
+
+        # Act
+        result = loader.load(registry_dir / "alpha.yaml")
+
+        # Assert
+        assert result.success
+        stage = result.process.get_stage("start")
+        assert stage.name == "Start"
+        assert stage.description == "Shared start stage"
+        assert len(result.includes) == 2
+
+    def test_shared_files_are_parsed_once(self, registry_dir):
+        """Verify include files are parsed once across many process loads."""
+        # Arrange
+        resolver = IncludeResolver()
+        loader = ProcessLoader(cache=None, include_resolver=resolver)
+
+        # Act
+        results = [loader.load(registry_dir / f"{n}.yaml") for n in ("alpha", "beta", "gamma")]
+
+        # Assert
+        assert all(result.success for result in results)
+        assert resolver.parses == 2
+        assert resolver.reads == 2
+
+    def test_edited_include_is_reparsed(self, registry_dir):
+        """Verify a changed include file is not served from the cache."""
+        # Arrange
+        resolver = IncludeResolver()
+        loader = ProcessLoader(cache=None, include_resolver=resolver)
+        loader.load(registry_dir / "alpha.yaml")
+        (registry_dir / "stages" / "start.yaml").write_text(
+            START_STAGE_YAML.replace("name: Start", "name: Begin")
+        )
+
+        # Act
+        result = loader.load(registry_dir / "alpha.yaml")
+
+        # Assert
+        assert result.process.get_stage("start").name == "Begin"
+
+    def test_returned_data_is_private(self, registry_dir):
+        """Verify callers cannot corrupt the parse cache."""
+        # Arrange
+        resolver = IncludeResolver()
+        path = registry_dir / "stages" / "base" / "start_base.yaml"
+
+        # Act
+        resolver.load(path)["gates"].clear()
+
+        # Assert
+        assert resolver.load(path)["gates"]
+
+    def test_cycles_are_reported(self, tmp_path):
+        """Verify mutually including files raise instead of recursing."""
+        # Arrange
+        (tmp_path / "a.yaml").write_text("$include: b.yaml\n")
+        (tmp_path / "b.yaml").write_text("$include: a.yaml\n")
+        resolver = IncludeResolver()
+
+        # Act & Assert
+        with pytest.raises(IncludeCycleError) as exc_info:
+            resolver.resolve({"$include": "a.yaml"}, tmp_path)
+        assert [p.name for p in exc_info.value.chain] == ["a.yaml", "b.yaml", "a.yaml"]
+
+    def test_cycle_becomes_load_error(self, tmp_path):
+        """Verify the loader reports include cycles as load errors."""
+        # Arrange
+        (tmp_path / "stages").mkdir()
+        (tmp_path / "stages" / "start.yaml").write_text("$include: start.yaml\n")
+        (tmp_path / "flow.yaml").write_text(PROCESS_YAML.format(name="flow"))
+        loader = ProcessLoader(cache=None, include_resolver=IncludeResolver())
+
+        # Act
+        result = loader.load(tmp_path / "flow.yaml")
+
+        # Assert
+        assert not result.success
+        assert any("Include cycle" in error.message for error in result.errors)
+
+
+class TestIncludeGraph:
+    """Test dependency tracking and cache invalidation through the graph."""
+
+    def test_graph_maps_includes_to_processes(self, registry_dir):
+        """Verify dependents of a shared include are all its processes."""
+        # Arrange
+        resolver = IncludeResolver()
+        loader = ProcessLoader(cache=None, include_resolver=resolver)
+        for name in ("alpha", "beta"):
+            loader.load(registry_dir / f"{name}.yaml")
+
+        # Act
+        dependents = resolver.graph.dependents(
+            registry_dir / "stages" / "base" / "start_base.yaml"
+        )
+
+        # Assert
+        assert {path.name for path in dependents} == {"alpha.yaml", "beta.yaml"}
+
+    def test_process_cache_reloads_on_include_change(self, registry_dir):
+        """Verify cached registry processes are invalidated by nested include edits."""
+        # Arrange
+        registry = ProcessRegistry(
+            ManagerConfig(processes_dir=registry_dir), process_cache=ProcessCache()
+        )
+        first = registry.load_process("alpha")
+        base = registry_dir / "stages" / "base" / "start_base.yaml"
+
+        # Act
+        base.write_text(BASE_STAGE_YAML.replace("Shared start stage", "Changed"))
+        second = registry.load_process("alpha")
+
+        # Assert
+        assert second is not first
+        assert second.get_stage("start").description == "Changed"
+        assert registry.process_cache.invalidate_include(base) == 1
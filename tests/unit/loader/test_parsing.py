@@ -0,0 +1,86 @@
+"""Unit tests for the fast YAML/JSON parsing layer."""
+
+import json
+
+import pytest
+from ruamel.yaml import YAML
+from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.constructor import DuplicateKeyError
+
+from stageflow.loader import load_document, parse_document, yaml_backend
+from stageflow.models import FileFormat
+
+
+class TestParseDocument:
+    """Test loader selection and parsing semantics."""
+
+    def test_yaml_matches_round_trip_loader(self):
+        """Verify the fast path returns the same data as the round-trip loader."""
+        # Arrange
+        content = "name: demo\nflags: [yes, no, true]\nlimits:\n  max: 1.5\n"
+
+        # Act
+        fast = parse_document(content)
+        round_trip = YAML().load(content)
+
+        # Assert
+        assert fast == round_trip
+        assert fast["flags"] == ["yes", "no", True]
+        assert type(fast) is dict
+
+    def test_json_content_uses_json_parser(self, mocker):
+        """Verify JSON content never reaches the YAML parser."""
+        # Arrange
+        yaml_load = mocker.patch("stageflow.loader.parsing._safe_yaml")
+
+        # Act
+        data = parse_document('  {"name": "demo", "items": [1, 2]}')
+
+        # Assert
+        assert data == {"name": "demo", "items": [1, 2]}
+        yaml_load.assert_not_called()
+
+    def test_flow_style_yaml_falls_back_from_json(self):
+        """Verify YAML flow mappings that are not JSON still parse."""
+        # Arrange & Act
+        data = parse_document("{name: demo, count: 2}")
+
+        # Assert
+        assert data == {"name": "demo", "count": 2}
+
+    def test_duplicate_keys_in_json_content_fail(self):
+        """Verify JSON-looking YAML with a repeated key fails like YAML does."""
+        # Arrange & Act & Assert
+        with pytest.raises(DuplicateKeyError):
+            parse_document('{"a": 1, "nested": {"b": 1, "b": 2}}')
+
+    def test_explicit_json_format_is_strict(self):
+        """Verify declared JSON content raises JSON errors."""
+        # Arrange & Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            parse_document("name: demo", FileFormat.JSON)
+
+    def test_round_trip_preserves_comments(self):
+        """Verify round-trip mode returns ruamel's commented containers."""
+        # Arrange & Act
+        data = parse_document("name: demo  # comment\n", round_trip=True)
+
+        # Assert
+        assert isinstance(data, CommentedMap)
+
+    def test_load_document_reads_files(self, tmp_path):
+        """Verify files are loaded with their extension as a format hint."""
+        # Arrange
+        yaml_file = tmp_path / "data.yaml"
+        yaml_file.write_text("a: 1\n")
+        json_file = tmp_path / "data.json"
+        json_file.write_text('{"a": 2}')
+
+        # Act & Assert
+        assert load_document(yaml_file) == {"a": 1}
+        assert load_document(json_file) == {"a": 2}
+
+    def test_backend_is_reported(self):
+        """Verify the active YAML backend is exposed."""
+        # Arrange & Act & Assert
+        assert yaml_backend() in ("libyaml", "pure-python")
@@ -486,3 +486,59 @@ class TestSchemaGenerator:
 
         with pytest.raises(ValueError, match="Stage 'nonexistent' not found"):
             generator.generate_cumulative_schema("nonexistent")
+
+    def test_all_cumulative_schemas_match_per_stage(self):
+        """Test that the one-pass generation matches per-stage generation."""
+        process = Process(
+            {
+                "name": "branching",
+                "initial_stage": "start",
+                "final_stage": "done",
+                "stages": {
+                    "start": {
+                        "fields": {"email": {"type": "string"}},
+                        "gates": {
+                            "to_a": {"target_stage": "a", "locks": [{"exists": "email"}]},
+                            "to_b": {"target_stage": "b", "locks": [{"exists": "phone"}]},
+                        },
+                    },
+                    "a": {
+                        "fields": {"age": {"type": "int"}},
+                        "gates": {"to_done": {"target_stage": "done", "locks": [{"exists": "age"}]}},
+                    },
+                    "b": {
+                        "fields": {"email": {"type": "int"}},
+                        "gates": {"to_done": {"target_stage": "done", "locks": [{"exists": "code"}]}},
+                    },
+                    "done": {"fields": {"ok": {"type": "bool"}}, "is_final": True},
+                },
+            }
+        )
+        generator = SchemaGenerator(process)
+
+        schemas = generator.generate_all_cumulative_schemas()
+
+        assert set(schemas) == {"start", "a", "b", "done"}
+        for stage_id, schema in schemas.items():
+            assert schema == generator.generate_cumulative_schema(stage_id)
+        # "b" overrides the email type from "start"
+        assert schemas["b"]["properties"]["email"]["type"] == "integer"
+        # "done" is reached through "a", so "b"'s gate locks are not included
+        assert "code" not in schemas["done"]["required"]
+
+    def test_all_cumulative_schemas_cached_per_version(self, multi_stage_process, mocker):
+        """Test that results are reused until the process changes."""
+        generator = SchemaGenerator(multi_stage_process)
+        spy = mocker.spy(generator, "_build_cumulative_schemas")
+
+        first = generator.generate_all_cumulative_schemas()
+        first["stage1"]["properties"].clear()
+        second = generator.generate_all_cumulative_schemas()
+        multi_stage_process.add_stage(
+            "orphan", {"fields": {"x": {"type": "string"}}, "is_final": True}
+        )
+        third = generator.generate_all_cumulative_schemas()
+
+        assert spy.call_count == 2
+        assert second["stage1"]["properties"]
+        assert "orphan" not in third
@@ -2095,3 +2095,105 @@ class TestLockDocumentedIssues:
         assert LockShorhands["is_true"] == (LockType.EQUALS, True)
         assert LockShorhands["is_false"] == (LockType.EQUALS, False)
         assert LockShorhands["exists"] == (LockType.EXISTS, True)
+
+
+class TestCollectionLocks:
+    """Test suite for hashed membership and cached item strings."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("b", True),
+            (2, True),
+            (2.0, True),
+            ({"k": 1}, True),
+            ([1, 2], True),
+            ("z", False),
+            ({"k": 2}, False),
+            (None, False),
+        ],
+    )
+    def test_in_list_with_mixed_items(self, value, expected):
+        """Verify hashed IN_LIST matches list membership, unhashables included."""
+        # Arrange
+        allowed = ["a", "b", 2, {"k": 1}, [1, 2]]
+        lock = SimpleLock(
+            {"type": LockType.IN_LIST, "property_path": "v", "expected_value": allowed}
+        )
+        element = DictElement({"v": value})
+
+        # Act
+        result = lock.validate(element)
+
+        # Assert
+        assert result.success == expected == (value in allowed)
+
+    def test_not_in_list_uses_member_set(self):
+        """Verify NOT_IN_LIST checks a large deny-list through a hashed set."""
+        # Arrange
+        lock = SimpleLock(
+            {
+                "type": LockType.NOT_IN_LIST,
+                "property_path": "code",
+                "expected_value": [f"c{i}" for i in range(5000)],
+            }
+        )
+
+        # Act & Assert
+        assert not lock.validate(DictElement({"code": "c4999"})).success
+        assert lock.validate(DictElement({"code": "x"})).success
+
+    def test_contains_reuses_item_strings_within_evaluation(self, mocker):
+        """Verify CONTAINS stringifies a collection once per gate evaluation."""
+        from stageflow.gate import Gate
+
+        # Arrange
+        class Item:
+            def __init__(self, name):
+                self.name = name
+
+            def __str__(self):
+                return self.name
+
+        str_spy = mocker.spy(Item, "__str__")
+        items = [Item(f"i{n}") for n in range(10)]
+        gate = Gate(
+            {
+                "name": "check",
+                "target_stage": "done",
+                "locks": [
+                    {"type": "contains", "property_path": "items", "expected_value": "i3"},
+                    {"type": "contains", "property_path": "items", "expected_value": "i7"},
+                    {"type": "contains", "property_path": "items", "expected_value": "nope"},
+                ],
+            }
+        )
+
+        # Act
+        result = gate.evaluate(DictElement({"items": items}))
+
+        # Assert
+        assert [lock.success for lock in result.lock_results] == [True, True, False]
+        assert str_spy.call_count == len(items)
+
+    def test_contains_without_cache_short_circuits(self):
+        """Verify CONTAINS outside an evaluation stops at the first match."""
+        # Arrange
+        seen = []
+
+        class Item:
+            def __init__(self, name):
+                self.name = name
+
+            def __str__(self):
+                seen.append(self.name)
+                return self.name
+
+        items = [Item("a"), Item("b"), Item("c")]
+
+        # Act
+        result = LockType.CONTAINS.validate(items, {"expected_value": "a"})
+
+        # Assert
+        assert result is True
+        assert seen == ["a"]
@@ -1,6 +1,12 @@
+from datetime import date
+
 import pytest
 
+from stageflow.analysis.stage import StageAnalyzer
+from stageflow.elements import DictElement
 from stageflow.lock import LockFactory, OrLogicLock, SimpleLock
+from stageflow.models import ProcessIssueTypes
+from stageflow.stage import Stage
 
 
 def test_factory_creates_or_logic_lock():
@@ -135,3 +141,126 @@ def test_factory_or_logic_with_shorthand():
         for group in lock.condition_groups
         for lock_item in group
     )
+
+
+def test_factory_interns_identical_definitions():
+    """Identical lock definitions share one instance."""
+    first = LockFactory.create({"exists": "email"})
+    second = LockFactory.create({"exists": "email"})
+    other = LockFactory.create({"exists": "email", "error_message": "Email required"})
+
+    assert first is second
+    assert other is not first
+    assert other.fingerprint == first.fingerprint
+
+
+def test_factory_shares_nested_locks():
+    """Composite locks reuse interned sub-locks."""
+    shared = LockFactory.create({"exists": "work_done"})
+
+    lock = LockFactory.create(
+        {"type": "OR_LOGIC", "conditions": [{"locks": [{"exists": "work_done"}]}]}
+    )
+
+    assert lock.condition_groups[0][0] is shared
+
+
+def test_fingerprint_is_canonical():
+    """Equivalent spellings of a lock have the same fingerprint."""
+    shorthand = LockFactory.create({"exists": "email"})
+    verbose = LockFactory.create(
+        {"type": "EXISTS", "property_path": "email", "expected_value": True}
+    )
+    first = LockFactory.create(
+        {"type": "IN_LIST", "property_path": "x", "expected_value": {"a": 1, "b": 2}}
+    )
+    reordered = LockFactory.create(
+        {"expected_value": {"b": 2, "a": 1}, "property_path": "x", "type": "IN_LIST"}
+    )
+
+    assert shorthand.fingerprint == verbose.fingerprint
+    assert first is reordered
+    hash(first.fingerprint)
+
+
+def test_fingerprint_distinguishes_conditions():
+    """Different values, metadata or lock structure give different fingerprints."""
+    equals_true = LockFactory.create({"is_true": "flag"})
+    equals_one = LockFactory.create(
+        {"type": "EQUALS", "property_path": "flag", "expected_value": 1}
+    )
+    narrow = LockFactory.create(
+        {"type": "RANGE", "property_path": "n", "metadata": {"min_value": 1, "max_value": 2}}
+    )
+    wide = LockFactory.create(
+        {"type": "RANGE", "property_path": "n", "metadata": {"min_value": 1, "max_value": 9}}
+    )
+    either = LockFactory.create(
+        {"type": "OR_LOGIC", "conditions": [{"locks": [{"exists": "a"}]}, {"locks": [{"exists": "b"}]}]}
+    )
+    both = LockFactory.create(
+        {"type": "OR_LOGIC", "conditions": [{"locks": [{"exists": "a"}, {"exists": "b"}]}]}
+    )
+
+    assert equals_true.fingerprint != equals_one.fingerprint
+    assert narrow.fingerprint != wide.fingerprint
+    assert either.fingerprint != both.fingerprint
+
+
+def test_values_differing_in_type_are_not_shared():
+    """A date and its ISO string are different locks with different fingerprints."""
+    as_date = LockFactory.create(
+        {"type": "EQUALS", "property_path": "d", "expected_value": date(2024, 1, 1)}
+    )
+    as_text = LockFactory.create(
+        {"type": "EQUALS", "property_path": "d", "expected_value": "2024-01-01"}
+    )
+    as_int = LockFactory.create(
+        {"type": "EQUALS", "property_path": "n", "expected_value": 1}
+    )
+    as_float = LockFactory.create(
+        {"type": "EQUALS", "property_path": "n", "expected_value": 1.0}
+    )
+
+    assert as_text is not as_date
+    assert as_text.fingerprint != as_date.fingerprint
+    assert as_text.validate(DictElement({"d": "2024-01-01"})).success
+    assert as_int is not as_float
+
+
+def test_duplicate_gates_compare_value_types():
+    """Gates differing only in a date vs string value are not duplicates."""
+    stage = Stage(
+        "review",
+        {
+            "name": "Review",
+            "gates": {
+                "by_date": {
+                    "target_stage": "done",
+                    "locks": [
+                        {
+                            "type": "EQUALS",
+                            "property_path": "d",
+                            "expected_value": date(2024, 1, 1),
+                        }
+                    ],
+                },
+                "by_text": {
+                    "target_stage": "archived",
+                    "locks": [
+                        {
+                            "type": "EQUALS",
+                            "property_path": "d",
+                            "expected_value": "2024-01-01",
+                        }
+                    ],
+                },
+            },
+        },
+    )
+
+    issues = StageAnalyzer(stage.to_schema_mutations()).get_issues()
+
+    assert ProcessIssueTypes.DUPLICATE_GATE_SCHEMAS not in [
+        issue.issue_type for issue in issues
+    ]
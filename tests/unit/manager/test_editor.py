@@ -673,3 +673,276 @@ class TestProcessEditorUtilityMethods:
         # Check no fatal issues (warnings allowed for schema transformation)
         fatal_issues = [i for i in issues if i.severity == "fatal"]
         assert len(fatal_issues) == 0
+
+
+def _chain_process(length: int) -> Process:
+    """Create a linear process s0 -> s1 -> ... -> s{length-1}."""
+    stages: dict = {}
+    for i in range(length - 1):
+        stages[f"s{i}"] = {
+            "fields": {f"field_{i}": {"type": "str"}},
+            "gates": [
+                {
+                    "name": "next",
+                    "target_stage": f"s{i + 1}",
+                    "locks": [{"exists": f"field_{i}"}, {"exists": f"field_{i + 1}"}],
+                }
+            ],
+        }
+    stages[f"s{length - 1}"] = {"fields": {f"field_{length - 1}": {"type": "str"}}}
+    return Process(
+        {
+            "name": "chain",
+            "initial_stage": "s0",
+            "final_stage": f"s{length - 1}",
+            "stages": stages,
+        }
+    )
+
+
+class TestProcessEditorIncrementalAnalysis:
+    """Test that edits only re-analyze the stages they touch."""
+
+    def test_update_stage_reanalyzes_only_that_stage(self, mocker):
+        """Test that updating one stage extracts schema mutations once."""
+        from stageflow.stage import Stage
+
+        editor = ProcessEditor(_chain_process(30))
+        new_config = {
+            "name": "Renamed",
+            "fields": {"field_10": {"type": "str"}},
+            "gates": [
+                {
+                    "name": "next",
+                    "target_stage": "s11",
+                    "locks": [{"exists": "field_10"}, {"exists": "field_11"}],
+                }
+            ],
+        }
+        spy = mocker.spy(Stage, "to_schema_mutations")
+
+        editor.update_stage("s10", new_config)
+
+        assert spy.call_count == 1
+        assert editor.process.get_stage("s10").name == "Renamed"
+        assert editor.process.stage_ids.index("s10") == 10
+
+    def test_update_final_stage_keeps_role(self):
+        """Test that updating the final stage keeps it as the final stage."""
+        process = _chain_process(5)
+        editor = ProcessEditor(process)
+
+        editor.update_stage("s4", {"name": "Done", "fields": {"field_4": {"type": "str"}}})
+
+        assert editor.process.final_stage.name == "Done"
+        assert editor.process.final_stage.is_final
+        assert editor.process.stage_ids == process.stage_ids
+
+    def test_incremental_issues_match_full_analysis(self, three_stage_process):
+        """Test that cached analysis reports the same issues as a fresh one."""
+        editor = ProcessEditor(three_stage_process)
+        editor.add_transition("start", "end")
+
+        fresh = Process(editor.get_process_definition())
+        fresh.add_transition("start", "end")
+
+        assert editor.consistency_issues == fresh.issues
+        assert editor.process.analysis_cache.stats.hits > 0
+
+    def test_rollback_reuses_analysis_cache(self, simple_process):
+        """Test that every version of the process shares the analysis cache."""
+        editor = ProcessEditor(simple_process)
+        cache = simple_process.analysis_cache
+
+        editor.add_transition("start", "end")
+        editor.rollback()
+
+        assert editor.process is simple_process
+        assert editor.process.analysis_cache is cache
+
+
+class TestProcessEditorSnapshots:
+    """Test copy-on-write versions, rollback and undo/redo."""
+
+    def test_edits_do_not_modify_original_process(self, simple_process):
+        """Test that edits build new versions sharing untouched stages."""
+        original = simple_process.to_dict()
+        editor = ProcessEditor(simple_process)
+
+        editor.update_stage("end", {"name": "Done", "fields": {"completed_at": {"type": "str"}}})
+
+        assert simple_process.to_dict() == original
+        assert editor.process is not simple_process
+        assert editor.process.get_stage("start") is simple_process.get_stage("start")
+        assert editor.process.get_stage("end").name == "Done"
+
+    def test_failed_edit_keeps_current_version(self, three_stage_process):
+        """Test that a rejected edit leaves earlier committed edits in place."""
+        editor = ProcessEditor(three_stage_process)
+        editor.add_transition("start", "end")
+        committed = editor.process
+
+        with pytest.raises(ValidationFailedError):
+            editor.add_stage(
+                "orphan",
+                {"gates": [{"name": "out", "target_stage": "nowhere", "locks": [{"exists": "x"}]}]},
+            )
+
+        assert editor.process is committed
+        assert editor.is_dirty
+        assert editor.process.get_stage("orphan") is None
+
+    def test_undo_and_redo(self, three_stage_process):
+        """Test that undo and redo swap between committed versions."""
+        editor = ProcessEditor(three_stage_process)
+        editor.add_transition("start", "end")
+        first = editor.process
+        middle = editor.process.get_stage("middle").to_dict()
+        editor.update_stage("middle", {**middle, "name": "Renamed"})
+        second = editor.process
+
+        editor.undo()
+        assert editor.process is first
+        editor.undo()
+        assert editor.process is three_stage_process
+        assert not editor.is_dirty
+        assert not editor.can_undo
+
+        editor.redo()
+        editor.redo()
+        assert editor.process is second
+        assert editor.is_dirty
+        assert not editor.can_redo
+
+    def test_new_edit_clears_redo(self, three_stage_process):
+        """Test that committing an edit after undo drops the redo history."""
+        editor = ProcessEditor(three_stage_process)
+        editor.add_transition("start", "end")
+        editor.undo()
+
+        editor.add_transition("middle", "start")
+
+        assert not editor.can_redo
+        with pytest.raises(ProcessEditorError, match="Nothing to redo"):
+            editor.redo()
+
+    def test_rollback_can_be_undone(self, three_stage_process):
+        """Test that rollback is recorded as a version in the history."""
+        editor = ProcessEditor(three_stage_process)
+        editor.add_transition("start", "end")
+        edited = editor.process
+
+        editor.rollback()
+        editor.undo()
+
+        assert editor.process is edited
+
+    def test_history_limit(self, three_stage_process):
+        """Test that only the configured number of versions is kept."""
+        editor = ProcessEditor(three_stage_process, history_limit=2)
+        for _ in range(5):
+            editor.add_transition("start", "end")
+
+        editor.undo()
+        editor.undo()
+
+        assert not editor.can_undo
+
+
+class TestProcessEditorTransaction:
+    """Test batched edits with a single validation at commit."""
+
+    def test_transaction_analyzes_once(self, mocker):
+        """Test that a batch of edits runs analysis exactly once."""
+        editor = ProcessEditor(_chain_process(20))
+        spy = mocker.spy(Process, "_run_analysis")
+
+        with editor.transaction() as report:
+            for i in range(10):
+                editor.add_transition(f"s{i}", f"s{i + 2}")
+            assert spy.call_count == 0
+
+        assert spy.call_count == 1
+        assert report.committed
+        assert report.operations == 10
+        assert report.analysis_runs == 1
+        assert report.analysis_seconds > 0
+        assert editor.is_dirty
+
+    def test_transaction_is_single_undo_step(self, three_stage_process):
+        """Test that a committed transaction is undone as a whole."""
+        editor = ProcessEditor(three_stage_process)
+
+        with editor.transaction():
+            editor.add_transition("start", "end")
+            editor.add_transition("middle", "start")
+        editor.undo()
+
+        assert editor.process is three_stage_process
+
+    def test_intermediate_invalid_states_are_allowed(self, three_stage_process):
+        """Test that only the final state of a transaction is validated."""
+        editor = ProcessEditor(three_stage_process)
+        branch = {
+            "fields": {"field3": {"type": "str"}},
+            "gates": [
+                {
+                    "name": "to_end",
+                    "target_stage": "end",
+                    "locks": [{"exists": "field3"}, {"exists": "completed_at"}],
+                }
+            ],
+        }
+
+        with editor.transaction() as report:
+            # Unreachable until the transition below is added
+            editor.add_stage("branch", branch)
+            editor.add_transition("start", "branch")
+
+        assert report.committed
+        assert report.stages_analyzed >= 1
+        assert editor.process.get_stage("branch") is not None
+
+    def test_invalid_result_rolls_back_everything(self, three_stage_process):
+        """Test that a failing commit applies none of the edits."""
+        editor = ProcessEditor(three_stage_process)
+        orphan = {
+            "gates": [
+                {"name": "out", "target_stage": "nowhere", "locks": [{"exists": "x"}]}
+            ]
+        }
+
+        with pytest.raises(ValidationFailedError):
+            with editor.transaction() as report:
+                editor.add_transition("start", "end")
+                editor.add_stage("orphan", orphan)
+
+        assert not report.committed
+        assert report.issues
+        assert editor.process is three_stage_process
+        assert not editor.is_dirty
+
+    def test_exception_discards_transaction(self, three_stage_process, mocker):
+        """Test that an error inside the block skips analysis and changes."""
+        editor = ProcessEditor(three_stage_process)
+        spy = mocker.spy(Process, "_run_analysis")
+
+        with pytest.raises(ProcessEditorError):
+            with editor.transaction():
+                editor.add_transition("start", "end")
+                editor.remove_stage("missing")
+
+        spy.assert_not_called()
+        assert editor.process is three_stage_process
+        assert not editor.in_transaction
+
+    def test_history_operations_are_rejected_inside(self, simple_process):
+        """Test that nested transactions, undo and sync are not allowed."""
+        editor = ProcessEditor(simple_process)
+
+        with editor.transaction():
+            with pytest.raises(ProcessEditorError, match="inside a transaction"):
+                with editor.transaction():
+                    pass
+            with pytest.raises(ProcessEditorError, match="inside a transaction"):
+                editor.sync()
@@ -0,0 +1,362 @@
+"""Unit tests for the persistent registry metadata index."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from stageflow.loader import ProcessLoader
+from stageflow.manager import ManagerConfig, ProcessRegistry
+from stageflow.manager import index as index_module
+from stageflow.manager.index import (
+    INDEX_FILE_NAME,
+    RegistryIndex,
+    get_shared_registry_index,
+)
+
+PROCESS_YAML = """\
+process:
+  name: {name}
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      gates:
+        done:
+          target_stage: end
+          locks:
+            - exists: email
+    end:
+      fields: []
+"""
+
+
+INCLUDING_PROCESS_YAML = """\
+process:
+  name: {name}
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      $include: stages/start.yaml
+    end:
+      fields: []
+"""
+
+START_STAGE_YAML = """\
+gates:
+  done:
+    target_stage: end
+    locks:
+      - exists: email
+"""
+
+CONFLICTING_LOCKS_YAML = """\
+      - type: equals
+        property_path: status
+        expected_value: a
+      - type: equals
+        property_path: status
+        expected_value: b
+"""
+
+
+def _write(processes_dir: Path, name: str, process_name: str | None = None) -> Path:
+    path = processes_dir / f"{name}.yaml"
+    path.write_text(PROCESS_YAML.format(name=process_name or name))
+    return path
+
+
+@pytest.fixture
+def trusted_mtimes(monkeypatch):
+    """Trust directory mtimes immediately so tests need not wait."""
+    monkeypatch.setattr(index_module, "RACY_WINDOW_NS", -(10**18))
+
+
+class TestRegistryIndex:
+    """Test index refresh and persistence."""
+
+    def test_names_exclude_index_file(self, tmp_path):
+        """Verify the persisted index is not listed as a process."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        (tmp_path / "alpha.json").write_text("{}")
+        _write(tmp_path, "beta")
+        index = RegistryIndex(tmp_path)
+
+        # Act
+        names = index.names()
+
+        # Assert
+        assert names == ["alpha", "beta"]
+        assert (tmp_path / INDEX_FILE_NAME).exists()
+        assert index.get("alpha").file_path == tmp_path / "alpha.yaml"
+
+    def test_unchanged_directory_is_not_rescanned(self, tmp_path, trusted_mtimes):
+        """Verify lookups only stat the directory when nothing changed."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        index = RegistryIndex(tmp_path, persist=False)
+        index.names()
+
+        # Act
+        for _ in range(5):
+            index.get("alpha")
+
+        # Assert
+        assert index.scans == 1
+
+    def test_own_index_write_does_not_force_rescan(self, tmp_path):
+        """Verify writing the index file alone doesn't invalidate the listing."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        old_ns = os.stat(tmp_path).st_mtime_ns - 10 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        index = RegistryIndex(tmp_path)
+        index.names()
+
+        # Act
+        names = index.names()
+
+        # Assert
+        assert names == ["alpha"]
+        assert (tmp_path / INDEX_FILE_NAME).exists()
+        assert index.scans == 1
+
+    def test_added_and_removed_files_are_detected(self, tmp_path):
+        """Verify directory changes trigger a rescan."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        index = RegistryIndex(tmp_path)
+        index.names()
+
+        # Act
+        _write(tmp_path, "beta")
+        (tmp_path / "alpha.yaml").unlink()
+
+        # Assert
+        assert index.names() == ["beta"]
+
+    def test_index_is_reused_across_instances(self, tmp_path):
+        """Verify a new index loads stored entries from disk."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        first = RegistryIndex(tmp_path)
+        first.names()
+        first.set_summary("alpha", "hash", {"stage_count": 2})
+        first.save()
+
+        # Act
+        second = RegistryIndex(tmp_path)
+
+        # Assert
+        entry = second.get("alpha")
+        assert entry.has_summary
+        assert entry.summary == {"stage_count": 2}
+
+    def test_stored_listing_is_trusted_by_new_instances(self, tmp_path):
+        """Verify a new index skips the rescan while the directory is unchanged."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        old_ns = os.stat(tmp_path).st_mtime_ns - 10 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        RegistryIndex(tmp_path).names()
+
+        # Act
+        second = RegistryIndex(tmp_path, persist=False)
+        names = second.names()
+
+        # Assert
+        assert names == ["alpha"]
+        assert second.scans == 0
+
+    def test_stored_listing_is_rescanned_after_directory_change(self, tmp_path):
+        """Verify files added after the index was stored are picked up."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        old_ns = os.stat(tmp_path).st_mtime_ns - 10 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        RegistryIndex(tmp_path).names()
+
+        # Act
+        _write(tmp_path, "beta")
+        second = RegistryIndex(tmp_path, persist=False)
+
+        # Assert
+        assert second.names() == ["alpha", "beta"]
+        assert second.scans == 1
+
+    def test_corrupt_index_file_is_ignored(self, tmp_path):
+        """Verify an unreadable index is rebuilt from the directory."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        (tmp_path / INDEX_FILE_NAME).write_text("{not json")
+
+        # Act
+        names = RegistryIndex(tmp_path).names()
+
+        # Assert
+        assert names == ["alpha"]
+
+
+class TestRegistrySummaries:
+    """Test incremental process summaries served from the index."""
+
+    def test_summaries_are_loaded_once(self, tmp_path, mocker):
+        """Verify unchanged processes are not reloaded for summaries."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        _write(tmp_path, "beta")
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        first = registry.get_process_summaries()
+        scan = mocker.spy(ProcessRegistry, "scan")
+
+        # Act
+        second = ProcessRegistry(
+            ManagerConfig(processes_dir=tmp_path)
+        ).get_process_summaries()
+
+        # Assert
+        assert second == first
+        assert scan.call_count == 0
+        assert first["alpha"]["stage_count"] == 2
+        assert first["alpha"]["valid"] is True
+        assert len(first["alpha"]["content_hash"]) == 64
+
+    def test_modified_process_is_resummarized(self, tmp_path):
+        """Verify a content change refreshes only that summary."""
+        # Arrange
+        path = _write(tmp_path, "alpha")
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        before = registry.get_process_info("alpha", include_summary=True)
+
+        # Act
+        path.write_text(PROCESS_YAML.format(name="renamed_alpha"))
+        after = registry.get_process_info("alpha", include_summary=True)
+
+        # Assert
+        assert before["name"] == "alpha"
+        assert after["name"] == "renamed_alpha"
+        assert after["content_hash"] != before["content_hash"]
+
+    def test_touched_process_is_not_reloaded(self, tmp_path, mocker):
+        """Verify an mtime change with identical content reuses the summary."""
+        # Arrange
+        path = _write(tmp_path, "alpha")
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        registry.get_process_summaries()
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        scan = mocker.spy(ProcessRegistry, "scan")
+
+        # Act
+        summaries = registry.get_process_summaries()
+
+        # Assert
+        assert scan.call_count == 0
+        assert summaries["alpha"]["valid"] is True
+
+    def test_broken_process_summary_reports_error(self, tmp_path):
+        """Verify load failures are recorded instead of raised."""
+        # Arrange
+        (tmp_path / "broken.yaml").write_text("process: [unclosed")
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+
+        # Act
+        info = registry.list_process_info(include_summary=True)
+
+        # Assert
+        assert info[0]["valid"] is False
+        assert info[0]["error"].startswith("Failed to load")
+
+    def test_include_change_refreshes_summary(self, tmp_path):
+        """Verify editing an included stage file refreshes the cached summary."""
+        # Arrange
+        (tmp_path / "stages").mkdir()
+        include = tmp_path / "stages" / "start.yaml"
+        include.write_text(START_STAGE_YAML)
+        (tmp_path / "alpha.yaml").write_text(INCLUDING_PROCESS_YAML.format(name="alpha"))
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        before = registry.get_process_summaries()
+
+        # Act
+        include.write_text(START_STAGE_YAML + CONFLICTING_LOCKS_YAML)
+        stat = include.stat()
+        os.utime(include, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        after = ProcessRegistry(
+            ManagerConfig(processes_dir=tmp_path)
+        ).get_process_summaries()
+
+        # Assert
+        assert before["alpha"]["valid"] is True
+        assert after["alpha"]["valid"] is False
+        assert after["alpha"]["issue_count"] > 0
+
+    def test_touched_include_is_not_reloaded(self, tmp_path, mocker):
+        """Verify an include mtime change with identical content reuses the summary."""
+        # Arrange
+        (tmp_path / "stages").mkdir()
+        include = tmp_path / "stages" / "start.yaml"
+        include.write_text(START_STAGE_YAML)
+        (tmp_path / "alpha.yaml").write_text(INCLUDING_PROCESS_YAML.format(name="alpha"))
+        registry = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        registry.get_process_summaries()
+        stat = include.stat()
+        os.utime(include, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        scan = mocker.spy(ProcessRegistry, "scan")
+
+        # Act
+        summaries = registry.get_process_summaries()
+
+        # Assert
+        assert scan.call_count == 0
+        assert summaries["alpha"]["valid"] is True
+
+
+class TestSharedRegistryIndex:
+    """Test the per-directory index shared by registries and @name loads."""
+
+    def test_registries_share_one_index(self, tmp_path, trusted_mtimes):
+        """Verify registries on the same directory reuse the same index."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        first = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+        second = ProcessRegistry(ManagerConfig(processes_dir=tmp_path))
+
+        # Act
+        first.list_processes()
+        second.list_processes()
+
+        # Assert
+        assert first.index is second.index
+        assert first.index is get_shared_registry_index(tmp_path)
+        assert first.index.scans == 1
+
+    def test_registry_references_do_not_write_index(self, tmp_path, monkeypatch):
+        """Verify @name loads leave the processes directory untouched."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        monkeypatch.setenv("STAGEFLOW_PROCESSES_DIR", str(tmp_path))
+
+        # Act
+        result = ProcessLoader().load("@alpha")
+
+        # Assert
+        assert result.success
+        assert not (tmp_path / INDEX_FILE_NAME).exists()
+
+    def test_registry_references_write_index_when_enabled(
+        self, tmp_path, monkeypatch
+    ):
+        """Verify STAGEFLOW_PERSIST_INDEX lets @name loads store the index."""
+        # Arrange
+        _write(tmp_path, "alpha")
+        monkeypatch.setenv("STAGEFLOW_PROCESSES_DIR", str(tmp_path))
+        monkeypatch.setenv("STAGEFLOW_PERSIST_INDEX", "true")
+
+        # Act
+        result = ProcessLoader().load("@alpha")
+
+        # Assert
+        assert result.success
+        assert (tmp_path / INDEX_FILE_NAME).exists()
@@ -0,0 +1,242 @@
+"""Unit tests for the in-memory registry process cache."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from stageflow.loader import ProcessLoader
+from stageflow.manager import ManagerConfig, ProcessCache, ProcessRegistry
+from stageflow.manager import process_cache as process_cache_module
+
+PROCESS_YAML = """\
+process:
+  name: {name}
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      gates:
+        done:
+          target_stage: end
+          locks:
+            - exists: email
+    end:
+      fields: []
+"""
+
+
+@pytest.fixture
+def process_file(tmp_path: Path) -> Path:
+    path = tmp_path / "flow.yaml"
+    path.write_text(PROCESS_YAML.format(name="flow"))
+    return path
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> ProcessRegistry:
+    return ProcessRegistry(
+        ManagerConfig(processes_dir=tmp_path), process_cache=ProcessCache(max_size=4)
+    )
+
+
+class TestProcessCache:
+    """Test hits, stat-based invalidation and stats."""
+
+    def test_unchanged_file_is_served_from_memory(self, registry, process_file):
+        """Verify repeated loads are served from the cache."""
+        # Arrange
+        first = registry.load_process("flow")
+
+        # Act
+        second = registry.load_process("flow")
+
+        # Assert
+        assert second.name == first.name
+        stats = registry.process_cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_callers_get_private_copies(self, registry, process_file):
+        """Verify mutating a cached process does not leak to other callers."""
+        # Arrange
+        first = registry.load_process("flow")
+
+        # Act
+        first.add_stage("extra", {"name": "Extra", "fields": []})
+        first.analysis_mode = "off"
+        second = registry.load_process("flow")
+
+        # Assert
+        assert second is not first
+        assert "extra" not in second.stage_ids
+        assert second.analysis_mode != first.analysis_mode
+
+    def test_name_lookup_skips_the_index(self, registry, process_file, mocker):
+        """Verify an unchanged name is answered without resolving it again."""
+        # Arrange
+        registry.load_process("flow")
+        # Storing the index changed the directory; the name is resolved again
+        registry.load_process("flow")
+        resolve = mocker.spy(ProcessRegistry, "get_process_file_path")
+
+        # Act
+        process = registry.load_process("flow")
+
+        # Assert
+        assert process.name == "flow"
+        assert resolve.call_count == 0
+
+    def test_name_lookup_notices_new_files(self, registry, tmp_path):
+        """Verify a name is resolved again when the directory changes."""
+        # Arrange
+        (tmp_path / "flow.json").write_text(
+            '{"process": {"name": "from_json", "initial_stage": "start", '
+            '"final_stage": "end", "stages": {"start": {"gates": {"done": '
+            '{"target_stage": "end", "locks": [{"exists": "email"}]}}}, '
+            '"end": {"fields": []}}}}'
+        )
+        registry.load_process("flow")
+        old_ns = os.stat(tmp_path).st_mtime_ns - 10 * 10**9
+        os.utime(tmp_path, ns=(old_ns, old_ns))
+        registry.load_process("flow")
+
+        # Act
+        (tmp_path / "flow.yaml").write_text(PROCESS_YAML.format(name="from_yaml"))
+        process = registry.load_process("flow")
+
+        # Assert
+        assert process.name == "from_yaml"
+
+    def test_modified_file_is_reloaded(self, registry, process_file):
+        """Verify an mtime/size change invalidates the entry."""
+        # Arrange
+        first = registry.load_process("flow")
+        process_file.write_text(PROCESS_YAML.format(name="flow_renamed"))
+
+        # Act
+        second = registry.load_process("flow")
+
+        # Assert
+        assert second is not first
+        assert second.name == "flow_renamed"
+        assert registry.process_cache.stats.expirations == 1
+
+    def test_replaced_file_is_reloaded(self, registry, process_file, tmp_path):
+        """Verify an atomic replace with identical mtime and size is detected by inode."""
+        # Arrange
+        first = registry.load_process("flow")
+        replacement = tmp_path / "flow.tmp"
+        replacement.write_text(PROCESS_YAML.format(name="flox"))
+        st = process_file.stat()
+        os.utime(replacement, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(replacement, process_file)
+
+        # Act
+        second = registry.load_process("flow")
+
+        # Assert
+        assert second is not first
+        assert second.name == "flox"
+
+    def test_uncached_load_returns_private_copy(self, registry, process_file):
+        """Verify use_cache=False bypasses and does not populate the cache."""
+        # Arrange
+        cached = registry.load_process("flow")
+
+        # Act
+        private = registry.load_process("flow", use_cache=False)
+
+        # Assert
+        assert private is not cached
+        assert len(registry.process_cache) == 1
+
+    def test_save_and_invalidate_drop_entries(self, registry, process_file):
+        """Verify explicit invalidation and registry writes evict entries."""
+        # Arrange
+        cache = registry.process_cache
+        process = registry.load_process("flow")
+
+        # Act & Assert
+        assert cache.invalidate(process_file) is True
+        registry.load_process("flow")
+        registry.save_process("flow", process)
+        assert len(cache) == 0
+        registry.load_process("flow")
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, tmp_path):
+        """Verify the cache is bounded."""
+        # Arrange
+        for i in range(3):
+            (tmp_path / f"p{i}.yaml").write_text(PROCESS_YAML.format(name=f"p{i}"))
+        registry = ProcessRegistry(
+            ManagerConfig(processes_dir=tmp_path),
+            process_cache=ProcessCache(max_size=2),
+        )
+
+        # Act
+        for i in range(3):
+            registry.load_process(f"p{i}")
+
+        # Assert
+        stats = registry.process_cache.stats
+        assert stats.size == 2
+        assert stats.evictions == 1
+
+    def test_concurrent_loads_share_cache(self, registry, process_file):
+        """Verify concurrent lookups are safe and served from one entry."""
+        # Arrange
+        registry.load_process("flow")
+        results = []
+
+        def worker():
+            for _ in range(50):
+                results.append(registry.load_process("flow"))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(results) == 200
+        assert {process.name for process in results} == {"flow"}
+        assert registry.process_cache.stats.hits == 200
+
+
+class TestSharedProcessCache:
+    """Test the cache shared by @name loads."""
+
+    def test_registry_references_share_cache(self, tmp_path, monkeypatch, mocker):
+        """Verify ProcessLoader serves repeated @name sources from the cache."""
+        # Arrange
+        (tmp_path / "flow.yaml").write_text(PROCESS_YAML.format(name="flow"))
+        monkeypatch.setenv("STAGEFLOW_PROCESSES_DIR", str(tmp_path))
+        monkeypatch.setattr(process_cache_module, "_shared_cache", None)
+        loader = ProcessLoader()
+        first = loader.load("@flow")
+        registry_load = mocker.spy(ProcessRegistry, "load_process")
+
+        # Act
+        second = loader.load("@flow")
+
+        # Assert
+        assert first.success and second.success
+        assert second.process is not first.process
+        assert registry_load.call_count == 0
+        stats = process_cache_module.get_shared_process_cache().stats
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_cache_size_zero_disables_sharing(self, monkeypatch):
+        """Verify STAGEFLOW_PROCESS_CACHE_SIZE=0 disables the shared cache."""
+        # Arrange
+        monkeypatch.setenv("STAGEFLOW_PROCESS_CACHE_SIZE", "0")
+        monkeypatch.setattr(process_cache_module, "_shared_cache", None)
+
+        # Act & Assert
+        assert process_cache_module.get_shared_process_cache() is None
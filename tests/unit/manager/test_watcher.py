@@ -0,0 +1,201 @@
+"""Unit tests for registry hot reload."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from stageflow.loader import ProcessLoader
+from stageflow.manager import (
+    ManagerConfig,
+    ProcessManager,
+    ProcessWatcher,
+    ReloadEventType,
+)
+
+PROCESS_YAML = """\
+process:
+  name: {name}
+  initial_stage: start
+  final_stage: end
+  stages:
+    start:
+      $include: stages/start.yaml
+    end:
+      fields: []
+"""
+
+START_STAGE_YAML = """\
+name: {name}
+gates:
+  done:
+    target_stage: end
+    locks:
+      - exists: email
+"""
+
+
+def _bump_mtime(path: Path) -> None:
+    """Make sure a rewrite is visible even on coarse-mtime filesystems."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+@pytest.fixture
+def registry_dir(tmp_path: Path) -> Path:
+    (tmp_path / "stages").mkdir()
+    (tmp_path / "stages" / "start.yaml").write_text(START_STAGE_YAML.format(name="Start"))
+    (tmp_path / "flow.yaml").write_text(PROCESS_YAML.format(name="flow"))
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(registry_dir: Path) -> ProcessWatcher:
+    watcher = ProcessWatcher(registry_dir, loader=ProcessLoader(cache=None))
+    watcher.poll()
+    return watcher
+
+
+class TestProcessWatcher:
+    """Test change detection, atomic swaps and failure handling."""
+
+    def test_initial_poll_loads_processes(self, watcher):
+        """Verify the first poll serves every registry process."""
+        # Arrange & Act
+        process = watcher.get("flow")
+
+        # Assert
+        assert process is not None
+        assert process.get_stage("start").name == "Start"
+        assert watcher.poll() == []
+
+    def test_modified_file_is_swapped_in(self, watcher, registry_dir):
+        """Verify an edited process replaces the served version."""
+        # Arrange
+        old_snapshot = watcher.processes
+        path = registry_dir / "flow.yaml"
+        path.write_text(PROCESS_YAML.format(name="flow_v2"))
+        _bump_mtime(path)
+
+        # Act
+        events = watcher.poll()
+
+        # Assert
+        assert [(e.name, e.event_type) for e in events] == [
+            ("flow", ReloadEventType.MODIFIED)
+        ]
+        assert watcher.get("flow").name == "flow_v2"
+        assert old_snapshot["flow"].name == "flow"
+
+    def test_include_change_reloads_dependent_process(self, watcher, registry_dir):
+        """Verify editing an included stage file reloads the process."""
+        # Arrange
+        include = registry_dir / "stages" / "start.yaml"
+        include.write_text(START_STAGE_YAML.format(name="Begin"))
+        _bump_mtime(include)
+
+        # Act
+        events = watcher.poll()
+
+        # Assert
+        assert [e.name for e in events] == ["flow"]
+        assert watcher.get("flow").get_stage("start").name == "Begin"
+
+    def test_invalid_edit_keeps_last_good_version(self, watcher, registry_dir):
+        """Verify a broken edit is rejected and the old process keeps serving."""
+        # Arrange
+        good = watcher.get("flow")
+        path = registry_dir / "flow.yaml"
+        path.write_text("process: [unclosed")
+
+        # Act
+        events = watcher.poll()
+
+        # Assert
+        assert events[0].event_type == ReloadEventType.FAILED
+        assert events[0].process is good
+        assert watcher.get("flow") is good
+        assert watcher.errors("flow")
+
+    def test_edit_with_blocking_issues_keeps_last_good_version(
+        self, watcher, registry_dir
+    ):
+        """Verify a process that loads but is inconsistent is not swapped in."""
+        # Arrange
+        good = watcher.get("flow")
+        include = registry_dir / "stages" / "start.yaml"
+        include.write_text(
+            START_STAGE_YAML.format(name="Start")
+            + "      - type: equals\n"
+            "        property_path: status\n"
+            "        expected_value: a\n"
+            "      - type: equals\n"
+            "        property_path: status\n"
+            "        expected_value: b\n"
+        )
+        _bump_mtime(include)
+
+        # Act
+        events = watcher.poll()
+
+        # Assert
+        assert [(e.name, e.event_type) for e in events] == [
+            ("flow", ReloadEventType.FAILED)
+        ]
+        assert events[0].process is good
+        assert watcher.get("flow") is good
+        assert watcher.get("flow").is_valid
+        assert watcher.errors("flow")
+        assert watcher.errors("flow")[0].context["issue_type"] == "logical_conflict"
+
+    def test_missing_include_is_watched(self, registry_dir):
+        """Verify an include that appears later reloads the process."""
+        # Arrange
+        include = registry_dir / "stages" / "start.yaml"
+        include.unlink()
+        watcher = ProcessWatcher(registry_dir, loader=ProcessLoader(cache=None))
+        watcher.poll()
+        include.write_text(START_STAGE_YAML.format(name="Start"))
+
+        # Act
+        events = watcher.poll()
+
+        # Assert
+        assert [e.name for e in events] == ["flow"]
+        assert watcher.get("flow").get_stage("start").name == "Start"
+
+    def test_added_and_deleted_processes(self, watcher, registry_dir):
+        """Verify new files are picked up and removed files are dropped."""
+        # Arrange
+        (registry_dir / "other.yaml").write_text(PROCESS_YAML.format(name="other"))
+        (registry_dir / "flow.yaml").unlink()
+
+        # Act
+        events = {e.name: e.event_type for e in watcher.poll()}
+
+        # Assert
+        assert events == {
+            "other": ReloadEventType.ADDED,
+            "flow": ReloadEventType.DELETED,
+        }
+        assert set(watcher.processes) == {"other"}
+
+    def test_background_polling_notifies_callback(self, registry_dir):
+        """Verify the background thread applies changes and reports events."""
+        # Arrange
+        events = []
+        manager = ProcessManager(ManagerConfig(processes_dir=registry_dir))
+        watcher = manager.watch(interval=0.01, on_reload=events.append)
+
+        # Act
+        with watcher:
+            (registry_dir / "other.yaml").write_text(PROCESS_YAML.format(name="other"))
+            deadline = time.monotonic() + 5
+            while watcher.get("other") is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        # Assert
+        assert not watcher.running
+        assert watcher.get("other") is not None
+        assert {e.name for e in events} == {"flow", "other"}
@@ -0,0 +1,103 @@
+"""Unit tests for compiled stage field validation."""
+
+import pytest
+
+from stageflow.elements import DictElement
+from stageflow.models import FieldValidator, PropertiesParser, PropertyValidator
+
+
+def _validator(spec) -> FieldValidator:
+    return FieldValidator(PropertiesParser.parse(spec))
+
+
+class TestFieldValidator:
+    """Test flattening and one-pass validation of stage fields."""
+
+    def test_nested_fields_are_flattened_in_order(self):
+        """Verify nested properties become full paths in declaration order."""
+        # Arrange & Act
+        validator = _validator(
+            {
+                "email": "string",
+                "profile": {"name": "string", "age": {"type": "int", "required": False}},
+            }
+        )
+
+        # Assert
+        assert validator.paths == ("email", "profile", "profile.name", "profile.age")
+        assert validator.required_paths == ("email", "profile", "profile.name")
+
+    def test_reports_missing_and_invalid(self):
+        """Verify presence and constraints are checked in the same pass."""
+        # Arrange
+        validator = _validator(
+            {
+                "email": {"type": "string", "format": "email"},
+                "age": {"type": "int", "min": 18},
+                "tags": {"type": "list", "unique": True, "required": False},
+                "name": {"type": "string", "default": "anon"},
+            }
+        )
+        element = DictElement({"email": "nope", "age": "old", "tags": ["a", "a"]})
+
+        # Act
+        result = validator.validate(element)
+
+        # Assert
+        assert not result.valid
+        assert result.missing == {"name": "anon"}
+        assert result.invalid == {
+            "email": ["Invalid email"],
+            "age": ["Expected int, got str"],
+            "tags": ["Items must be unique"],
+        }
+
+    @pytest.mark.parametrize(
+        "spec, value",
+        [
+            ({"type": "string", "pattern": "^[A-Z]{3}$"}, "ABC"),
+            ({"type": "string", "enum": ["a", "b"]}, "b"),
+            ({"type": "float", "min": 0, "max": 1}, 1),
+            ({"type": "list", "min_items": 1, "max_items": 2}, [1, 2]),
+            ({"type": "string", "min_length": 2, "max_length": 3}, "abc"),
+        ],
+    )
+    def test_matches_property_validator(self, spec, value):
+        """Verify compiled checks accept the values PropertyValidator accepts."""
+        # Arrange
+        prop = PropertiesParser.parse({"field": spec})["field"]
+        validator = FieldValidator({"field": prop})
+
+        # Act
+        result = validator.validate(DictElement({"field": value}))
+
+        # Assert
+        assert PropertyValidator.validate(prop, value) == (True, [])
+        assert result.valid
+
+    def test_shorthand_fields_only_check_presence(self):
+        """Verify fields without a declared type accept any value."""
+        # Arrange
+        validator = _validator(["order", "customer.id"])
+
+        # Act
+        result = validator.validate(DictElement({"order": {"id": 1}, "customer": {"id": 7}}))
+
+        # Assert
+        assert result.valid
+
+    def test_null_and_absent_optional_values_are_skipped(self):
+        """Verify constraints only apply to present, non-null values."""
+        # Arrange
+        validator = _validator(
+            {
+                "note": {"type": "string", "min_length": 5},
+                "score": {"type": "int", "required": False, "max": 10},
+            }
+        )
+
+        # Act
+        result = validator.validate(DictElement({"note": None}))
+
+        # Assert
+        assert result.valid
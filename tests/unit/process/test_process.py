@@ -20,7 +20,7 @@ from stageflow.models import (
     ProcessDefinition,
     ProcessIssueTypes,
 )
-from stageflow.process import PathSearch, Process
+from stageflow.process import PathSearch, Process, RouteTable
 from stageflow.stage import StageDefinition, StageStatus
 
 
@@ -105,6 +105,79 @@ class TestPathSearch:
         # Should contain at least one path through the graph
 
 
+class TestRouteTable:
+    """Test shortest-route lookups over the transition graph."""
+
+    TRANSITIONS = [
+        ("start", "a"),
+        ("start", "b"),
+        ("a", "middle"),
+        ("b", "c"),
+        ("c", "middle"),
+        ("middle", "end"),
+        ("end", "start"),
+    ]
+
+    def test_route_is_shortest_and_ordered(self):
+        """Verify routes follow the fewest transitions, in walking order."""
+        # Arrange
+        table = RouteTable(self.TRANSITIONS)
+
+        # Act
+        route = table.route("start", "end")
+
+        # Assert
+        assert route == ["start", "a", "middle", "end"]
+
+    def test_backward_route(self):
+        """Verify backward routes follow transitions in reverse."""
+        # Arrange
+        table = RouteTable(self.TRANSITIONS)
+
+        # Act
+        route = table.route("c", "start", forward=False)
+
+        # Assert
+        assert route == ["c", "b", "start"]
+
+    def test_unreachable_target(self):
+        """Verify None is returned when the target can't be reached."""
+        # Arrange
+        table = RouteTable([("a", "b"), ("c", "d")])
+
+        # Act & Assert
+        assert table.route("a", "d") is None
+        assert table.route("a", "a") == ["a"]
+
+    def test_next_hops_are_built_once_per_target(self):
+        """Verify a target's next-hop table is reused across queries."""
+        # Arrange
+        table = RouteTable(self.TRANSITIONS)
+
+        # Act
+        first = table.next_hops("end")
+        table.route("b", "end")
+
+        # Assert
+        assert table.next_hops("end") is first
+        assert first["b"] == "c"
+
+    def test_process_table_follows_version(self, simple_two_stage_process):
+        """Verify the process rebuilds its route table after a mutation."""
+        # Arrange
+        process = Process(simple_two_stage_process)
+        table = process.route_table
+
+        # Act
+        unchanged = process.route_table
+        process.add_transition("end", "start")
+
+        # Assert
+        assert unchanged is table
+        assert process.route_table is not table
+        assert process._find_route("end", "start") == ["end", "start"]
+
+
 class TestConsistencyIssue:
     """Test ConsistencyIssue dataclass."""
 
@@ -0,0 +1,147 @@
+"""Unit tests for Process analysis modes and cached validity."""
+
+import pytest
+
+from stageflow.elements import DictElement
+from stageflow.models import AnalysisMode, ProcessIssueTypes
+from stageflow.process import Process
+
+
+@pytest.fixture
+def process_definition() -> dict:
+    return {
+        "name": "signup",
+        "initial_stage": "start",
+        "final_stage": "end",
+        "stages": {
+            "start": {
+                "fields": ["email"],
+                "gates": {
+                    "to_end": {
+                        "target_stage": "end",
+                        "locks": [{"exists": "email"}],
+                    }
+                },
+            },
+            "end": {"fields": []},
+        },
+    }
+
+
+ORPHAN_STAGE = {
+    "fields": [],
+    "gates": {"back": {"target_stage": "nowhere", "locks": [{"exists": "x"}]}},
+}
+
+
+def _issue_types(process: Process) -> set[ProcessIssueTypes]:
+    return {issue.issue_type for issue in process.issues}
+
+
+class TestAnalysisModes:
+    """Test eager, lazy and disabled analysis."""
+
+    def test_default_mode_is_eager(self, process_definition, mocker):
+        """Verify construction and mutations analyze immediately by default."""
+        # Arrange
+        spy = mocker.spy(Process, "_run_analysis")
+
+        # Act
+        process = Process(process_definition)
+        process.add_stage("orphan", dict(ORPHAN_STAGE))
+
+        # Assert
+        assert process.analysis_mode == AnalysisMode.EAGER
+        assert spy.call_count == 2
+        assert process.issues_current
+
+    def test_lazy_mode_analyzes_once_on_read(self, process_definition, mocker):
+        """Verify lazy mode collapses several mutations into one analysis."""
+        # Arrange
+        spy = mocker.spy(Process, "_run_analysis")
+        process = Process(process_definition, analysis="lazy")
+
+        # Act
+        process.add_stage("orphan", dict(ORPHAN_STAGE))
+        process.add_stage("other", dict(ORPHAN_STAGE))
+        assert spy.call_count == 0
+        valid = process.is_valid
+        assert process.is_valid == valid
+
+        # Assert
+        assert spy.call_count == 1
+        assert not valid
+        assert ProcessIssueTypes.UNREACHABLE_STAGE in _issue_types(process)
+
+    def test_off_mode_never_analyzes(self, process_definition, mocker):
+        """Verify analysis only runs on an explicit reanalyze() when off."""
+        # Arrange
+        spy = mocker.spy(Process, "_run_analysis")
+        process = Process(process_definition, analysis=AnalysisMode.OFF)
+
+        # Act
+        process.add_stage("orphan", dict(ORPHAN_STAGE))
+
+        # Assert
+        assert process.is_valid
+        assert process.issues == []
+        assert not process.issues_current
+        assert spy.call_count == 0
+        process.reanalyze()
+        assert not process.is_valid
+
+    def test_invalid_mode_is_rejected(self, process_definition):
+        """Verify unknown analysis modes raise ValueError."""
+        # Arrange & Act & Assert
+        with pytest.raises(ValueError, match="Invalid analysis mode"):
+            Process(process_definition, analysis="sometimes")
+
+
+class TestCachedValidity:
+    """Test the version-stamped validity flag."""
+
+    def test_evaluate_does_not_rescan_issues(self, process_definition, mocker):
+        """Verify repeated evaluations reuse the cached validity flag."""
+        # Arrange
+        process = Process(process_definition)
+        element = DictElement({"email": "a@example.com"})
+        spy = mocker.spy(process, "_store_issues")
+
+        # Act
+        for _ in range(5):
+            process.evaluate(element)
+
+        # Assert
+        spy.assert_not_called()
+
+    def test_validity_tracks_mutations(self, process_definition):
+        """Verify the flag is recomputed after the process changes."""
+        # Arrange
+        process = Process(process_definition, analysis="lazy")
+        assert process.is_valid
+
+        # Act
+        process.add_stage("orphan", dict(ORPHAN_STAGE))
+
+        # Assert
+        assert not process.issues_current
+        assert not process.is_valid
+        process.remove_stage("orphan")
+        assert process.is_valid
+
+    def test_deferred_analysis_runs_single_pass(self, process_definition, mocker):
+        """Verify bulk edits in deferred_analysis() are analyzed once at the end."""
+        # Arrange
+        process = Process(process_definition)
+        spy = mocker.spy(Process, "_run_analysis")
+
+        # Act
+        with process.deferred_analysis():
+            for i in range(5):
+                process.add_stage(f"extra_{i}", dict(ORPHAN_STAGE))
+
+        # Assert
+        assert spy.call_count == 1
+        assert process.analysis_mode == AnalysisMode.EAGER
+        assert process.issues_current
+        assert not process.is_valid
@@ -0,0 +1,132 @@
+"""Unit tests for lazy stage materialization on Process."""
+
+import pytest
+
+from stageflow.elements import DictElement
+from stageflow.process import Process
+from stageflow.stage import Stage, StageStatus
+
+
+def _chain_definition(length: int) -> dict:
+    """A linear process s0 -> s1 -> ... -> s{length-1}."""
+    stages: dict = {}
+    for i in range(length - 1):
+        stages[f"s{i}"] = {
+            "fields": [f"field_{i}"],
+            "gates": {
+                "next": {
+                    "target_stage": f"s{i + 1}",
+                    "locks": [{"exists": f"field_{i}"}],
+                }
+            },
+        }
+    stages[f"s{length - 1}"] = {"fields": []}
+    return {
+        "name": "chain",
+        "initial_stage": "s0",
+        "final_stage": f"s{length - 1}",
+        "stages": stages,
+    }
+
+
+@pytest.fixture
+def definition() -> dict:
+    return _chain_definition(50)
+
+
+class TestLazyProcess:
+    """Test on-demand stage construction and deferred analysis."""
+
+    def test_construction_builds_only_endpoints(self, definition, mocker):
+        """Verify a lazy process builds only its initial and final stages."""
+        # Arrange
+        analysis = mocker.spy(Process, "_run_analysis")
+
+        # Act
+        process = Process(definition, lazy=True)
+
+        # Assert
+        assert process.lazy
+        assert sorted(process.materialized_stages) == ["s0", "s49"]
+        assert process.stage_ids == [f"s{i}" for i in range(50)]
+        analysis.assert_not_called()
+
+    def test_get_stage_materializes_on_demand(self, definition):
+        """Verify stages are built once, on first access."""
+        # Arrange
+        process = Process(definition, lazy=True)
+
+        # Act
+        first = process.get_stage("s10")
+        second = process.get_stage("s10")
+
+        # Assert
+        assert first is second
+        assert "s10" in process.materialized_stages
+        assert "s11" not in process.materialized_stages
+        assert process.get_stage("missing") is None
+
+    def test_issues_trigger_deferred_analysis(self, definition):
+        """Verify analysis runs on first issues read without keeping every stage."""
+        # Arrange
+        process = Process(definition, lazy=True)
+        eager = Process(_chain_definition(50))
+
+        # Act
+        issues = process.issues
+
+        # Assert
+        assert issues == eager.issues
+        assert process.is_valid == eager.is_valid
+        assert len(process.materialized_stages) == 2
+
+    def test_deferred_analysis_builds_no_stages(self, definition, mocker):
+        """Verify analysis on first evaluate reads definitions, not Stage objects."""
+        # Arrange
+        process = Process(definition, lazy=True)
+        stage_init = mocker.spy(Stage, "__init__")
+
+        # Act
+        process.evaluate(DictElement({"field_0": True}), "s0")
+
+        # Assert
+        assert stage_init.call_count == 0
+        assert process.is_valid
+        assert sorted(process.materialized_stages) == ["s0", "s49"]
+
+    def test_evaluation_touches_regression_path_only(self, definition):
+        """Verify evaluating builds the current stage and its previous stages."""
+        # Arrange
+        process = Process(definition, lazy=True, issues=[])
+        element = DictElement({f"field_{i}": True for i in range(6)})
+
+        # Act
+        result = process.evaluate(element, "s5")
+
+        # Assert
+        assert result["stage_result"].status == StageStatus.READY
+        assert sorted(process.materialized_stages) == sorted(
+            ["s0", "s1", "s2", "s3", "s4", "s5", "s49"]
+        )
+
+    def test_matches_eager_process(self, definition):
+        """Verify a lazy process serializes and routes like an eager one."""
+        # Arrange
+        lazy = Process(_chain_definition(50), lazy=True)
+        eager = Process(definition)
+
+        # Act & Assert
+        assert lazy.to_graph() == eager.to_graph()
+        assert lazy.has_path("s3", "s40")
+        assert lazy.to_dict() == eager.to_dict()
+        assert [s._id for s in lazy.stages] == [s._id for s in eager.stages]
+
+    def test_invalid_stage_fails_on_first_use(self, definition):
+        """Verify errors in a stage definition surface when the stage is built."""
+        # Arrange
+        definition["stages"]["s20"]["gates"]["next"]["locks"] = [{"bogus": 1}]
+        process = Process(definition, lazy=True)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Invalid lock definition"):
+            process.get_stage("s20")
@@ -0,0 +1,167 @@
+"""Unit tests for Process.locate and Process.evaluate_all_stages."""
+
+import pytest
+
+from stageflow.elements import CachedElement, DictElement
+from stageflow.process import Process
+from stageflow.stage import StageStatus
+
+
+@pytest.fixture
+def process() -> Process:
+    return Process({
+        "name": "onboarding",
+        "initial_stage": "profile",
+        "final_stage": "done",
+        "stages": {
+            "profile": {
+                "name": "Profile",
+                "fields": ["user.email"],
+                "gates": {
+                    "to_review": {
+                        "target_stage": "review",
+                        "locks": [{"exists": "user.email"}],
+                    }
+                },
+            },
+            "review": {
+                "name": "Review",
+                "fields": ["user.email"],
+                "gates": {
+                    "approve": {
+                        "target_stage": "done",
+                        "locks": [
+                            {"exists": "user.email"},
+                            {"is_true": "review.approved"},
+                        ],
+                    }
+                },
+            },
+            "done": {"name": "Done", "fields": []},
+        },
+    })
+
+
+class TestEvaluateAllStages:
+    """Test evaluating one element against every stage."""
+
+    def test_returns_result_per_stage(self, process):
+        """Verify each stage gets the same result as evaluating it directly."""
+        # Arrange
+        element = DictElement({"user": {"email": "a@b.c"}})
+
+        # Act
+        results = process.evaluate_all_stages(element)
+
+        # Assert
+        assert list(results) == ["profile", "review", "done"]
+        for stage in process.stages:
+            assert results[stage._id].status == stage.evaluate(element).status
+
+    def test_shared_lock_is_validated_once(self, process, mocker):
+        """Verify a lock interned across stages is validated once per element."""
+        # Arrange
+        profile_lock = process.get_stage("profile").gates[0].locks[0]
+        review_lock = process.get_stage("review").gates[0].locks[0]
+        spy = mocker.spy(profile_lock, "validate")
+
+        # Act
+        process.evaluate_all_stages(DictElement({"user": {"email": "a@b.c"}}))
+
+        # Assert
+        assert profile_lock is review_lock
+        assert spy.call_count == 1
+
+    def test_rejects_invalid_process(self, process, mocker):
+        """Verify an inconsistent process cannot evaluate elements."""
+        # Arrange
+        mocker.patch.object(Process, "is_valid", new=False)
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            process.evaluate_all_stages(DictElement({}))
+
+
+class TestLocate:
+    """Test locating the furthest stage an element reaches."""
+
+    @pytest.mark.parametrize(
+        ("data", "stage", "path"),
+        [
+            ({}, "profile", ["profile"]),
+            ({"user": {"email": "a@b.c"}}, "review", ["profile", "review"]),
+            (
+                {"user": {"email": "a@b.c"}, "review": {"approved": True}},
+                "done",
+                ["profile", "review", "done"],
+            ),
+        ],
+    )
+    def test_walks_passing_gates(self, process, data, stage, path):
+        """Verify the walk follows passing gates until a stage is not READY."""
+        # Arrange & Act
+        location = process.locate(DictElement(data))
+
+        # Assert
+        assert location["stage"] == stage
+        assert location["path"] == path
+        assert list(location["statuses"]) == path
+
+    def test_status_map(self, process):
+        """Verify statuses hold the status value of each walked stage."""
+        # Arrange & Act
+        location = process.locate(DictElement({"user": {"email": "a@b.c"}}))
+
+        # Assert
+        assert location["statuses"] == {
+            "profile": StageStatus.READY.value,
+            "review": StageStatus.BLOCKED.value,
+        }
+
+    def test_all_stages_reports_every_stage(self, process):
+        """Verify all_stages adds the statuses of stages off the walked path."""
+        # Arrange & Act
+        location = process.locate(DictElement({}), all_stages=True)
+
+        # Assert
+        assert location["stage"] == "profile"
+        assert location["statuses"] == {
+            "profile": StageStatus.INCOMPLETE.value,
+            "review": StageStatus.INCOMPLETE.value,
+            "done": process.get_stage("done").evaluate(DictElement({})).status.value,
+        }
+
+
+class TestCachedElement:
+    """Test the per-pass element value cache."""
+
+    def test_reads_each_path_once(self, mocker):
+        """Verify property reads and presence checks hit the element once."""
+        # Arrange
+        element = DictElement({"user": {"email": "a@b.c"}})
+        has_spy = mocker.spy(element, "has_property")
+        get_spy = mocker.spy(element, "get_property")
+        cached = CachedElement(element)
+
+        # Act
+        values = [cached.get_property("user.email") for _ in range(3)]
+        present = [cached.has_property("user.email") for _ in range(3)]
+
+        # Assert
+        assert values == ["a@b.c"] * 3
+        assert present == [True] * 3
+        assert get_spy.call_count == 1
+        assert has_spy.call_count == 1
+
+    def test_memoize(self):
+        """Verify memoize computes a value on first use only."""
+        # Arrange
+        cached = CachedElement(DictElement({}))
+        compute = iter([1, 2])
+
+        # Act
+        first = cached.memoize("key", lambda: next(compute))
+        second = cached.memoize("key", lambda: next(compute))
+
+        # Assert
+        assert first == second == 1
@@ -0,0 +1,179 @@
+"""Unit tests for the path dependency index and incremental re-evaluation."""
+
+import pytest
+
+from stageflow.dependencies import DependencyIndex, path_tokens, paths_overlap
+from stageflow.elements import DictElement
+from stageflow.gate import Gate
+from stageflow.process import Process
+from stageflow.stage import StageStatus
+
+
+@pytest.fixture
+def process_definition() -> dict:
+    return {
+        "name": "onboarding",
+        "initial_stage": "profile",
+        "final_stage": "done",
+        "regression_policy": "warn",
+        "stages": {
+            "profile": {
+                "name": "Profile",
+                "fields": ["user.email"],
+                "gates": {
+                    "to_review": {
+                        "target_stage": "review",
+                        "locks": [
+                            {"exists": "user.email"},
+                            {"exists": "user.name"},
+                        ],
+                    }
+                },
+            },
+            "review": {
+                "name": "Review",
+                "fields": [],
+                "gates": {
+                    "approve": {
+                        "target_stage": "done",
+                        "locks": [{"is_true": "review.approved"}],
+                    }
+                },
+            },
+            "done": {"name": "Done", "fields": []},
+        },
+    }
+
+
+class TestPathTokens:
+    """Test path normalization used for dependency matching."""
+
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("user.profile.email", ("user", "profile", "email")),
+            ("items[0].price", ("items", "0", "price")),
+            ("length(items)", ("items",)),
+            ("items.length", ("items",)),
+            ("items[?id=='a'].done", ("items",)),
+        ],
+    )
+    def test_path_tokens(self, path, expected):
+        """Verify paths normalize to comparable segments."""
+        # Arrange & Act & Assert
+        assert path_tokens(path) == expected
+
+    def test_parent_and_child_paths_overlap(self):
+        """Verify prefix relations in either direction count as overlap."""
+        # Arrange & Act & Assert
+        assert paths_overlap("user", "user.email")
+        assert paths_overlap("user.email", "user")
+        assert not paths_overlap("user.email", "user.name")
+
+
+class TestDependencyIndex:
+    """Test the path → dependents index."""
+
+    def test_index_maps_paths_to_fields_locks_gates_and_stages(
+        self, process_definition
+    ):
+        """Verify lock and field dependents are recorded per path."""
+        # Arrange
+        process = Process(process_definition)
+
+        # Act
+        dependents = process.dependency_index.dependents("user.name")
+
+        # Assert
+        assert dependents.locks == {("profile", "to_review", 1)}
+        assert dependents.gates == {("profile", "to_review")}
+        assert dependents.stages == {"profile"}
+        assert dependents.field_stages == frozenset()
+
+    def test_changed_parent_path_affects_nested_reads(self, process_definition):
+        """Verify a changed parent object affects every path beneath it."""
+        # Arrange
+        index = DependencyIndex(Process(process_definition).stages)
+
+        # Act
+        affected = index.affected(["user"])
+
+        # Assert
+        assert affected.field_stages == {"profile"}
+        assert affected.stale_locks("profile", "to_review") == {0, 1}
+        assert "review" not in affected.stages
+
+    def test_unrelated_change_affects_nothing(self, process_definition):
+        """Verify paths nobody reads produce an empty dependency set."""
+        # Arrange
+        index = DependencyIndex(Process(process_definition).stages)
+
+        # Act & Assert
+        assert not index.affected(["notes"])
+
+
+class TestProcessReevaluate:
+    """Test Process.reevaluate against full evaluation."""
+
+    def test_unrelated_change_reuses_previous_result(self, process_definition, mocker):
+        """Verify changes outside indexed paths do not re-run any locks."""
+        # Arrange
+        process = Process(process_definition)
+        element = DictElement({"user": {"email": "a@x.io"}})
+        previous = process.evaluate(element, "profile")
+        updated = DictElement({"user": {"email": "a@x.io"}, "notes": "hi"})
+        spy = mocker.spy(Gate, "evaluate")
+
+        # Act
+        result = process.reevaluate(previous, updated, ["notes"])
+
+        # Assert
+        assert spy.call_count == 0
+        assert result == previous
+
+    def test_only_affected_locks_are_revalidated(self, process_definition, mocker):
+        """Verify unaffected lock results are reused inside an affected gate."""
+        # Arrange
+        process = Process(process_definition)
+        previous = process.evaluate(DictElement({"user": {"email": "a@x.io"}}))
+        updated = DictElement({"user": {"email": "a@x.io", "name": "Ann"}})
+        lock = process.get_stage("profile").gates[0].locks[0]
+        spy = mocker.spy(type(lock), "validate")
+
+        # Act
+        result = process.reevaluate(previous, updated, ["user.name"])
+
+        # Assert
+        assert spy.call_count == 1
+        assert result["stage_result"].status == StageStatus.READY
+        assert result == process.evaluate(updated)
+
+    def test_regression_checks_reuse_unaffected_stages(self, process_definition):
+        """Verify re-evaluation matches full evaluation including regression."""
+        # Arrange
+        process = Process(process_definition)
+        element = DictElement({"user": {"email": "a@x.io", "name": "Ann"}})
+        previous = process.evaluate(element, "review")
+        updated = DictElement({"user": {"email": "a@x.io"}})
+
+        # Act
+        result = process.reevaluate(previous, updated, ["user.name"], "review")
+
+        # Assert
+        assert result["regression_details"]["detected"] is True
+        assert result == process.evaluate(updated, "review")
+
+    def test_stage_change_falls_back_to_full_evaluation(self, process_definition):
+        """Verify a different resolved stage triggers a full evaluation."""
+        # Arrange
+        process_definition["stage_prop"] = "stage"
+        process = Process(process_definition)
+        previous = process.evaluate(DictElement({"stage": "profile"}))
+        updated = DictElement({"stage": "review"})
+
+        # Act
+        result = process.reevaluate(previous, updated, ["stage"])
+
+        # Assert
+        assert result["stage"] == "review"
+        assert result == process.evaluate(updated)
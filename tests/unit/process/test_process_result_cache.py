@@ -0,0 +1,122 @@
+"""Unit tests for the optional evaluation result cache on Process."""
+
+import pytest
+
+from stageflow.cache import LRUCache
+from stageflow.elements import DictElement
+from stageflow.process import Process
+from stageflow.stage import StageStatus
+
+
+@pytest.fixture
+def process_definition() -> dict:
+    return {
+        "name": "signup",
+        "initial_stage": "start",
+        "final_stage": "end",
+        "stages": {
+            "start": {
+                "name": "Start",
+                "fields": ["email"],
+                "gates": {
+                    "to_end": {
+                        "target_stage": "end",
+                        "locks": [{"exists": "verified"}],
+                    }
+                },
+            },
+            "end": {"name": "End", "fields": []},
+        },
+    }
+
+
+class TestProcessResultCache:
+    """Test caching of Process.evaluate results."""
+
+    def test_cache_is_disabled_by_default(self, process_definition):
+        """Verify processes evaluate without a cache unless enabled."""
+        # Arrange & Act
+        process = Process(process_definition)
+
+        # Assert
+        assert process.result_cache is None
+        assert process.cache_stats is None
+
+    def test_repeated_evaluation_hits_cache(self, process_definition, mocker):
+        """Verify an identical element is served from the cache."""
+        # Arrange
+        process = Process(process_definition)
+        process.enable_result_cache()
+        element = DictElement({"email": "a@example.com", "verified": True})
+        spy = mocker.spy(process, "_evaluate_in_stage")
+
+        # Act
+        first = process.evaluate(element)
+        second = process.evaluate(element)
+
+        # Assert
+        assert spy.call_count == 1
+        assert first == second
+        assert first is not second
+        assert process.cache_stats.hits == 1
+        assert process.cache_stats.misses == 1
+
+    def test_unread_fields_do_not_affect_cache_key(self, process_definition):
+        """Verify changes outside the evaluated paths still hit the cache."""
+        # Arrange
+        process = Process(process_definition)
+        process.enable_result_cache()
+
+        # Act
+        process.evaluate(DictElement({"email": "a@x.io", "note": "first"}))
+        process.evaluate(DictElement({"email": "a@x.io", "note": "second"}))
+
+        # Assert
+        assert process.cache_stats.hits == 1
+
+    def test_read_fields_change_cache_key(self, process_definition):
+        """Verify changes to evaluated paths produce fresh results."""
+        # Arrange
+        process = Process(process_definition)
+        process.enable_result_cache()
+
+        # Act
+        blocked = process.evaluate(DictElement({"email": "a@x.io"}))
+        ready = process.evaluate(DictElement({"email": "a@x.io", "verified": True}))
+
+        # Assert
+        assert blocked["stage_result"].status == StageStatus.BLOCKED
+        assert ready["stage_result"].status == StageStatus.READY
+        assert process.cache_stats.hits == 0
+
+    def test_definition_hash_changes_on_mutation(self, process_definition):
+        """Verify mutating the process invalidates cached results."""
+        # Arrange
+        process = Process(process_definition)
+        original_hash = process.definition_hash
+        original_version = process.version
+
+        # Act
+        process.add_transition("start", "end")
+
+        # Assert
+        assert process.definition_hash != original_hash
+        assert process.version == original_version + 1
+
+    def test_equal_definitions_share_a_cache(self, process_definition):
+        """Verify processes with identical definitions reuse shared entries."""
+        # Arrange
+        shared: LRUCache = LRUCache(max_size=8)
+        first = Process(process_definition)
+        second = Process(process_definition)
+        first.enable_result_cache(cache=shared)
+        second.enable_result_cache(cache=shared)
+        element = DictElement({"email": "a@x.io"})
+
+        # Act
+        first.evaluate(element)
+        second.evaluate(element)
+
+        # Assert
+        assert first.definition_hash == second.definition_hash
+        assert shared.stats.hits == 1
@@ -9,6 +9,7 @@ from stageflow.stage import (
     Stage,
     StageEvaluationResult,
     StageStatus,
+    stage_schema_mutations,
 )
 
 
@@ -1067,3 +1068,241 @@ class TestStageSchema:
         assert len(schema) == 1000
         assert "field_500" in schema
         assert schema["field_500"]["default"] == "value_500"
+
+
+class TestStageSchemaMemoization:
+    """Test memoized initial and final schemas."""
+
+    @pytest.fixture
+    def stage(self) -> Stage:
+        return Stage(
+            "review",
+            {
+                "name": "review",
+                "fields": {"email": {"type": "string"}, "age": {"type": "int"}},
+                "gates": {
+                    "approve": {
+                        "target_stage": "done",
+                        "locks": [{"exists": "approved"}],
+                    },
+                    "reject": {
+                        "target_stage": "rejected",
+                        "locks": [{"exists": "reason"}],
+                    },
+                },
+                "expected_actions": [],
+            },
+        )
+
+    def test_schemas_are_built_once(self, stage, mocker):
+        """Verify repeated schema reads reuse one build per stage."""
+        # Arrange
+        fields_spy = mocker.spy(stage, "_fields_to_property_schemas")
+        final_spy = mocker.spy(stage, "_build_final_schema")
+
+        # Act
+        for _ in range(3):
+            stage.get_initial_schema()
+            stage.get_final_schemas()
+            stage.get_final_schema("approve")
+            stage.to_schema_mutations()
+
+        # Assert
+        assert fields_spy.call_count == 1
+        assert final_spy.call_count == 2
+
+    def test_returned_schemas_are_copies(self, stage):
+        """Verify mutating a returned schema does not affect later reads."""
+        # Arrange
+        schema = stage.get_final_schema("approve")
+
+        # Act
+        schema["properties"]["email"]["type"] = "mutated"
+        schema["properties"]["extra"] = {}
+
+        # Assert
+        fresh = stage.get_final_schema("approve")
+        assert fresh["properties"]["email"]["type"] == "string"
+        assert "extra" not in fresh["properties"]
+
+    def test_reassigning_inputs_invalidates(self, stage):
+        """Verify assigning a schema input rebuilds the schemas."""
+        # Arrange
+        assert stage.get_initial_schema()["stage_name"] == "review"
+
+        # Act
+        stage.name = "Review"
+        stage.gates = stage.gates[:1]
+
+        # Assert
+        assert stage.get_initial_schema()["stage_name"] == "Review"
+        assert list(stage.get_final_schemas()) == ["approve"]
+
+    def test_concurrent_readers_share_one_build(self, stage, mocker):
+        """Verify concurrent first reads build the schemas only once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Arrange
+        spy = mocker.spy(stage, "_fields_to_property_schemas")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: stage.get_final_schemas(), range(32))
+            )
+
+        # Assert
+        assert spy.call_count == 1
+        assert all(result == results[0] for result in results)
+
+
+    def test_mutations_from_definition_match_stage(self):
+        """Verify mutations built from a definition equal the Stage's own."""
+        # Arrange
+        config: StageDefinition = {
+            "name": "Review",
+            "fields": {"email": {"type": "string"}},
+            "gates": {
+                "approve": {
+                    "target_stage": "done",
+                    "locks": [{"exists": "approved"}],
+                },
+            },
+            "expected_actions": [
+                {"description": "Approve", "target_properties": ["approved"]}
+            ],
+        }
+
+        # Act
+        mutations = stage_schema_mutations("review", config, is_transition_target=True)
+
+        # Assert
+        expected = Stage("review", config).to_schema_mutations(is_transition_target=True)
+        assert mutations == expected
+
+
+class TestStageFieldConstraints:
+    """Test typed field constraints during stage evaluation."""
+
+    @pytest.fixture
+    def stage(self) -> Stage:
+        return Stage(
+            "signup",
+            {
+                "name": "signup",
+                "fields": {
+                    "email": {"type": "string", "format": "email"},
+                    "age": {"type": "int", "min": 18},
+                },
+                "gates": {
+                    "to_done": {"target_stage": "done", "locks": [{"exists": "email"}]}
+                },
+                "expected_actions": [],
+            },
+        )
+
+    def test_invalid_field_blocks_before_gates(self, stage, mocker):
+        """Verify constraint violations block the stage without running gates."""
+        # Arrange
+        spy = mocker.spy(stage.gates[0], "evaluate")
+        element = DictElement({"email": "a@example.com", "age": 12})
+
+        # Act
+        result = stage.evaluate(element)
+
+        # Assert
+        assert result.status == StageStatus.BLOCKED
+        assert result.results == {}
+        assert result.validation_messages == ["Invalid property 'age': Too small (min: 18)"]
+        assert [action["name"] for action in result.actions] == ["fix_age"]
+        assert result.actions[0]["target_properties"] == ["age"]
+        spy.assert_not_called()
+
+    def test_missing_fields_take_precedence(self, stage):
+        """Verify missing required fields still report INCOMPLETE."""
+        # Arrange & Act
+        result = stage.evaluate(DictElement({"email": 3}))
+
+        # Assert
+        assert result.status == StageStatus.INCOMPLETE
+
+    def test_valid_fields_run_gates(self, stage):
+        """Verify valid fields let gate evaluation proceed."""
+        # Arrange & Act
+        result = stage.evaluate(DictElement({"email": "a@example.com", "age": 30}))
+
+        # Assert
+        assert result.status == StageStatus.READY
+        assert stage.field_paths == ("email", "age")
+
+
+class TestStageEvaluationPlan:
+    """Test the precomputed stage evaluation plan."""
+
+    @pytest.fixture
+    def stage(self) -> Stage:
+        return Stage(
+            "review",
+            {
+                "name": "review",
+                "fields": {"email": {"type": "string"}},
+                "gates": {
+                    "approve": {"target_stage": "done", "locks": [{"exists": "ok"}]},
+                },
+                "expected_actions": [
+                    {"name": "ping", "description": "Ping reviewer"},
+                    {"name": "ping", "description": "Ping again"},
+                ],
+            },
+        )
+
+    def test_plan_is_built_at_construction(self, stage):
+        """Verify static actions and messages are rendered once per stage."""
+        # Arrange & Act
+        plan = stage.plan
+
+        # Assert
+        assert plan is stage.plan
+        assert plan.gates == stage.gates
+        assert [a["name"] for a in plan.configured_actions] == ["ping", "ping_2"]
+        assert plan.transitions["approve"].action_id(0, "review") == (
+            "0:review:transition_to_done"
+        )
+        assert plan.ready_messages["approve"] == (
+            "Ready to transition to 'done' via gate 'approve'"
+        )
+        assert set(plan.provide_actions) == {"email"}
+
+    def test_evaluation_fills_templates(self, stage, mocker):
+        """Verify evaluation reuses the plan without rebuilding it."""
+        # Arrange
+        spy = mocker.spy(stage, "_build_plan")
+
+        # Act
+        blocked = stage.evaluate(DictElement({"email": "a@b.co"}))
+        ready = stage.evaluate(DictElement({"email": "a@b.co", "ok": True}))
+        blocked.actions[0]["description"] = "changed"
+
+        # Assert
+        spy.assert_not_called()
+        assert [a["action_id"] for a in blocked.actions] == [
+            "0:review:ping",
+            "1:review:ping",
+        ]
+        assert stage.plan.configured_actions[0]["description"] == "Ping reviewer"
+        assert ready.actions[0]["related_properties"] == ["ok"]
+        assert ready.validation_messages == [
+            "Ready to transition to 'done' via gate 'approve'"
+        ]
+
+    def test_reassigning_gates_rebuilds_plan(self, stage):
+        """Verify the plan follows changes to the stage's gates."""
+        # Arrange
+        old_plan = stage.plan
+
+        # Act
+        stage.gates = ()
+
+        # Assert
+        assert stage.plan is not old_plan
+        assert stage.plan.transitions == {}
@@ -0,0 +1,106 @@
+"""Unit tests for the LRU/TTL cache used by StageFlow."""
+
+import pytest
+
+from stageflow.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestLRUCache:
+    """Test LRU ordering, TTL expiry and counters."""
+
+    def test_get_counts_hits_and_misses(self):
+        """Verify lookups update hit and miss counters."""
+        # Arrange
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.put("a", 1)
+
+        # Act
+        hit = cache.get("a")
+        miss = cache.get("b")
+
+        # Assert
+        assert hit == 1
+        assert miss is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Verify the least recently used entry is dropped when full."""
+        # Arrange
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+
+        # Act
+        cache.put("c", 3)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats.evictions == 1
+        assert cache.stats.size == 2
+
+    def test_entries_expire_after_ttl(self):
+        """Verify expired entries are treated as misses."""
+        # Arrange
+        clock = FakeClock()
+        cache: LRUCache[str, int] = LRUCache(max_size=2, ttl=10, clock=clock)
+        cache.put("a", 1)
+
+        # Act
+        clock.now = 10.0
+        value = cache.get("a")
+
+        # Assert
+        assert value is None
+        assert cache.stats.expirations == 1
+        assert cache.stats.misses == 1
+        assert len(cache) == 0
+
+    def test_invalidate_and_clear(self):
+        """Verify entries can be dropped individually or all at once."""
+        # Arrange
+        cache: LRUCache[str, int] = LRUCache()
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # Act & Assert
+        assert cache.invalidate("a") is True
+        assert cache.invalidate("a") is False
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_peek_leaves_order_and_counters(self):
+        """Verify peek reads an entry without counting it or refreshing it."""
+        # Arrange
+        cache: LRUCache[str, int] = LRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # Act
+        value = cache.peek("a")
+        missing = cache.peek("z")
+        cache.put("c", 3)
+
+        # Assert
+        assert value == 1
+        assert missing is None
+        assert "a" not in cache
+        assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+    @pytest.mark.parametrize("kwargs", [{"max_size": 0}, {"ttl": 0}])
+    def test_invalid_configuration_raises(self, kwargs):
+        """Verify non-positive sizes and TTLs are rejected."""
+        # Arrange & Act & Assert
+        with pytest.raises(ValueError):
+            LRUCache(**kwargs)